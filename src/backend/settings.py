@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third party apps
     'storages',     # For S3
     'rest_framework',
@@ -96,6 +97,55 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Revoking a token must reach every worker, so this needs a shared backend;
+    # set REDIS_URL (requires the redis package) in any multi-worker deployment
+    'auth_tokens': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env_utils.REDIS_URL,
+        'KEY_PREFIX': 'auth-tokens',
+    } if env_utils.REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'auth-tokens',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+}
+
+# Fuzzy skill search
+SKILL_SEARCH_TIMEOUT_MS = 200  # Ranked search falls back to prefix matches past this
+SKILL_SEARCH_MIN_SIMILARITY = 0.3  # pg_trgm word similarity threshold
+
+# Skill canonicalization
+SKILL_CANONICAL_REBUILD_SECONDS = 15 * 60  # Picks up skills and aliases added by other processes
+SKILL_EXTRACTION_MAX_TEXTS = 100  # Texts per extraction or gap request
+SKILL_EXTRACTION_MAX_TEXT_LENGTH = 100_000
+
+# Skill catalog
+SKILL_PAGE_MAX_SIZE = 500  # Max page size of /skills/all
+SKILL_CATALOG_CACHE_ALIAS = 'default'  # Holds the gzipped catalog, keyed by skill count and latest update
+SKILL_CATALOG_CACHE_SECONDS = 24 * 60 * 60  # Lets versions superseded by skill changes expire
+
+# In-memory typeahead for skills, schools and companies
+TYPEAHEAD_MAX_RESULTS = 10
+TYPEAHEAD_PRECOMPUTED_PREFIX_LENGTH = 2  # Prefixes up to this length answer from precomputed top lists
+TYPEAHEAD_REBUILD_SECONDS = 15 * 60  # Picks up writes made by other processes
+
+# Assembled profile reads
+PROFILE_CACHE_ALIAS = 'default'
+# Served without touching the database. Writes drop entries through the cache
+# they were made on, so with a process-local cache this is how long other
+# workers may serve the previous version.
+PROFILE_CACHE_SECONDS = 30
+
+
 # AWS S3 Settings
 AWS_ACCESS_KEY_ID = env_utils.AWS_ACCESS_KEY_ID
 AWS_SECRET_ACCESS_KEY = env_utils.AWS_SECRET_ACCESS_KEY
@@ -105,6 +155,21 @@ AWS_S3_FILE_OVERWRITE = False
 AWS_DEFAULT_ACL = 'private'
 AWS_S3_SIGNATURE_VERSION = 's3v4'
 AWS_S3_VERIFY = True
+AWS_S3_ENDPOINT_URL = env_utils.AWS_S3_ENDPOINT_URL  # Optional S3-compatible endpoint, e.g. a local MinIO
+AWS_S3_MAX_POOL_CONNECTIONS = 50  # Connections of the shared S3 client, and threads blocking storage calls run on
+
+# Resume uploads are buffered in memory for the view to put in S3; other uploads use Django's default handlers
+FILE_UPLOAD_HANDLERS = [
+    'profiles.utils.storage.s3_upload_handler.ResumeUploadHandler',
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+# Presigned URLs let clients move resume bytes to and from S3 directly
+RESUME_UPLOAD_URL_EXPIRY = 15 * 60  # Seconds a presigned upload URL and its token stay valid
+RESUME_DOWNLOAD_URL_EXPIRY = 5 * 60
+# Resume files are cached on local disk, shared by the worker processes; empty disables it
+RESUME_CACHE_DIR = env_utils.RESUME_CACHE_DIR if env_utils.RESUME_CACHE_DIR is not None else BASE_DIR / 'cache' / 'resumes'
+RESUME_CACHE_MAX_BYTES = 512 * 1024 * 1024
 
 STORAGES = {
     'default': {
@@ -170,12 +235,27 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Auth0 Settings
 AUTH0_DOMAIN = env_utils.AUTH0_DOMAIN
 AUTH0_AUDIENCE = env_utils.AUTH0_AUDIENCE
+AUTH0_JWKS_FILE = env_utils.AUTH0_JWKS_FILE  # Optional local copy of the tenant's JWKS
+AUTH0_JWKS_TIMEOUT = 5
+AUTH0_JWKS_REFRESH_SECONDS = 6 * 60 * 60  # Background refresh of the key ring
+AUTH0_JWKS_MIN_REFRESH_SECONDS = 5 * 60  # Min gap between refetches for unknown kids
+AUTH0_USER_CACHE_SIZE = 1024  # Auth0 sub -> user LRU
+AUTH0_USER_CACHE_SECONDS = 5 * 60
 
 # Authentication settings
 AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
 ]
 
+# Token -> (user id, is_staff, is_superuser) cache used by the API's token auth.
+# Entries are dropped when a token is revoked or its user changes. That only
+# reaches other workers through a shared backend; on a process-local one,
+# entries live TOKEN_AUTH_LOCAL_CACHE_SECONDS, which bounds how long a revoked
+# token or deactivated user keeps authenticating on other workers.
+TOKEN_AUTH_CACHE_ALIAS = 'auth_tokens'
+TOKEN_AUTH_CACHE_SECONDS = 5 * 60
+TOKEN_AUTH_LOCAL_CACHE_SECONDS = 5
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.TokenAuthentication',
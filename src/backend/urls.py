@@ -26,6 +26,8 @@ from profiles.api.endpoints.work_experience import router as work_experience_rou
 from profiles.api.endpoints.skill import router as skill_router
 from profiles.api.endpoints.social_link import router as social_link_router
 from profiles.api.endpoints.equal_employment import router as equal_employment_router
+from profiles.api.authentication import AsyncTokenAuth, AsyncSessionAuth
+from profiles.api.auth0 import Auth0JWTAuth
 from profiles.utils.logger.logging_config import logger
 
 api = NinjaAPI(
@@ -38,6 +40,7 @@ api = NinjaAPI(
     urls_namespace='api',
     docs_url='/docs/' if settings.DEBUG else None,
     openapi_url='/openapi.json' if settings.DEBUG else None,
+    auth=[Auth0JWTAuth(), AsyncTokenAuth(), AsyncSessionAuth(csrf=False)],
 )
 
 # Add routers with versioned paths
@@ -21,6 +21,13 @@ AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
 AWS_STORAGE_BUCKET_NAME = os.getenv('AWS_STORAGE_BUCKET_NAME')
 AWS_S3_REGION_NAME = os.getenv('AWS_S3_REGION_NAME')
+AWS_S3_ENDPOINT_URL = os.getenv('AWS_S3_ENDPOINT_URL')
+
+# Resume disk cache directory; set it empty to disable the cache
+RESUME_CACHE_DIR = os.getenv('RESUME_CACHE_DIR')
+
+# Shared cache (e.g. redis://localhost:6379/0); without it caches are per process
+REDIS_URL = os.getenv('REDIS_URL')
 
 # Django settings
 DJANGO_SECRET_KEY = os.getenv('DJANGO_SECRET_KEY')
@@ -29,3 +36,4 @@ DJANGO_DEBUG = os.getenv('DJANGO_DEBUG', 'True').lower() == 'true'
 # Auth0 Settings
 AUTH0_DOMAIN = os.getenv('AUTH0_DOMAIN')
 AUTH0_AUDIENCE = os.getenv('AUTH0_AUDIENCE')
+AUTH0_JWKS_FILE = os.getenv('AUTH0_JWKS_FILE')
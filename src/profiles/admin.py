@@ -6,7 +6,14 @@ from profiles.models import (
     EqualEmploymentData,
     SocialLink,
     Skill,
+    SkillAlias,
+    SkillCooccurrence,
     Resume,
+    PendingS3Deletion,
+    ResumeChunk,
+    ResumeRevision,
+    ProfileSnapshot,
+    ProfileChange,
 )   
 
 # Register your models
@@ -16,4 +23,11 @@ admin.site.register(WorkExperience)
 admin.site.register(EqualEmploymentData)
 admin.site.register(SocialLink)
 admin.site.register(Skill)
+admin.site.register(SkillAlias)
+admin.site.register(SkillCooccurrence)
 admin.site.register(Resume)
+admin.site.register(PendingS3Deletion)
+admin.site.register(ResumeChunk)
+admin.site.register(ResumeRevision)
+admin.site.register(ProfileSnapshot)
+admin.site.register(ProfileChange)
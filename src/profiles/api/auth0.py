@@ -0,0 +1,193 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from jose import jwk, jwt
+from jose.exceptions import JOSEError
+from ninja.security import HttpBearer
+from profiles.models import CustomUser
+from profiles.api.authentication import build_user_principal
+from profiles.utils.logger.logging_config import logger
+
+ALGORITHMS = ['RS256']
+
+
+class JWKSKeyRing:
+    """
+    Auth0 signing keys, parsed once and looked up by kid.
+    Keys are loaded from AUTH0_JWKS_FILE when set, otherwise fetched from the
+    tenant's JWKS endpoint. Old or unknown-kid rings are refreshed in a
+    background thread, so verifying a token never waits on the network once
+    the ring is loaded.
+    """
+
+    def __init__(self):
+        self._keys = {}
+        self._loaded_at = None
+        self._last_attempt = 0.0
+        self._load_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def _fetch(self) -> dict:
+        if settings.AUTH0_JWKS_FILE:
+            with open(settings.AUTH0_JWKS_FILE) as f:
+                return json.load(f)
+        response = httpx.get(
+            f"https://{settings.AUTH0_DOMAIN}/.well-known/jwks.json",
+            timeout=settings.AUTH0_JWKS_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def ensure_loaded(self) -> None:
+        """Load the ring on first use, retrying a failed load at most every AUTH0_JWKS_MIN_REFRESH_SECONDS"""
+        with self._load_lock:
+            if self.is_loaded or time.time() - self._last_attempt < settings.AUTH0_JWKS_MIN_REFRESH_SECONDS:
+                return
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Load the key set and swap it in; keeps the current keys on failure"""
+        self._last_attempt = time.time()
+        try:
+            keys = {
+                key_data['kid']: jwk.construct(key_data, algorithm=key_data.get('alg', ALGORITHMS[0]))
+                for key_data in self._fetch().get('keys', [])
+                if key_data.get('use', 'sig') == 'sig' and 'kid' in key_data
+            }
+        except Exception as e:
+            logger.error(f"Error loading Auth0 JWKS: {str(e)}")
+            return
+        self._keys = keys
+        self._loaded_at = time.time()
+        logger.info(f"Loaded {len(keys)} Auth0 signing keys")
+
+    def _refresh_in_background(self) -> None:
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="auth0-jwks-refresh", daemon=True).start()
+
+    def get_key(self, kid: str):
+        """Look up a signing key, scheduling a refresh if the ring is old or lacks the kid"""
+        now = time.time()
+        key = self._keys.get(kid)
+        if key is None:
+            # Keys may have rotated; refetch, but don't let bad tokens hammer the endpoint
+            if now - self._last_attempt >= settings.AUTH0_JWKS_MIN_REFRESH_SECONDS:
+                self._refresh_in_background()
+        elif now - self._loaded_at >= settings.AUTH0_JWKS_REFRESH_SECONDS:
+            self._refresh_in_background()
+        return key
+
+
+class Auth0UserCache:
+    """Small LRU mapping Auth0 subjects to (user id, is_staff, is_superuser), with a TTL"""
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sub: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(sub)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[sub]
+                return None
+            self._entries.move_to_end(sub)
+            return value
+
+    def set(self, sub: str, value: tuple) -> None:
+        with self._lock:
+            self._entries[sub] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(sub)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, sub: str) -> None:
+        with self._lock:
+            self._entries.pop(sub, None)
+
+
+key_ring = JWKSKeyRing()
+user_cache = Auth0UserCache(settings.AUTH0_USER_CACHE_SIZE, settings.AUTH0_USER_CACHE_SECONDS)
+
+
+def verify_auth0_token(token: str) -> Optional[dict]:
+    """Verify an Auth0 access token against the cached key ring and return its claims"""
+    try:
+        key = key_ring.get_key(jwt.get_unverified_header(token).get('kid'))
+        if key is None:
+            return None
+        return jwt.decode(
+            token,
+            key,
+            algorithms=ALGORITHMS,
+            audience=settings.AUTH0_AUDIENCE,
+            issuer=f"https://{settings.AUTH0_DOMAIN}/"
+        )
+    except JOSEError as e:
+        logger.debug(f"Rejected Auth0 token: {str(e)}")
+        return None
+
+
+async def get_auth0_principal(sub: str) -> Optional[CustomUser]:
+    """Resolve an Auth0 subject to its user, answering from the LRU when possible"""
+    cached = user_cache.get(sub)
+    if cached is None:
+        row = await CustomUser.objects.filter(
+            auth0_id=sub,
+            is_active=True
+        ).values_list('id', 'is_staff', 'is_superuser').afirst()
+        if row is None:
+            return None
+        cached = tuple(row)
+        user_cache.set(sub, cached)
+
+    return build_user_principal(*cached)
+
+
+class Auth0JWTAuth(HttpBearer):
+    """Bearer authentication with Auth0 access tokens, verified locally"""
+
+    async def authenticate(self, request, token):
+        # Only JWTs are ours; anything else is left to the next auth class
+        if not settings.AUTH0_DOMAIN or token.count('.') != 2:
+            return None
+
+        if not key_ring.is_loaded:
+            # First request in this process: load the ring once
+            await sync_to_async(key_ring.ensure_loaded)()
+
+        claims = verify_auth0_token(token)
+        if claims is None or not claims.get('sub'):
+            return None
+
+        user = await get_auth0_principal(claims['sub'])
+        if user is None:
+            logger.warning(f"No active user for Auth0 subject {claims['sub']}")
+            return None
+        request.user = user
+        return user
@@ -0,0 +1,93 @@
+import hashlib
+from typing import Iterable, Optional
+from django.conf import settings
+from django.core.cache import caches
+from ninja.security import APIKeyCookie, HttpBearer
+from rest_framework.authtoken.models import Token
+from profiles.models import CustomUser
+from profiles.utils.cache import is_shared_cache
+from profiles.utils.logger.logging_config import logger
+
+
+def get_token_cache():
+    return caches[settings.TOKEN_AUTH_CACHE_ALIAS]
+
+
+def token_cache_timeout(cache) -> int:
+    """
+    How long a token stays cached. Revocations only clear the local copy of a
+    process-local cache, so there entries expire within seconds instead.
+    """
+    if is_shared_cache(cache):
+        return settings.TOKEN_AUTH_CACHE_SECONDS
+    return min(settings.TOKEN_AUTH_CACHE_SECONDS, settings.TOKEN_AUTH_LOCAL_CACHE_SECONDS)
+
+
+def _token_cache_key(key: str) -> str:
+    """Cache key for a token, hashed so raw tokens never reach the cache"""
+    return f"auth:token:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+def build_user_principal(user_id: int, is_staff: bool, is_superuser: bool) -> CustomUser:
+    """
+    Build a user carrying only the fields authorization needs, without a query.
+    Other fields are deferred and would be loaded on first access.
+    """
+    values = {'id': user_id, 'is_superuser': is_superuser, 'is_staff': is_staff, 'is_active': True}
+    field_names = [
+        field.attname for field in CustomUser._meta.concrete_fields
+        if field.attname in values
+    ]
+    return CustomUser.from_db('default', field_names, [values[name] for name in field_names])
+
+
+async def get_token_principal(key: str) -> Optional[CustomUser]:
+    """Resolve a token to its user, answering from the token cache when possible"""
+    cache = get_token_cache()
+    cache_key = _token_cache_key(key)
+
+    cached = cache.get(cache_key)
+    if cached is None:
+        row = await Token.objects.filter(
+            key=key,
+            user__is_active=True
+        ).values_list('user_id', 'user__is_staff', 'user__is_superuser').afirst()
+        if row is None:
+            return None
+        cached = tuple(row)
+        cache.set(cache_key, cached, timeout=token_cache_timeout(cache))
+
+    return build_user_principal(*cached)
+
+
+def invalidate_cached_tokens(keys: Iterable[str]) -> None:
+    """Drop tokens from the token cache, e.g. when revoked or their user changes"""
+    cache_keys = [_token_cache_key(key) for key in keys]
+    if cache_keys:
+        get_token_cache().delete_many(cache_keys)
+        logger.debug(f"Invalidated {len(cache_keys)} cached tokens")
+
+
+class AsyncTokenAuth(HttpBearer):
+    """Bearer authentication against REST framework tokens, without a thread hop"""
+
+    async def authenticate(self, request, token):
+        user = await get_token_principal(token)
+        if user is None:
+            return None
+        # Endpoints reading request.user directly see the token's user
+        request.user = user
+        return user
+
+
+class AsyncSessionAuth(APIKeyCookie):
+    """Django session authentication resolved with request.auser()"""
+    param_name: str = settings.SESSION_COOKIE_NAME
+
+    async def authenticate(self, request, key):
+        if not key:
+            return None
+        user = await request.auser()
+        if user.is_authenticated:
+            return user
+        return None
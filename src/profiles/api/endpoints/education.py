@@ -1,7 +1,6 @@
 from typing import Dict, List
 from ninja import Router
 from django.core.exceptions import ValidationError
-from django.shortcuts import get_object_or_404
 from profiles.api.schemas.education import (
     EducationCreate,
     EducationUpdate,
@@ -15,12 +14,13 @@ from profiles.api.helpers.education import (
 )
 from profiles.models import Education
 from profiles.utils.logger.logging_config import logger
-from profiles.api.helpers.auth import get_profile_with_auth_check
-from asgiref.sync import sync_to_async
+from profiles.api.helpers.auth import get_profile_with_auth_check, get_owned_object_or_404
+from profiles.api.helpers.etag import profile_etag
 
 router = Router(tags=["education"])
 
 @router.get("/{profile_id}/education", response=List[EducationResponse])
+@profile_etag
 async def list_education(request, profile_id: int):
     """List all education entries for a profile"""
     logger.info(f"Fetching education entries for profile: {profile_id}")
@@ -34,16 +34,20 @@ async def list_education(request, profile_id: int):
         raise
 
 @router.get("/{profile_id}/education/{education_id}", response=EducationResponse)
+@profile_etag
 async def get_education(request, profile_id: int, education_id: int):
     """Get a specific education entry"""
     logger.info(f"Fetching education entry {education_id} for profile: {profile_id}")
     
     try:
-        await get_profile_with_auth_check(request, profile_id, "view education for")
-        
-        # Get education entry asynchronously
-        get_education = sync_to_async(get_object_or_404)
-        education = await get_education(Education, id=education_id, user_profile_id=profile_id)
+        # Check access and fetch the entry in one query
+        education = await get_owned_object_or_404(
+            request,
+            Education.objects.all(),
+            profile_id,
+            "view education for",
+            id=education_id
+        )
         
         return EducationResponse.from_orm(education)
     except Exception as e:
@@ -22,6 +22,7 @@ from profiles.api.helpers.equal_employment import (
     get_completion_status
 )
 from profiles.api.helpers.auth import get_profile_with_auth_check
+from profiles.api.helpers.etag import profile_etag
 from profiles.utils.logger.logging_config import logger
 
 router = Router(tags=["equal-employment"])
@@ -121,6 +122,7 @@ async def update_veteran(request, profile_id: int, data: YesNoDeclineValue):
 
 # Utility Endpoints
 @router.get("/{profile_id}/equal-employment/summary", response=EqualEmploymentSummary)
+@profile_etag
 async def get_eeo_summary(request, profile_id: int):
     """Get all EEO data"""
     try:
@@ -131,6 +133,7 @@ async def get_eeo_summary(request, profile_id: int):
         raise
 
 @router.get("/{profile_id}/equal-employment/completion", response=CompletionStatus)
+@profile_etag
 async def get_eeo_completion(request, profile_id: int):
     """Get completion status of EEO data"""
     try:
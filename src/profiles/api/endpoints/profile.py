@@ -1,14 +1,21 @@
+from typing import Optional
 from ninja import Router
 from django.core.exceptions import ValidationError
 from profiles.models import UserProfile
 from profiles.api.schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse
+from profiles.api.schemas.bundle import ProfileBundleResponse
+from profiles.api.schemas.changes import ProfileChangesResponse
 from profiles.utils.logger.logging_config import logger
 from asgiref.sync import sync_to_async
 from profiles.api.helpers.auth import get_profile_with_auth_check
+from profiles.api.helpers.etag import profile_etag
+from profiles.api.helpers.profile_cache import get_cached_profile_bundle, get_cached_profile_version
+from profiles.api.helpers.changes import get_profile_changes
 
 router = Router(tags=["profiles"])
 
 @router.get("/me", response=ProfileResponse)
+@profile_etag
 async def get_my_profile(request):
     """Get the profile of the currently logged in user"""
     try:
@@ -22,6 +29,7 @@ async def get_my_profile(request):
         raise ValidationError("Failed to get user profile")
 
 @router.get("/{profile_id}", response=ProfileResponse)
+@profile_etag
 async def get_profile(request, profile_id: int):
     """Get a profile by ID"""
     logger.info(f"Fetching profile: {profile_id}")
@@ -32,6 +40,34 @@ async def get_profile(request, profile_id: int):
         logger.error(f"Error fetching profile: {str(e)}")
         raise
 
+@router.get("/{profile_id}/bundle", response=ProfileBundleResponse)
+@profile_etag(get_version=get_cached_profile_version)
+async def get_profile_bundle(request, profile_id: int):
+    """Get everything needed to autofill a form for a profile in one response"""
+    logger.info(f"Fetching profile bundle: {profile_id}")
+    try:
+        # Served from the profile cache, falling back to a single primary-key
+        # lookup of the profile joined with its pre-serialized snapshot
+        return await get_cached_profile_bundle(request, profile_id)
+    except Exception as e:
+        logger.error(f"Error fetching profile bundle: {str(e)}")
+        raise
+
+@router.get("/{profile_id}/changes", response=ProfileChangesResponse)
+async def get_profile_changes_since(request, profile_id: int, since: Optional[int] = None):
+    """
+    Get the rows of a profile changed after the given cursor.
+    Without a cursor only the current cursor is returned, so clients should
+    fetch the bundle first and sync from the cursor returned here.
+    """
+    logger.info(f"Fetching changes for profile {profile_id} since {since}")
+    try:
+        await get_profile_with_auth_check(request, profile_id, "view")
+        return await get_profile_changes(profile_id, since)
+    except Exception as e:
+        logger.error(f"Error fetching profile changes: {str(e)}")
+        raise
+
 @router.post("", response=ProfileResponse)
 async def create_profile(request, data: ProfileCreate):
     """Create or update profile for authenticated user"""
@@ -1,22 +1,32 @@
 from typing import Dict, List
 from ninja import Router, File, Form, UploadedFile
 from django.core.exceptions import ValidationError
-from django.http import Http404, FileResponse
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from profiles.api.helpers.resume import (
     validate_resume_file,
     create_or_update_resume,
     delete_resume_and_update_default,
     set_resume_as_default,
-    get_profile_default_resume
+    get_profile_default_resume,
+    discard_rejected_upload,
+    create_resume_upload_url,
+    confirm_resume_upload,
+    get_resume_file_url
+)
+from profiles.models import Resume, ResumeRevision
+from profiles.api.schemas.resume import (
+    ResumeCreate,
+    ResumeResponse,
+    ResumeUploadUrlRequest,
+    ResumeUploadUrlResponse,
+    ResumeUploadConfirm,
+    ResumeFileUrl,
+    ResumeRevisionResponse
 )
-from profiles.models import Resume
-from profiles.api.schemas.resume import ResumeCreate, ResumeResponse
 from profiles.utils.logger.logging_config import logger
-from asgiref.sync import sync_to_async
-from profiles.api.helpers.auth import get_profile_with_auth_check
-from profiles.utils.storage.resume_storage import ResumeStorage
-import mimetypes
+from profiles.api.helpers.auth import get_profile_with_auth_check, get_owned_object_or_404
+from profiles.api.helpers.etag import profile_etag
+from profiles.api.helpers.file_response import resume_file_response, revision_file_response
 
 router = Router(tags=["resumes"])
 
@@ -27,7 +37,11 @@ async def upload_resume(
     title: str = Form(...),
     file: UploadedFile = File(...)
 ):
-    """Upload or update a new resume"""
+    """
+    Upload or update a new resume.
+    The file is buffered and hashed while the request is parsed, then stored
+    in S3 only once accepted and changed.
+    """
     logger.info(f"Starting resume upload for file: {file.name}")
     
     try:
@@ -45,13 +59,56 @@ async def upload_resume(
         
     except ValidationError as e:
         logger.warning(f"Validation error: {str(e)}")
+        await discard_rejected_upload(file)
         raise
     except Exception as e:
         logger.error(f"Upload error: {str(e)}")
+        await discard_rejected_upload(file)
+        raise
+
+
+@router.post("/{profile_id}/resumes/upload-url", response=ResumeUploadUrlResponse)
+async def request_resume_upload_url(request, profile_id: int, data: ResumeUploadUrlRequest):
+    """
+    Get a short-lived presigned URL to PUT a resume file to S3 directly.
+    Send the returned headers with the upload, then confirm it with the token.
+    """
+    try:
+        profile = await get_profile_with_auth_check(request, profile_id, "upload resume")
+        return await create_resume_upload_url(profile, data.title, data.file_name, data.size)
+    except Exception as e:
+        logger.error(f"Error creating resume upload URL: {str(e)}")
+        raise
+
+
+@router.post("/{profile_id}/resumes/confirm", response=ResumeResponse)
+async def confirm_resume(request, profile_id: int, data: ResumeUploadConfirm):
+    """
+    Finalize a resume uploaded through a presigned URL.
+    The file is checked from its S3 metadata and first bytes, and removed if rejected.
+    """
+    file = None
+    try:
+        profile = await get_profile_with_auth_check(request, profile_id, "upload resume")
+        title, file = await confirm_resume_upload(profile, data.upload_token)
+
+        await validate_resume_file(file)
+        resume = await create_or_update_resume(profile, title, file)
+        logger.info(f"Successfully confirmed resume upload: {resume.id}")
+        return ResumeResponse.from_orm(resume)
+
+    except ValidationError as e:
+        logger.warning(f"Validation error: {str(e)}")
+        await discard_rejected_upload(file)
+        raise
+    except Exception as e:
+        logger.error(f"Upload confirmation error: {str(e)}")
+        await discard_rejected_upload(file)
         raise
 
 
 @router.get("/{profile_id}/resumes", response=List[ResumeResponse])
+@profile_etag
 async def list_resumes(request, profile_id: int):
     """List all resumes for a profile"""
     logger.info(f"Fetching resumes for profile: {profile_id}")
@@ -59,11 +116,9 @@ async def list_resumes(request, profile_id: int):
     try:
         profile = await get_profile_with_auth_check(request, profile_id, "view resumes")
         
-        # Get resumes asynchronously
-        get_resumes = sync_to_async(lambda: list(
-            Resume.objects.filter(user_profile=profile).order_by('-updated_at')
-        ))
-        resumes = await get_resumes()
+        resumes = [
+            resume async for resume in Resume.objects.filter(user_profile=profile).order_by('-updated_at')
+        ]
         
         return [ResumeResponse.from_orm(resume) for resume in resumes]
     except Exception as e:
@@ -72,6 +127,7 @@ async def list_resumes(request, profile_id: int):
 
 
 @router.get("/{profile_id}/resumes/default", response=ResumeResponse)
+@profile_etag
 async def get_default_resume(request, profile_id: int):
     """Get the default resume"""
     try:
@@ -88,17 +144,20 @@ async def get_default_resume(request, profile_id: int):
 
 
 @router.get("/{profile_id}/resumes/{resume_id}", response=ResumeResponse)
+@profile_etag
 async def get_resume(request, profile_id: int, resume_id: int):
     """Get specific resume details"""
     logger.info(f"Fetching resume {resume_id} for profile: {profile_id}")
     
     try:
-        profile = await get_profile_with_auth_check(request, profile_id, "view resumes")
-        
-        # Get resume asynchronously
-        get_resume = sync_to_async(get_object_or_404)
-        resume = await get_resume(Resume, id=resume_id, user_profile_id=profile_id)
-        
+        # Check access and fetch the resume in one query
+        resume = await get_owned_object_or_404(
+            request,
+            Resume.objects.all(),
+            profile_id,
+            "view resumes",
+            id=resume_id
+        )
 
         return ResumeResponse.from_orm(resume)
     except Exception as e:
@@ -137,45 +196,89 @@ async def set_default_resume(request, profile_id: int, resume_id: int):
         raise
 
 
+@router.get("/{profile_id}/resumes/{resume_id}/url", response=ResumeFileUrl)
+async def get_resume_url(request, profile_id: int, resume_id: int, inline: bool = False):
+    """Get a short-lived presigned URL to download a resume, or preview it with inline=true"""
+    try:
+        resume = await get_owned_object_or_404(
+            request,
+            Resume.objects.all(),
+            profile_id,
+            "download resumes",
+            id=resume_id
+        )
+
+        if not resume.file:
+            raise ValidationError("Resume file not found")
+
+        return get_resume_file_url(resume, inline)
+    except Exception as e:
+        logger.error(f"Error creating resume URL: {str(e)}")
+        raise
+
+
+@router.get("/{profile_id}/resumes/{resume_id}/revisions", response=List[ResumeRevisionResponse])
+@profile_etag
+async def list_resume_revisions(request, profile_id: int, resume_id: int):
+    """List the stored revisions of a resume, newest first"""
+    try:
+        resume = await get_owned_object_or_404(
+            request,
+            Resume.objects.all(),
+            profile_id,
+            "view resumes",
+            id=resume_id
+        )
+
+        return [revision async for revision in ResumeRevision.objects.filter(resume=resume).order_by('-number')]
+    except Exception as e:
+        logger.error(f"Error fetching resume revisions: {str(e)}")
+        raise
+
+
+@router.get("/{profile_id}/resumes/{resume_id}/revisions/{number}/download")
+async def download_resume_revision(request, profile_id: int, resume_id: int, number: int):
+    """Download an older revision of a resume"""
+    try:
+        resume = await get_owned_object_or_404(
+            request,
+            Resume.objects.all(),
+            profile_id,
+            "download resumes",
+            id=resume_id
+        )
+
+        revision = await ResumeRevision.objects.filter(resume=resume, number=number).afirst()
+        if revision is None:
+            raise Http404("No revision found for this resume")
+        return revision_file_response(request, revision)
+
+    except Http404:
+        raise ValidationError("Resume revision not found")
+    except Exception as e:
+        logger.error(f"Error downloading resume revision: {str(e)}")
+        raise ValidationError("Failed to download resume revision")
+
+
 @router.get("/{profile_id}/resumes/download/{resume_id}")
 async def download_resume(request, profile_id: int, resume_id: int):
-    """Download a specific resume file"""
+    """Download a specific resume file, or the byte range asked for with Range"""
     try:
-        # Check authentication and access
-        profile = await get_profile_with_auth_check(request, profile_id, "download resumes")
-        
-
-        # Get the resume
-        resume = await sync_to_async(
-            lambda: Resume.objects.select_related('user_profile').get(
-                id=resume_id,
-                user_profile_id=profile_id
-            )
-        )()
+        # Check access and fetch the resume in one query
+        resume = await get_owned_object_or_404(
+            request,
+            Resume.objects.all(),
+            profile_id,
+            "download resumes",
+            id=resume_id
+        )
         
         if not resume.file:
             raise ValidationError("Resume file not found")
         
-        # Get the storage instance
-        storage = ResumeStorage()
-        
-        # Get the file from S3
-        file_obj = await sync_to_async(storage.open)(resume.file.name)
-        
-        # Get content type
-        content_type, _ = mimetypes.guess_type(resume.original_filename)
-        
-        # Create response
-        response = FileResponse(
-            file_obj,
-            content_type=content_type or 'application/octet-stream',
-            as_attachment=True,
-            filename=resume.original_filename
-        )
-        
-        return response
+        return await resume_file_response(request, resume, as_attachment=True)
         
-    except Resume.DoesNotExist:
+    except Http404:
         raise ValidationError("Resume not found")
     except Exception as e:
         logger.error(f"Error downloading resume: {str(e)}")
@@ -184,42 +287,23 @@ async def download_resume(request, profile_id: int, resume_id: int):
 
 @router.get("/{profile_id}/resumes/preview/{resume_id}")
 async def preview_resume(request, profile_id: int, resume_id: int):
-    """Get a preview/thumbnail of a resume"""
+    """Get a preview/thumbnail of a resume; viewers may fetch it in byte ranges"""
     try:
-        # Check authentication and access
-        profile = await get_profile_with_auth_check(request, profile_id, "preview resumes")
-        
-
-        # Get the resume
-        resume = await sync_to_async(
-            lambda: Resume.objects.select_related('user_profile').get(
-                id=resume_id,
-                user_profile_id=profile_id
-            )
-        )()
+        # Check access and fetch the resume in one query
+        resume = await get_owned_object_or_404(
+            request,
+            Resume.objects.all(),
+            profile_id,
+            "preview resumes",
+            id=resume_id
+        )
         
         if not resume.file:
             raise ValidationError("Resume file not found")
         
-        # Get the storage instance
-        storage = ResumeStorage()
-        
-        # Get the file from S3
-        file_obj = await sync_to_async(storage.open)(resume.file.name)
-        
-        # Get content type
-        content_type, _ = mimetypes.guess_type(resume.original_filename)
-        
-        # Create response
-        response = FileResponse(
-            file_obj,
-            content_type=content_type or 'application/octet-stream',
-            as_attachment=False  # This makes it display inline
-        )
-        
-        return response
+        return await resume_file_response(request, resume, as_attachment=False)
         
-    except Resume.DoesNotExist:
+    except Http404:
         raise ValidationError("Resume not found")
     except Exception as e:
         logger.error(f"Error previewing resume: {str(e)}")
@@ -1,11 +1,19 @@
-from typing import List
+from typing import List, Literal, Optional
+from urllib.parse import urlencode
 from ninja import Router
-from django.core.exceptions import ValidationError, PermissionDenied
+from django.conf import settings
+from django.http import HttpResponse
+from django.core.exceptions import ValidationError
 from django.db.models import Case, When, Value, IntegerField
 from profiles.api.schemas.skill import (
     SkillCreate,
     SkillUpdate,
     SkillResponse,
+    SkillRecommendation,
+    SkillExtractionRequest,
+    SkillExtractionResult,
+    SkillGapRequest,
+    SkillGapResult,
     ProfileSkillsUpdate
 )
 from profiles.api.helpers.skill import (
@@ -13,10 +21,18 @@ from profiles.api.helpers.skill import (
     update_skill,
     delete_skill,
     get_skill,
-    get_all_skills,
-    update_profile_skills
+    update_profile_skills,
+    search_skills_ranked,
+    with_canonical_match
 )
-from profiles.api.helpers.auth import check_auth_and_staff, get_profile_with_auth_check
+from profiles.api.helpers.typeahead import get_typeahead_suggestions
+from profiles.api.helpers.skill_cooccurrence import get_skill_recommendations
+from profiles.api.helpers.skill_extraction import extract_skills, get_skill_gaps, validate_extraction_texts
+from profiles.api.helpers.skill_catalog import get_skills_page, get_skill_catalog, skill_catalog_response
+from profiles.api.schemas.typeahead import TypeaheadSuggestion
+
+from profiles.api.helpers.auth import check_auth, check_auth_and_staff, get_profile_with_auth_check
+from profiles.api.helpers.etag import profile_etag
 from asgiref.sync import sync_to_async
 from profiles.utils.logger.logging_config import logger
 from django.db.models import Q
@@ -26,28 +42,58 @@ router = Router(tags=["skills"])
 
 # Global skill management endpoints (must come before parameterized routes)
 @router.get("/skills/all", response=List[SkillResponse])
-async def list_skills(request):
-    """List all available skills"""
+async def list_skills(request, response: HttpResponse, cursor: Optional[str] = None, limit: int = 100):
+    """
+    List available skills ordered by name, one page at a time.
+    When more skills follow, the next page's cursor is returned in the
+    X-Next-Cursor header. Use /skills/catalog to download every skill at once.
+    """
     # Just check authentication
-    if not await sync_to_async(lambda: request.user.is_authenticated)():
-        raise PermissionDenied("Authentication required")
-    return await get_all_skills()
+    await check_auth(request)
+
+    if limit < 1 or limit > settings.SKILL_PAGE_MAX_SIZE:
+        raise ValidationError(f"Limit must be between 1 and {settings.SKILL_PAGE_MAX_SIZE}")
+
+    skills, next_cursor = await get_skills_page(cursor, limit)
+    if next_cursor:
+        response['X-Next-Cursor'] = next_cursor
+        response['Link'] = f'<{request.path}?{urlencode({"cursor": next_cursor, "limit": limit})}>; rel="next"'
+    return skills
+
+@router.get("/skills/catalog")
+async def download_skill_catalog(request):
+    """
+    Download every skill as one precompressed JSON document.
+    The catalog only changes when skills do; revalidate it with If-None-Match.
+    """
+    await check_auth(request)
+
+    try:
+        catalog = await get_skill_catalog()
+        return skill_catalog_response(request, catalog)
+    except Exception as e:
+        logger.error(f"Error getting skill catalog: {str(e)}")
+        raise ValidationError("Failed to get skill catalog")
 
 @router.get("/skills/search", response=List[SkillResponse])
 async def search_skills(
     request,
     query: str,
     limit: int = 10,
-    offset: int = 0
+    offset: int = 0,
+    mode: Literal["contains", "fuzzy"] = "contains"
 ):
     """
     Search for skills based on a query string.
     Returns paginated results of skills that match the query.
     The search is case-insensitive and matches partial names.
+    Matches are ordered by prefix match, then by how many profiles list them.
+    In fuzzy mode, typos are tolerated and results are ranked by prefix
+    match, then similarity, then popularity.
+    The skill the query is a spelling variant or alias of always comes first.
     """
     # Check authentication
-    if not await sync_to_async(lambda: request.user.is_authenticated)():
-        raise PermissionDenied("Authentication required")
+    await check_auth(request)
 
     try:
         # Validate parameters
@@ -56,6 +102,12 @@ async def search_skills(
         if offset < 0:
             raise ValidationError("Offset must be non-negative")
 
+        if mode == "fuzzy":
+            skills = await search_skills_ranked(query, limit, offset)
+            if offset == 0:
+                skills = await with_canonical_match(query, skills, limit)
+            return [SkillResponse.from_orm(skill) for skill in skills]
+
         # Create a case-insensitive query that matches the start of the name
         # or matches anywhere in the name, with proper ordering
         skills = await sync_to_async(lambda: list(
@@ -68,8 +120,10 @@ async def search_skills(
                     default=Value(2),
                     output_field=IntegerField(),
                 )
-            ).order_by('match_priority', 'name')[offset:offset + limit]
+            ).order_by('match_priority', '-usage_count', 'name')[offset:offset + limit]
         ))()
+        if offset == 0:
+            skills = await with_canonical_match(query, skills, limit)
 
         # Convert to list of SkillResponse
         return [
@@ -86,12 +140,33 @@ async def search_skills(
         logger.error(f"Error searching skills: {str(e)}")
         raise ValidationError("An error occurred while searching for skills")
 
+@router.get("/typeahead/{source}", response=List[TypeaheadSuggestion])
+async def typeahead(
+    request,
+    source: Literal["skills", "schools", "companies"],
+    prefix: str,
+    limit: int = 10
+):
+    """
+    Autocomplete skills, schools or companies from an in-memory prefix index.
+    Returns the most used values starting with the prefix, without querying the database.
+    """
+    await check_auth(request)
+
+    if limit < 1 or limit > settings.TYPEAHEAD_MAX_RESULTS:
+        raise ValidationError(f"Limit must be between 1 and {settings.TYPEAHEAD_MAX_RESULTS}")
+
+    try:
+        return await get_typeahead_suggestions(source, prefix, limit)
+    except Exception as e:
+        logger.error(f"Error getting {source} typeahead suggestions: {str(e)}")
+        raise ValidationError("An error occurred while getting suggestions")
+
 @router.post("/skills/new", response=SkillResponse)
 async def create_new_skill(request, data: SkillCreate):
     """Create a new skill"""
     # Just check authentication
-    if not await sync_to_async(lambda: request.user.is_authenticated)():
-        raise PermissionDenied("Authentication required")
+    await check_auth(request)
     
     try:
         return await create_skill(data.name)
@@ -99,12 +174,26 @@ async def create_new_skill(request, data: SkillCreate):
         logger.error(f"Error creating skill: {str(e)}")
         raise ValidationError("Failed to create skill")
 
+@router.post("/skills/extract", response=List[SkillExtractionResult])
+async def extract_skills_from_text(request, data: SkillExtractionRequest):
+    """
+    Find the catalog skills mentioned in each text, such as a resume or job
+    description. Spelling variants and aliases resolve to their canonical skill.
+    """
+    await check_auth(request)
+    validate_extraction_texts(data.texts)
+
+    try:
+        return [{"skills": skills} for skills in await extract_skills(data.texts)]
+    except Exception as e:
+        logger.error(f"Error extracting skills: {str(e)}")
+        raise ValidationError("Failed to extract skills")
+
 @router.get("/skills/{skill_id}", response=SkillResponse)
 async def get_skill_by_id(request, skill_id: int):
     """Get a specific skill"""
     # Just check authentication
-    if not await sync_to_async(lambda: request.user.is_authenticated)():
-        raise PermissionDenied("Authentication required")
+    await check_auth(request)
     
     try:
         return await get_skill(skill_id)
@@ -139,6 +228,7 @@ async def delete_skill_by_id(request, skill_id: int):
 
 # Profile-specific skill management (comes after global skill routes)
 @router.get("/{profile_id}/skills", response=List[SkillResponse])
+@profile_etag
 async def get_profile_skills(request, profile_id: int):
     """Get skills for a specific profile"""
     try:
@@ -148,6 +238,35 @@ async def get_profile_skills(request, profile_id: int):
         logger.error(f"Error getting profile skills: {str(e)}")
         raise ValidationError("Failed to get profile skills")
 
+@router.get("/{profile_id}/skills/recommended", response=List[SkillRecommendation])
+async def get_recommended_skills(request, profile_id: int, limit: int = 10):
+    """
+    Suggest skills that people listing this profile's skills also list,
+    from precomputed co-occurrence counts
+    """
+    if limit < 1 or limit > 50:
+        raise ValidationError("Limit must be between 1 and 50")
+
+    try:
+        await get_profile_with_auth_check(request, profile_id, "view skill recommendations for")
+        return await get_skill_recommendations(profile_id, limit)
+    except Exception as e:
+        logger.error(f"Error getting skill recommendations: {str(e)}")
+        raise ValidationError("Failed to get skill recommendations")
+
+@router.post("/{profile_id}/skills/gap", response=List[SkillGapResult])
+async def get_profile_skill_gaps(request, profile_id: int, data: SkillGapRequest):
+    """For each text (e.g. a job description), the skills it mentions that the profile has and lacks"""
+    # Ownership first, so other users cannot probe the limits
+    await get_profile_with_auth_check(request, profile_id, "compare skills for")
+    validate_extraction_texts(data.texts)
+
+    try:
+        return await get_skill_gaps(profile_id, data.texts, data.include_experience)
+    except Exception as e:
+        logger.error(f"Error getting skill gaps: {str(e)}")
+        raise ValidationError("Failed to get skill gaps")
+
 @router.put("/{profile_id}/skills")
 async def update_profile_skills_endpoint(request, profile_id: int, data: ProfileSkillsUpdate):
     """Update skills for a specific profile"""
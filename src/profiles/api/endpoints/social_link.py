@@ -1,6 +1,5 @@
 from typing import List, Dict
 from ninja import Router
-from django.core.exceptions import ValidationError
 from profiles.api.schemas.social_link import (
     SocialLinkCreate,
     SocialLinkUpdate
@@ -9,10 +8,11 @@ from profiles.api.helpers.social_link import (
     create_social_link,
     update_social_link,
     delete_social_link,
-    get_social_link,
     get_profile_social_links
 )
-from profiles.api.helpers.auth import get_profile_with_auth_check
+from profiles.api.helpers.auth import get_profile_with_auth_check, get_owned_object_or_404
+from profiles.models import SocialLink
+from profiles.api.helpers.etag import profile_etag
 from profiles.utils.logger.logging_config import logger
 
 router = Router(tags=["social-links"])
@@ -26,6 +26,7 @@ def convert_social_link_to_response(social_link) -> dict:
     }
 
 @router.get("/{profile_id}/social-links", response=List[Dict])
+@profile_etag
 async def list_social_links(request, profile_id: int):
     """List all social links for a profile"""
     try:
@@ -40,18 +41,18 @@ async def list_social_links(request, profile_id: int):
         raise
 
 @router.get("/{profile_id}/social-links/{link_id}", response=Dict)
+@profile_etag
 async def get_social_link_by_id(request, profile_id: int, link_id: int):
     """Get a specific social link"""
     try:
-        # Check authentication and access
-        await get_profile_with_auth_check(request, profile_id, "view social links for")
-        
-        # Get social link
-        social_link = await get_social_link(link_id)
-        
-        # Verify link belongs to profile
-        if social_link.user_profile_id != profile_id:
-            raise ValidationError("Social link does not belong to this profile")
+        # Check access and fetch the link in one query
+        social_link = await get_owned_object_or_404(
+            request,
+            SocialLink.objects.all(),
+            profile_id,
+            "view social links for",
+            id=link_id
+        )
         
         return convert_social_link_to_response(social_link)
     except Exception as e:
@@ -81,13 +82,14 @@ async def create_social_link_endpoint(request, profile_id: int, data: SocialLink
 async def update_social_link_endpoint(request, profile_id: int, link_id: int, data: SocialLinkUpdate):
     """Update a social link"""
     try:
-        # Check authentication and access
-        await get_profile_with_auth_check(request, profile_id, "update social links for")
-        
-        # Get existing link to verify ownership
-        existing_link = await get_social_link(link_id)
-        if existing_link.user_profile_id != profile_id:
-            raise ValidationError("Social link does not belong to this profile")
+        # Check access and fetch the link in one query
+        existing_link = await get_owned_object_or_404(
+            request,
+            SocialLink.objects.all(),
+            profile_id,
+            "update social links for",
+            id=link_id
+        )
         
         # Update social link
         social_link = await update_social_link(
@@ -105,13 +107,14 @@ async def update_social_link_endpoint(request, profile_id: int, link_id: int, da
 async def delete_social_link_endpoint(request, profile_id: int, link_id: int):
     """Delete a social link"""
     try:
-        # Check authentication and access
-        await get_profile_with_auth_check(request, profile_id, "delete social links from")
-        
-        # Get existing link to verify ownership
-        existing_link = await get_social_link(link_id)
-        if existing_link.user_profile_id != profile_id:
-            raise ValidationError("Social link does not belong to this profile")
+        # Check access and fetch the link in one query
+        existing_link = await get_owned_object_or_404(
+            request,
+            SocialLink.objects.all(),
+            profile_id,
+            "delete social links from",
+            id=link_id
+        )
         
         # Delete social link
         await delete_social_link(link_id)
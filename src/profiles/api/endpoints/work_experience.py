@@ -1,7 +1,6 @@
 from typing import Dict, List
 from ninja import Router
 from django.core.exceptions import ValidationError
-from django.shortcuts import get_object_or_404
 from profiles.api.schemas.work_experience import (
     WorkExperienceCreate,
     WorkExperienceUpdate,
@@ -15,12 +14,13 @@ from profiles.api.helpers.work_experience import (
 )
 from profiles.models import WorkExperience
 from profiles.utils.logger.logging_config import logger
-from profiles.api.helpers.auth import get_profile_with_auth_check
-from asgiref.sync import sync_to_async
+from profiles.api.helpers.auth import get_profile_with_auth_check, get_owned_object_or_404
+from profiles.api.helpers.etag import profile_etag
 
 router = Router(tags=["work experience"])
 
 @router.get("/{profile_id}/work-experience", response=List[WorkExperienceResponse])
+@profile_etag
 async def list_work_experience(request, profile_id: int):
     """List all work experience entries for a profile"""
     logger.info(f"Fetching work experience entries for profile: {profile_id}")
@@ -34,16 +34,20 @@ async def list_work_experience(request, profile_id: int):
         raise
 
 @router.get("/{profile_id}/work-experience/{work_exp_id}", response=WorkExperienceResponse)
+@profile_etag
 async def get_work_experience(request, profile_id: int, work_exp_id: int):
     """Get a specific work experience entry"""
     logger.info(f"Fetching work experience entry {work_exp_id} for profile: {profile_id}")
     
     try:
-        await get_profile_with_auth_check(request, profile_id, "view work experience for")
-        
-        # Get work experience entry asynchronously
-        get_work_exp = sync_to_async(get_object_or_404)
-        work_exp = await get_work_exp(WorkExperience, id=work_exp_id, user_profile_id=profile_id)
+        # Check access and fetch the entry in one query
+        work_exp = await get_owned_object_or_404(
+            request,
+            WorkExperience.objects.all(),
+            profile_id,
+            "view work experience for",
+            id=work_exp_id
+        )
         
         return WorkExperienceResponse.from_orm(work_exp)
     except Exception as e:
@@ -1,10 +1,45 @@
 from django.core.exceptions import PermissionDenied
-from asgiref.sync import sync_to_async
+from django.http import Http404
 from profiles.models import UserProfile
 from profiles.utils.logger.logging_config import logger
 from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from typing import Optional, Tuple
 
 
+async def resolve_request_user(request):
+    """
+    Get the user set by the API's auth classes, falling back to the session
+    user. Never blocks on a thread hop.
+    """
+    user = getattr(request, 'auth', None)
+    if user is None:
+        user = await request.auser()
+    return user
+
+async def get_request_user(request):
+    """
+    Resolve the request user, requiring authentication.
+    Raises:
+        ValidationError: If user is not authenticated
+    """
+    user = await resolve_request_user(request)
+    if not user.is_authenticated:
+        raise ValidationError("Authentication required")
+    return user
+
+async def check_auth(request):
+    """
+    Check if user is authenticated.
+    Args:
+        request: The HTTP request object
+    Raises:
+        PermissionDenied: If user is not authenticated
+    """
+    user = await resolve_request_user(request)
+    if not user.is_authenticated:
+        raise PermissionDenied("Authentication required")
+
 async def check_auth_and_staff(request):
     """
     Check if user is authenticated and is staff.
@@ -13,46 +48,130 @@ async def check_auth_and_staff(request):
     Raises:
         PermissionDenied: If user is not authenticated or not staff
     """
+    user = await resolve_request_user(request)
+
     # Check authentication
-    is_authenticated = await sync_to_async(lambda: request.user.is_authenticated)()
-    if not is_authenticated:
+    if not user.is_authenticated:
         raise PermissionDenied("Authentication required")
     
     # Check staff status
-    is_staff = await sync_to_async(lambda: request.user.is_staff)()
-    if not is_staff:
-        logger.warning(f"Non-staff access attempt by user {request.user.id}")
+    if not user.is_staff:
+        logger.warning(f"Non-staff access attempt by user {user.id}")
         raise PermissionDenied("Staff access required")
 
-async def get_profile_with_auth_check(request, profile_id: int, action: str = "access") -> UserProfile:
+async def get_profile_with_auth_check(
+    request,
+    profile_id: int,
+    action: str = "access",
+    queryset: QuerySet = None
+) -> UserProfile:
     """
-    Get profile and check if the user has permission to access it.
+    Get profile and check if the user has permission to access it, in one query.
     Args:
         request: The request object containing auth user
         profile_id: The ID of the profile to check
         action: The action being performed (for error message)
+        queryset: Optional UserProfile queryset to load the profile from,
+            e.g. one with related objects prefetched
     Returns:
         UserProfile: The profile if access is allowed
     Raises:
         ValidationError: If profile not found or user doesn't have permission
     """
-    if not request.user.is_authenticated:
-        raise ValidationError("Authentication required")
-        
-    try:
-        profile = await UserProfile.objects.select_related('user').aget(id=profile_id)
-        
-        # Check permissions
-        is_superuser = await sync_to_async(lambda: request.user.is_superuser)()
-        profile_user = await sync_to_async(lambda: profile.user)()
-        
-        if not (is_superuser or profile_user == request.user):
-            logger.warning(
-                f"Unauthorized profile access attempt: user {request.user.id} "
-                f"tried to {action} profile {profile_id}"
-            )
-            raise ValidationError(f"You don't have permission to {action} this profile")
-            
-        return profile
-    except UserProfile.DoesNotExist:
-        raise ValidationError("Profile not found") 
\ No newline at end of file
+    user = await get_request_user(request)
+
+    if queryset is None:
+        queryset = UserProfile.objects.all()
+    profile = await queryset.owned_by(user).select_related('user').filter(id=profile_id).afirst()
+    if profile is None:
+        # Only a failed lookup pays for a second query to tell the two cases apart
+        await raise_profile_access_error(request, profile_id, action)
+        raise ValidationError("Profile not found")
+    return profile
+
+async def get_owned_object_or_404(
+    request,
+    queryset: QuerySet,
+    profile_id: int,
+    action: str = "access",
+    **lookups
+):
+    """
+    Get a row belonging to a profile, checking the user owns the profile in the same query.
+    Args:
+        request: The request object containing auth user
+        queryset: Queryset of a model owned through its user_profile field
+        profile_id: The ID of the profile the row must belong to
+        action: The action being performed (for error message)
+        **lookups: Lookups identifying the row, e.g. id=...
+    Returns:
+        The row if it exists and access is allowed
+    Raises:
+        ValidationError: If profile not found or user doesn't have permission
+        Http404: If the row does not exist on this profile
+    """
+    user = await get_request_user(request)
+
+    obj = await queryset.owned_by(user).filter(user_profile_id=profile_id, **lookups).afirst()
+    if obj is None:
+        await raise_profile_access_error(request, profile_id, action)
+        raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+    return obj
+
+async def raise_profile_access_error(request, profile_id: int, action: str = "access"):
+    """
+    Raise the error explaining why an owner-scoped lookup of a profile came back
+    empty. Returns normally if the profile exists and the user may access it.
+    Raises:
+        ValidationError: If profile not found or user doesn't have permission
+    """
+    owner_id = await UserProfile.objects.filter(id=profile_id).values_list('user_id', flat=True).afirst()
+    if owner_id is None:
+        raise ValidationError("Profile not found")
+    await check_profile_owner(request, profile_id, owner_id, action)
+
+async def get_profile_version_with_auth_check(
+    request,
+    profile_id: Optional[int] = None,
+    action: str = "view"
+) -> Optional[Tuple[int, int]]:
+    """
+    Get a profile's current version with a single indexed lookup, checking access.
+    Args:
+        request: The request object containing auth user
+        profile_id: The ID of the profile, or None for the current user's profile
+        action: The action being performed (for error message)
+    Returns:
+        Tuple of (profile_id, version), or None if the current user has no profile yet
+    Raises:
+        ValidationError: If profile not found or user doesn't have permission
+    """
+    user = await get_request_user(request)
+
+    if profile_id is None:
+        row = await UserProfile.objects.filter(user_id=user.id).values_list('id', 'version').afirst()
+        return row
+
+    row = await UserProfile.objects.filter(id=profile_id).values_list('user_id', 'version').afirst()
+    if row is None:
+        raise ValidationError("Profile not found")
+
+    user_id, version = row
+    await check_profile_owner(request, profile_id, user_id, action)
+    return profile_id, version
+
+async def check_profile_owner(request, profile_id: int, owner_id: int, action: str = "access"):
+    """
+    Check that the request user owns the profile (or is a superuser)
+    without loading the profile.
+    Raises:
+        ValidationError: If user doesn't have permission
+    """
+    user = await get_request_user(request)
+
+    if not (user.is_superuser or owner_id == user.id):
+        logger.warning(
+            f"Unauthorized profile access attempt: user {user.id} "
+            f"tried to {action} profile {profile_id}"
+        )
+        raise ValidationError(f"You don't have permission to {action} this profile")
@@ -0,0 +1,49 @@
+from django.db.models import Prefetch, QuerySet
+from profiles.models import UserProfile, EqualEmploymentData, SocialLink, Resume
+from profiles.utils.logger.logging_config import logger
+
+
+def get_profile_bundle_queryset() -> QuerySet:
+    """
+    Queryset that loads a profile and every related row needed for autofill.
+    The query plan is fixed: one query for the profile, user and EEO data,
+    plus one query per prefetched relation (6 queries in total).
+    """
+    return UserProfile.objects.select_related(
+        'user',
+        'equal_employment_data'
+    ).prefetch_related(
+        'education',
+        'work_experiences',
+        'skills',
+        Prefetch('social_links', queryset=SocialLink.objects.order_by('platform')),
+        Prefetch('resumes', queryset=Resume.objects.order_by('-updated_at')),
+    )
+
+
+def build_profile_bundle(profile: UserProfile) -> dict:
+    """
+    Assemble the autofill bundle from a profile loaded with
+    get_profile_bundle_queryset(). Does not run any queries.
+    """
+    try:
+        eeo_data = profile.equal_employment_data
+    except EqualEmploymentData.DoesNotExist:
+        eeo_data = None
+
+    # Prefer the default resume, falling back to the most recent one
+    resumes = list(profile.resumes.all())
+    default_resume = next((resume for resume in resumes if resume.is_default), None)
+    if default_resume is None and resumes:
+        default_resume = resumes[0]
+
+    logger.debug(f"Built profile bundle for profile {profile.id}")
+    return {
+        "profile": profile,
+        "education": list(profile.education.all()),
+        "work_experience": list(profile.work_experiences.all()),
+        "skills": list(profile.skills.all()),
+        "social_links": list(profile.social_links.all()),
+        "equal_employment": eeo_data,
+        "default_resume": default_resume,
+    }
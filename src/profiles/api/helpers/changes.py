@@ -0,0 +1,147 @@
+from typing import Iterable, Optional
+from django.db import transaction
+from django.db.models import Max
+from asgiref.sync import sync_to_async
+from profiles.models import (
+    UserProfile,
+    Education,
+    WorkExperience,
+    EqualEmploymentData,
+    SocialLink,
+    Skill,
+    Resume,
+    ProfileChange,
+)
+from profiles.api.helpers.etag import bump_profile_versions
+from profiles.api.schemas.profile import ProfileResponse
+from profiles.api.schemas.education import EducationResponse
+from profiles.api.schemas.work_experience import WorkExperienceResponse
+from profiles.api.schemas.skill import SkillResponse
+from profiles.api.schemas.social_link import SocialLinkResponse
+from profiles.api.schemas.equal_employment import EqualEmploymentSummary
+from profiles.api.schemas.resume import ResumeResponse
+from profiles.utils.logger.logging_config import logger
+
+# Model and response schema for each resource in the change log
+CHANGE_RESOURCES = {
+    'profile': (UserProfile, ProfileResponse),
+    'education': (Education, EducationResponse),
+    'work_experience': (WorkExperience, WorkExperienceResponse),
+    'skill': (Skill, SkillResponse),
+    'social_link': (SocialLink, SocialLinkResponse),
+    'equal_employment': (EqualEmploymentData, EqualEmploymentSummary),
+    'resume': (Resume, ResumeResponse),
+}
+
+CHANGE_RESOURCE_BY_MODEL = {model: resource for resource, (model, _) in CHANGE_RESOURCES.items()}
+
+
+def _log_changes(entries: list) -> None:
+    """
+    Write change log entries in the current transaction, numbered with the
+    profile version they bump. The bump holds the profile row lock until
+    commit, so a profile's entries commit in version order and a cursor never
+    skips one committed later.
+    """
+    if not entries:
+        return
+    profile_ids = {profile_id for profile_id, _, _, _ in entries}
+    with transaction.atomic():
+        bump_profile_versions(id__in=profile_ids)
+        versions = dict(UserProfile.objects.filter(id__in=profile_ids).values_list('id', 'version'))
+        ProfileChange.objects.bulk_create([
+            ProfileChange(
+                user_profile_id=profile_id,
+                resource=resource,
+                object_id=object_id,
+                action=action,
+                version=versions[profile_id]
+            )
+            for profile_id, resource, object_id, action in entries
+            if profile_id in versions
+        ])
+
+
+def record_profile_changes(profile_id: int, resource: str, object_ids: Iterable[int], action: str) -> None:
+    """Append entries for several rows to a profile's change log"""
+    _log_changes([(profile_id, resource, object_id, action) for object_id in object_ids])
+
+
+def record_change_for_profiles(profile_ids: Iterable[int], resource: str, object_id: int, action: str) -> None:
+    """Append the same entry to the change log of several profiles"""
+    _log_changes([(profile_id, resource, object_id, action) for profile_id in profile_ids])
+
+
+def update_with_change_log(queryset, profile_id: int, resource: str, **values) -> int:
+    """
+    Bulk-update rows of a profile and log them, since queryset.update() bypasses
+    the model signals that normally feed the change log
+    """
+    object_ids = list(queryset.values_list('id', flat=True))
+    if not object_ids:
+        return 0
+    updated = queryset.model.objects.filter(id__in=object_ids).update(**values)
+    record_profile_changes(profile_id, resource, object_ids, 'upsert')
+    return updated
+
+
+def _load_current_rows(profile_id: int, resource: str, object_ids: Iterable[int]) -> dict:
+    """Load the current rows for upserted objects, keyed by id"""
+    model, _ = CHANGE_RESOURCES[resource]
+    if resource == 'profile':
+        queryset = model.objects.select_related('user').filter(id=profile_id)
+    elif resource == 'skill':
+        queryset = model.objects.filter(userprofile__id=profile_id)
+    else:
+        queryset = model.objects.filter(user_profile_id=profile_id)
+    return queryset.in_bulk(object_ids)
+
+
+@sync_to_async
+def get_profile_changes(profile_id: int, since: Optional[int]) -> dict:
+    """
+    Get the rows changed since a cursor, one entry per row with only its latest state.
+    Without a cursor, returns the current cursor and no changes, so clients can
+    download the full profile once and sync from there.
+    """
+    if since is None:
+        cursor = ProfileChange.objects.filter(user_profile_id=profile_id).aggregate(cursor=Max('version'))['cursor']
+        return {"cursor": cursor or 0, "changes": []}
+
+    # Keep only the latest action per row
+    latest = {}
+    cursor = since
+    for version, resource, object_id, action in ProfileChange.objects.filter(
+        user_profile_id=profile_id,
+        version__gt=since
+    ).order_by('version', 'id').values_list('version', 'resource', 'object_id', 'action'):
+        latest.pop((resource, object_id), None)
+        latest[(resource, object_id)] = action
+        cursor = version
+
+    upserted = {}
+    for (resource, object_id), action in latest.items():
+        if action == 'upsert':
+            upserted.setdefault(resource, []).append(object_id)
+    rows = {
+        resource: _load_current_rows(profile_id, resource, object_ids)
+        for resource, object_ids in upserted.items()
+    }
+
+    changes = []
+    for (resource, object_id), action in latest.items():
+        row = rows.get(resource, {}).get(object_id) if action == 'upsert' else None
+        if row is None:
+            # Deleted, or gone since the upsert was logged
+            changes.append({"resource": resource, "id": object_id, "action": "delete"})
+            continue
+        _, schema = CHANGE_RESOURCES[resource]
+        changes.append({
+            "resource": resource,
+            "id": object_id,
+            "action": "upsert",
+            "data": schema.from_orm(row).model_dump(mode='json'),
+        })
+
+    logger.debug(f"Found {len(changes)} changes for profile {profile_id} since cursor {since}")
+    return {"cursor": cursor, "changes": changes}
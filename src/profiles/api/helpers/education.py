@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from asgiref.sync import sync_to_async
 from profiles.models import Education
+from profiles.api.helpers.changes import update_with_change_log
 from profiles.utils.logger.logging_config import logger
 
 @sync_to_async
@@ -12,7 +13,12 @@ def create_education(profile, data):
         with transaction.atomic():
             # If this is marked as current education, unmark others
             if data.is_current:
-                Education.objects.filter(user_profile=profile, is_current=True).update(is_current=False)
+                update_with_change_log(
+                    Education.objects.filter(user_profile=profile, is_current=True),
+                    profile.id,
+                    'education',
+                    is_current=False
+                )
             
             # Create education entry
             education = Education.objects.create(
@@ -44,10 +50,15 @@ def update_education(profile_id: int, education_id: int, data):
             
             # If setting this as current, unmark others
             if data.is_current:
-                Education.objects.filter(
-                    user_profile_id=profile_id,
-                    is_current=True
-                ).exclude(id=education_id).update(is_current=False)
+                update_with_change_log(
+                    Education.objects.filter(
+                        user_profile_id=profile_id,
+                        is_current=True
+                    ).exclude(id=education_id),
+                    profile_id,
+                    'education',
+                    is_current=False
+                )
             
             # Update fields
             update_dict = data.dict(exclude_unset=True)
@@ -0,0 +1,73 @@
+import inspect
+from functools import partial, wraps
+from django.db.models import F
+from django.http import HttpResponse, HttpResponseNotModified
+from django.http.response import HttpResponseBase
+from django.utils.http import parse_etags
+from profiles.models import UserProfile
+from profiles.api.helpers.auth import get_profile_version_with_auth_check
+from profiles.utils.logger.logging_config import logger
+
+
+def bump_profile_versions(**filters) -> None:
+    """Atomically bump the version of every profile matching the given filters"""
+    UserProfile.objects.filter(**filters).update(version=F('version') + 1)
+
+
+def make_profile_etag(profile_id: int, version: int) -> str:
+    """Strong ETag for any representation of a profile at a given version"""
+    return f'"profile-{profile_id}-v{version}"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag"""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    # If-None-Match uses weak comparison
+    candidates = [candidate.removeprefix('W/') for candidate in parse_etags(header)]
+    return '*' in candidates or etag in candidates
+
+
+def profile_etag(view_func=None, *, get_version=get_profile_version_with_auth_check):
+    """
+    Decorator for profile GET endpoints. Emits a strong ETag derived from the
+    profile version and answers a matching If-None-Match with 304, costing
+    a single indexed lookup and no body.
+    Must be placed below the router decorator.
+    Args:
+        get_version: Async callable (request, profile_id) returning
+            (profile_id, version), e.g. one answering from a cache
+    """
+    if view_func is None:
+        return partial(profile_etag, get_version=get_version)
+
+    @wraps(view_func)
+    async def wrapper(request, response: HttpResponse, **kwargs):
+        profile_version = await get_version(request, kwargs.get('profile_id'))
+        if profile_version is None:
+            # Profile does not exist yet (e.g. first call to /me)
+            return await view_func(request, **kwargs)
+
+        etag = make_profile_etag(*profile_version)
+        if etag_matches(request, etag):
+            logger.debug(f"Profile {profile_version[0]} unchanged at version {profile_version[1]}, returning 304")
+            not_modified = HttpResponseNotModified()
+            not_modified['ETag'] = etag
+            return not_modified
+
+        result = await view_func(request, **kwargs)
+
+        # Views returning their own response bypass the temporal one
+        target = result if isinstance(result, HttpResponseBase) else response
+        target['ETag'] = etag
+        target['Cache-Control'] = 'private, no-cache'
+        return result
+
+    # Ask ninja to pass the temporal response so headers can be set on it
+    signature = inspect.signature(view_func)
+    wrapper.__signature__ = signature.replace(parameters=[
+        *signature.parameters.values(),
+        inspect.Parameter('response', inspect.Parameter.KEYWORD_ONLY, annotation=HttpResponse),
+    ])
+    return wrapper
@@ -0,0 +1,233 @@
+import hashlib
+import mimetypes
+import os
+import re
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional, Tuple
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+from profiles.api.helpers.etag import etag_matches
+from profiles.models.resume_chunk import chunk_s3_key
+from profiles.utils.storage.async_storage import aiter_reads, get_s3_client, run_storage_io
+from profiles.utils.storage.resume_storage import ResumeStorage
+from profiles.utils.logger.logging_config import logger
+
+# A single byte range; multiple ranges are answered with the full file
+BYTE_RANGE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+def parse_range_header(header: Optional[str]) -> Optional[str]:
+    """Normalized "bytes=first-last" range of a Range header, or None if absent or not usable"""
+    match = BYTE_RANGE.match(header or '')
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if first and last and int(last) < int(first):
+        # Syntactically invalid ranges are ignored rather than rejected
+        return None
+    return f"bytes={first}-{last}"
+
+
+def resolve_range(byte_range: str, size: int) -> Optional[Tuple[int, int]]:
+    """First and last byte of a parsed range in a file of the given size, or None if unsatisfiable"""
+    first, last = byte_range.removeprefix('bytes=').split('-')
+    if not first:
+        length = int(last)
+        return (max(size - length, 0), size - 1) if length and size else None
+    start = int(first)
+    if start >= size:
+        return None
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def file_etag(sha256: str, key: str) -> str:
+    """
+    Strong ETag of a stored file: its content digest, or when that is not
+    known its S3 key, which is never reused for different content
+    """
+    return f'"{sha256 or hashlib.sha256(key.encode()).hexdigest()}"'
+
+
+def if_range_date(request, etag: str) -> tuple:
+    """
+    Evaluate If-Range: (whether the Range header may be used, date the file
+    must not have changed since). An entity tag validates only if it is the
+    file's current ETag.
+    """
+    header = request.headers.get('If-Range')
+    if not header:
+        return True, None
+    if header.startswith(('"', 'W/')):
+        # Strong comparison, so weak tags never validate
+        return header == etag, None
+    timestamp = parse_http_date_safe(header)
+    if timestamp is None:
+        return False, None
+    return True, datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def _error_code(error: ClientError) -> str:
+    return error.response.get('Error', {}).get('Code', '')
+
+
+def _not_modified(etag: str) -> HttpResponse:
+    response = HttpResponseNotModified()
+    response['ETag'] = etag
+    return response
+
+
+def _unsatisfiable(size: int) -> HttpResponse:
+    response = HttpResponse(status=416)
+    response['Content-Range'] = f"bytes */{size}"
+    return response
+
+
+async def _local_file_response(path: str, byte_range: Optional[str],
+                               since: Optional[datetime]) -> Optional[HttpResponse]:
+    """
+    Stream a file cached on disk, slicing ranges locally. Returns None if the
+    file is gone, e.g. evicted since it was looked up; once open, eviction
+    no longer affects it.
+    """
+    try:
+        file = await run_storage_io(open, path, 'rb')
+    except OSError as e:
+        logger.warning(f"Cached file {path} could not be opened: {str(e)}")
+        return None
+
+    try:
+        stat = os.fstat(file.fileno())
+        if byte_range and since and stat.st_mtime > since.timestamp():
+            # Changed since the If-Range date: send the whole file instead
+            byte_range = None
+
+        first, last = 0, stat.st_size - 1
+        if byte_range is not None:
+            bounds = resolve_range(byte_range, stat.st_size)
+            if bounds is None:
+                file.close()
+                return _unsatisfiable(stat.st_size)
+            first, last = bounds
+        file.seek(first)
+    except OSError as e:
+        logger.warning(f"Cached file {path} could not be read: {str(e)}")
+        file.close()
+        return None
+
+    length = last - first + 1
+    response = StreamingHttpResponse(
+        aiter_reads(file.read, length, close=file.close),
+        status=200 if byte_range is None else 206
+    )
+    response['Content-Length'] = length
+    if byte_range is not None:
+        response['Content-Range'] = f"bytes {first}-{last}/{stat.st_size}"
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    return response
+
+
+async def _s3_file_response(storage: ResumeStorage, name: str, byte_range: Optional[str],
+                            since: Optional[datetime]) -> HttpResponse:
+    """Stream a file from S3, letting S3 resolve the range"""
+    try:
+        obj = await storage.aget_object(name, byte_range, since)
+    except ClientError as e:
+        code = _error_code(e)
+        if code == 'InvalidRange':
+            size = e.response.get('Error', {}).get('ActualObjectSize')
+            if size is None:
+                size = (await storage.ahead(name))['ContentLength']
+            return _unsatisfiable(size)
+        if code not in ('PreconditionFailed', '412'):
+            raise
+        # Changed since the If-Range date: send the whole file instead
+        logger.debug(f"If-Range date no longer matches {name}, sending the full file")
+        obj = await storage.aget_object(name)
+
+    partial = 'ContentRange' in obj
+    response = StreamingHttpResponse(storage.astream(obj), status=206 if partial else 200)
+    response['Content-Length'] = obj['ContentLength']
+    if obj.get('LastModified'):
+        response['Last-Modified'] = http_date(obj['LastModified'].timestamp())
+    if partial:
+        response['Content-Range'] = obj['ContentRange']
+    return response
+
+
+async def resume_file_response(request, resume, as_attachment: bool) -> HttpResponse:
+    """
+    Serve a resume file, honoring Range and If-Range. Files come from the local
+    disk cache when it is enabled, filled from S3 on a miss; otherwise a
+    satisfiable range is fetched with a ranged GET. Either way a viewer can
+    render the first page or resume a download without the whole file, and
+    the body streams asynchronously without buffering it or holding a thread.
+    """
+    storage = resume.file.storage
+    name = resume.file.name
+
+    etag = file_etag(resume.sha256, name)
+    if etag_matches(request, etag):
+        logger.debug(f"Resume file {name} unchanged, returning 304")
+        return _not_modified(etag)
+
+    byte_range = parse_range_header(request.headers.get('Range'))
+    since = None
+    if byte_range:
+        use_range, since = if_range_date(request, etag)
+        if not use_range:
+            byte_range = None
+
+    try:
+        path = await storage.acached_path(name)
+    except Exception as e:
+        logger.error(f"Error reading {name} through the disk cache: {str(e)}")
+        path = None
+
+    response = None
+    if path is not None:
+        response = await _local_file_response(path, byte_range, since)
+    if response is None:
+        response = await _s3_file_response(storage, name, byte_range, since)
+    if response.status_code == 416:
+        return response
+
+    content_type, _ = mimetypes.guess_type(resume.original_filename)
+    response['Content-Type'] = content_type or 'application/octet-stream'
+    response['Content-Disposition'] = content_disposition_header(as_attachment, resume.original_filename)
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+async def _iter_revision_content(revision) -> AsyncIterator[bytes]:
+    client = get_s3_client()
+    # The whole file until the revision is chunked
+    keys = [revision.s3_key] if revision.s3_key else [chunk_s3_key(digest) for digest in revision.chunks]
+    for key in keys:
+        obj = await run_storage_io(client.get_object, Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+        body = obj['Body']
+        async for part in aiter_reads(body.read, close=body.close):
+            yield part
+
+
+def revision_file_response(request, revision) -> HttpResponse:
+    """Stream a revision of a resume, from its file or reassembled from its chunks in order"""
+    etag = file_etag(revision.sha256, revision.s3_key)
+    if etag_matches(request, etag):
+        return _not_modified(etag)
+
+    content_type, _ = mimetypes.guess_type(revision.original_filename)
+    response = StreamingHttpResponse(
+        _iter_revision_content(revision),
+        content_type=content_type or 'application/octet-stream'
+    )
+    response['Content-Length'] = revision.size
+    response['Content-Disposition'] = content_disposition_header(True, revision.original_filename)
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
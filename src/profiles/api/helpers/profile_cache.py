@@ -0,0 +1,77 @@
+from typing import Iterable, Optional, Tuple
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from profiles.models import UserProfile
+from profiles.api.helpers.auth import (
+    check_profile_owner,
+    get_profile_version_with_auth_check,
+    get_profile_with_auth_check,
+)
+from profiles.api.helpers.snapshot import get_profile_snapshot_data
+
+
+def get_profile_cache():
+    return caches[settings.PROFILE_CACHE_ALIAS]
+
+
+def _entry_key(profile_id: int) -> str:
+    """Key of the cached bundle document of a profile, with its owner and version"""
+    return f"profiles:bundle:{profile_id}"
+
+
+def _store(profile: UserProfile, data: dict) -> None:
+    """
+    Cache a bundle document for PROFILE_CACHE_SECONDS. Invalidation drops it
+    early, but only where the cache is shared with the writer, so the timeout
+    bounds how stale a read can be elsewhere.
+    """
+    entry = {
+        "user_id": profile.user_id,
+        "version": profile.version,
+        "data": data,
+    }
+    get_profile_cache().set(_entry_key(profile.id), entry, timeout=settings.PROFILE_CACHE_SECONDS)
+
+
+async def get_cached_profile_version(request, profile_id: int) -> Optional[Tuple[int, int]]:
+    """
+    Version lookup for the profile_etag decorator that answers from the cache,
+    costing no database work while an entry is cached
+    """
+    entry = get_profile_cache().get(_entry_key(profile_id))
+    if entry is None:
+        return await get_profile_version_with_auth_check(request, profile_id)
+
+    await check_profile_owner(request, profile_id, entry["user_id"], "view")
+    return profile_id, entry["version"]
+
+
+async def get_cached_profile_bundle(request, profile_id: int) -> dict:
+    """
+    Get a profile's bundle document through the cache.
+    Raises:
+        ValidationError: If profile not found or user doesn't have permission
+    """
+    entry = get_profile_cache().get(_entry_key(profile_id))
+    if entry is not None:
+        await check_profile_owner(request, profile_id, entry["user_id"], "view")
+        return entry["data"]
+
+    # Cache miss: load from the database, checking access on the way
+    profile = await get_profile_with_auth_check(
+        request,
+        profile_id,
+        "view",
+        queryset=UserProfile.objects.select_related('snapshot')
+    )
+    data = await get_profile_snapshot_data(profile)
+    _store(profile, data)
+    return data
+
+
+def invalidate_cached_profiles(profile_ids: Iterable[int]) -> None:
+    """Drop cached bundles for the given profiles once the current transaction commits"""
+    keys = [_entry_key(profile_id) for profile_id in profile_ids]
+    if keys:
+        transaction.on_commit(lambda: get_profile_cache().delete_many(keys), robust=True)
@@ -1,15 +1,33 @@
+import hashlib
+import mimetypes
 import os
+from typing import Optional
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core import signing
 from django.shortcuts import get_object_or_404
+from django.utils.http import content_disposition_header
 from ninja.files import UploadedFile
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from profiles.models import Resume
 from profiles.models.resume import MAX_RESUMES_PER_USER
 from profiles.api.schemas.resume import MAX_FILE_SIZE, ALLOWED_EXTENSIONS
+from profiles.api.helpers.changes import update_with_change_log
+from profiles.api.helpers.s3_deletion import enqueue_s3_deletions
+from profiles.api.helpers.resume_revision import record_resume_revision
 from profiles.utils.logger.logging_config import logger
 from asgiref.sync import sync_to_async
 from uuid import uuid4
 from profiles.utils.validators.text import sanitize_text
+from profiles.utils.storage.async_storage import run_storage_io
+from profiles.utils.storage.s3_upload_handler import (
+    EXTENSION_CONTENT_TYPES,
+    S3UploadedFile,
+    sniff_content_type,
+)
+
+UPLOAD_TOKEN_SALT = 'profiles.resume.upload'
 
 
 async def validate_resume_file(file: UploadedFile):
@@ -23,12 +41,32 @@ async def validate_resume_file(file: UploadedFile):
     _, ext = os.path.splitext(file.name.lower())
     if ext not in ALLOWED_EXTENSIONS:
         raise ValidationError('File type not supported. Please upload files with extension .pdf, .doc, .docx or .txt')
+    # Check the content really is what the extension claims
+    if isinstance(file, S3UploadedFile):
+        sniffed = file.sniffed_content_type
+    else:
+        sniffed = sniff_content_type(file.read(2048))
+        file.seek(0)
+    if sniffed != EXTENSION_CONTENT_TYPES[ext]:
+        raise ValidationError(f'File content does not match its {ext} extension')
     logger.info("Resume file validated successfully")
 
-def generate_resume_s3_key(profile, title, file):
+
+async def discard_rejected_upload(file) -> None:
+    """Queue an upload already in S3 for deletion when it was then rejected"""
+    if isinstance(file, S3UploadedFile) and file.s3_key:
+        try:
+            if file.stored:
+                await sync_to_async(enqueue_s3_deletions)([file.s3_key])
+            file.s3_key = None
+            file.content = None
+        except Exception as e:
+            logger.error(f"Error discarding rejected upload {file.s3_key}: {str(e)}")
+
+def generate_resume_s3_key(profile, title, file_name):
     """Generate S3 key for resume"""
-    logger.info(f"Generating S3 key for resume - Profile ID: {profile.id}, Title: {title}, File Name: {file.name}")
-    ext = file.name.split('.')[-1].lower()
+    logger.info(f"Generating S3 key for resume - Profile ID: {profile.id}, Title: {title}, File Name: {file_name}")
+    ext = file_name.split('.')[-1].lower()
     folder = f"user_{profile.id}"
     unique_id = str(uuid4())[:8]
     sanitized_name = f"{sanitize_text(title)}_{unique_id}.{ext}"
@@ -37,57 +75,243 @@ def generate_resume_s3_key(profile, title, file):
     return s3_key
 
 
+def discard_unused_upload(file) -> None:
+    """Drop an upload whose content the resume already has"""
+    if isinstance(file, S3UploadedFile):
+        if file.stored:
+            enqueue_s3_deletions([file.s3_key])
+        file.content = None
+
+
+async def store_upload(file, s3_key: str, content: bytes) -> None:
+    """Put an upload in S3 under its key, ahead of the transaction pointing a resume at it"""
+    if isinstance(file, S3UploadedFile):
+        await run_storage_io(file.store)
+        return
+    storage = resume_storage()
+    content_type, _ = mimetypes.guess_type(s3_key)
+    await run_storage_io(
+        storage.client.put_object,
+        Bucket=storage.bucket_name,
+        Key=s3_key,
+        Body=content,
+        ContentType=content_type or 'application/octet-stream'
+    )
+    logger.info(f"Stored {len(content)} bytes in S3: {s3_key}")
+
+
+def _is_unchanged(resume, s3_key: str, sha256: str) -> bool:
+    """Whether an upload is the same presigned upload confirmed twice, or the resume's current file"""
+    return resume.s3_key == s3_key or bool(sha256 and resume.file and resume.sha256 == sha256)
+
+
+def _held_content(file) -> Optional[bytes]:
+    """Bytes of an upload held in memory, or None for a presigned upload already in S3"""
+    if isinstance(file, S3UploadedFile):
+        return file.content
+    file.seek(0)
+    content = file.read()
+    file.seek(0)
+    return content
+
+
+async def create_or_update_resume(profile, title, file):
+    """
+    Create new resume or update existing one. Every upload is kept as a
+    revision holding its whole file; collect_resume_chunks later chunks
+    superseded revisions so they share stored bytes. Re-uploading the
+    current file changes nothing.
+    S3 calls run on the storage executor ahead of the transaction, so the
+    ORM thread only locks the resume to point it at the new file and number
+    the revision.
+    """
+    # Parsed and presigned uploads are bound for their own key
+    s3_upload = isinstance(file, S3UploadedFile)
+    s3_key = file.s3_key if s3_upload else generate_resume_s3_key(profile, title, file.name)
+    content = await run_storage_io(_held_content, file)
+    size = len(content) if content is not None else file.size
+    # Presigned uploads are not read back; their digest is taken when they are chunked
+    sha256 = getattr(file, 'sha256', '') or (hashlib.sha256(content).hexdigest() if content is not None else '')
+
+    existing = await Resume.objects.filter(user_profile=profile, title=title).afirst()
+    if existing is None:
+        await sync_to_async(check_resume_limit)(profile, title)
+    elif _is_unchanged(existing, s3_key, sha256):
+        logger.info(f"Resume {existing.id} re-uploaded unchanged, keeping {existing.s3_key}")
+        if existing.s3_key != s3_key:
+            await sync_to_async(discard_unused_upload)(file)
+        return existing
+
+    legacy_size = None
+    if existing is not None and existing.file and not await existing.revisions.aexists():
+        # Resumes uploaded before revisions existed keep their current file as the first one
+        legacy_size = (await resume_storage().ahead(existing.file.name))['ContentLength']
+    await store_upload(file, s3_key, content)
+    return await _save_upload(profile, title, file, s3_key, size, sha256, legacy_size)
+
+
 @sync_to_async
-def create_or_update_resume(profile, title, file):
-    """Create new resume or update existing one"""
-    with transaction.atomic():
-        try:
-            # Try to get existing resume
-            resume = Resume.objects.get(user_profile=profile, title=title)
-            logger.info(f"Found existing resume with title '{title}', updating...")
-            
-            # Generate new S3 key
-            s3_key = generate_resume_s3_key(profile, title, file)
-            
-            # Delete old file if it exists
-            if resume.file:
-                logger.info(f"Deleting old file: {resume.s3_key}")
-                resume.file.delete(save=False)
-            
-            # Update resume
-            resume.original_filename = file.name
-            resume.s3_key = s3_key
-            file.instance = resume
-            resume.file = file
-            resume.save()
-            logger.info(f"Updated resume: {resume.id}")
-            
-        except Resume.DoesNotExist:
-            # Check resume limit before creating new one
-            resume_count = Resume.objects.filter(user_profile=profile).count()
-            if resume_count >= MAX_RESUMES_PER_USER:
-                raise ValidationError(
-                    f"Maximum {MAX_RESUMES_PER_USER} resumes allowed. "
-                    "Please delete an existing resume first."
+def _save_upload(profile, title, file, s3_key: str, size: int, sha256: str, legacy_size: Optional[int]):
+    """Point the resume at an upload already in S3 and record its revision, in one transaction"""
+    s3_upload = isinstance(file, S3UploadedFile)
+    try:
+        with transaction.atomic():
+            # Locked so revisions are numbered in order
+            resume = Resume.objects.select_for_update().filter(user_profile=profile, title=title).first()
+            if resume is not None:
+                logger.info(f"Found existing resume with title '{title}', updating...")
+                if _is_unchanged(resume, s3_key, sha256):
+                    # A concurrent request stored the same upload first
+                    if resume.s3_key != s3_key:
+                        enqueue_s3_deletions([s3_key])
+                    return resume
+
+                if legacy_size is not None and resume.file and not resume.revisions.exists():
+                    record_resume_revision(resume, resume.file.name, legacy_size,
+                                           resume.original_filename, resume.sha256)
+
+                # The old file stays with its revision until chunked; queue it only if none holds it
+                if resume.file and not resume.revisions.filter(s3_key=resume.file.name).exists():
+                    logger.info(f"Queueing old file for deletion: {resume.s3_key}")
+                    enqueue_s3_deletions([resume.file.name])
+
+                # Update resume
+                resume.original_filename = file.name
+                resume.s3_key = s3_key
+                resume.sha256 = sha256
+                resume.file = s3_key
+                resume.save()
+                logger.info(f"Updated resume: {resume.id}")
+            else:
+                # Check resume limit before creating new one
+                check_resume_limit(profile, title)
+
+                # Create new resume
+                resume = Resume.objects.create(
+                    user_profile=profile,
+                    title=title,
+                    original_filename=file.name,
+                    s3_key=s3_key,
+                    sha256=sha256,
+                    file=s3_key
                 )
-            
-            # Generate new S3 key
-            s3_key = generate_resume_s3_key(profile, title, file)
-            
-            # Create new resume
-            resume = Resume.objects.create(
-                user_profile=profile,
-                title=title,
-                original_filename=file.name,
-                s3_key=s3_key
-            )
-            # Attach resume instance to file and save
-            file.instance = resume
-            resume.file = file
-            resume.save()
-            logger.info(f"Created new resume: {resume.id}")
-        
-        return resume
+                logger.info(f"Created new resume: {resume.id}")
+
+            record_resume_revision(resume, s3_key, size, file.name, sha256)
+            return resume
+    except Exception:
+        # Parsed and presigned uploads are discarded by the endpoint
+        if not s3_upload:
+            enqueue_s3_deletions([s3_key])
+        raise
+
+
+def resume_storage():
+    """The ResumeStorage the resume file field writes to"""
+    return Resume._meta.get_field('file').storage
+
+
+def check_resume_limit(profile, title) -> None:
+    """Reject a new title once the profile has the maximum number of resumes"""
+    resumes = Resume.objects.filter(user_profile=profile)
+    if not resumes.filter(title=title).exists() and resumes.count() >= MAX_RESUMES_PER_USER:
+        raise ValidationError(
+            f"Maximum {MAX_RESUMES_PER_USER} resumes allowed. "
+            "Please delete an existing resume first."
+        )
+
+
+@sync_to_async
+def create_resume_upload_url(profile, title: str, file_name: str, size: int) -> dict:
+    """
+    Presigned PUT URL the client uploads a resume to directly, along with a
+    signed token naming the object for confirm_resume_upload
+    """
+    _, ext = os.path.splitext(file_name.lower())
+    if ext not in ALLOWED_EXTENSIONS:
+        raise ValidationError('File type not supported. Please upload files with extension .pdf, .doc, .docx or .txt')
+    if size > MAX_FILE_SIZE:
+        raise ValidationError(f'File size must be no more than {MAX_FILE_SIZE/1024/1024}MB')
+    check_resume_limit(profile, title)
+
+    storage = resume_storage()
+    s3_key = generate_resume_s3_key(profile, title, file_name)
+    content_type = EXTENSION_CONTENT_TYPES[ext]
+    upload_url = storage.client.generate_presigned_url(
+        'put_object',
+        Params={'Bucket': storage.bucket_name, 'Key': s3_key, 'ContentType': content_type},
+        ExpiresIn=settings.RESUME_UPLOAD_URL_EXPIRY,
+        HttpMethod='PUT'
+    )
+    upload_token = signing.dumps(
+        {'profile_id': profile.id, 'title': title, 'file_name': file_name, 's3_key': s3_key},
+        salt=UPLOAD_TOKEN_SALT
+    )
+    logger.info(f"Issued presigned upload URL for {s3_key}")
+    return {
+        "upload_url": upload_url,
+        "upload_token": upload_token,
+        "headers": {"Content-Type": content_type},
+        "expires_in": settings.RESUME_UPLOAD_URL_EXPIRY,
+    }
+
+
+async def confirm_resume_upload(profile, upload_token: str):
+    """
+    Look up the object a presigned upload put in S3, reading only its metadata
+    and first bytes. Returns the resume title and the file to validate and save.
+    """
+    try:
+        # An upload started just before its URL expired may still be finishing
+        data = signing.loads(upload_token, salt=UPLOAD_TOKEN_SALT, max_age=settings.RESUME_UPLOAD_URL_EXPIRY * 2)
+    except signing.SignatureExpired:
+        raise ValidationError("Upload token has expired")
+    except signing.BadSignature:
+        raise ValidationError("Invalid upload token")
+    if data['profile_id'] != profile.id:
+        raise ValidationError("Invalid upload token")
+
+    storage = resume_storage()
+    s3_key = data['s3_key']
+    try:
+        head = await storage.ahead(s3_key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            raise ValidationError("Uploaded file not found")
+        raise
+
+    size = head['ContentLength']
+    first_bytes = b''
+    if size:
+        obj = await storage.aget_object(s3_key, 'bytes=0-2047')
+        first_bytes = b''.join([chunk async for chunk in storage.astream(obj)])
+    file = S3UploadedFile(
+        storage,
+        s3_key,
+        data['file_name'],
+        head.get('ContentType'),
+        size,
+        sniffed_content_type=sniff_content_type(first_bytes)
+    )
+    logger.info(f"Confirmed presigned upload of {size} bytes to {s3_key}")
+    return data['title'], file
+
+
+def get_resume_file_url(resume, inline: bool = False) -> dict:
+    """Presigned GET URL serving a resume file straight from S3"""
+    storage = resume_storage()
+    content_type, _ = mimetypes.guess_type(resume.original_filename)
+    url = storage.client.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': storage.bucket_name,
+            'Key': resume.file.name,
+            'ResponseContentType': content_type or 'application/octet-stream',
+            'ResponseContentDisposition': content_disposition_header(not inline, resume.original_filename),
+        },
+        ExpiresIn=settings.RESUME_DOWNLOAD_URL_EXPIRY
+    )
+    return {"url": url, "expires_in": settings.RESUME_DOWNLOAD_URL_EXPIRY}
 
 
 @sync_to_async
@@ -124,8 +348,13 @@ def set_resume_as_default(profile_id: int, resume_id: int):
         # Get the resume to set as default
         resume = get_object_or_404(Resume, id=resume_id, user_profile_id=profile_id)
         
-        # Remove default from all resumes of this profile
-        Resume.objects.filter(user_profile_id=profile_id).update(is_default=False)
+        # Remove default from all other resumes of this profile
+        update_with_change_log(
+            Resume.objects.filter(user_profile_id=profile_id, is_default=True).exclude(id=resume_id),
+            profile_id,
+            'resume',
+            is_default=False
+        )
         
         # Set new default
         resume.is_default = True
@@ -0,0 +1,134 @@
+import hashlib
+from datetime import timedelta
+from typing import List
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Max
+from django.utils import timezone
+from profiles.models import PendingS3Deletion, ResumeChunk, ResumeRevision
+from profiles.models.resume_chunk import chunk_s3_key
+from profiles.models.resume_revision import MAX_REVISIONS_PER_RESUME
+from profiles.api.helpers.s3_deletion import enqueue_s3_deletions
+from profiles.utils.storage.async_storage import get_s3_client, get_storage_executor
+from profiles.utils.storage.cdc import chunk_digests
+from profiles.utils.logger.logging_config import logger
+
+
+def read_stored_file(s3_key: str) -> bytes:
+    return get_s3_client().get_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_key)['Body'].read()
+
+
+def store_chunks(content: bytes) -> List[str]:
+    """
+    Split content into content-defined chunks and put only the ones not
+    stored yet, in parallel. Returns the digests of all chunks in order.
+    Runs outside the transaction recording them: refreshing last_used_at
+    keeps the chunks from collection until the revision uses them.
+    """
+    chunks = chunk_digests(content)
+    unique = dict(chunks)
+
+    # Reusing a chunk refreshes it, so collect_resume_chunks cannot remove it under this revision
+    ResumeChunk.objects.filter(digest__in=unique).update(last_used_at=timezone.now())
+    # Unqueue chunks collected earlier; this waits for a flush holding them, so it cannot delete the PUTs below
+    PendingS3Deletion.objects.filter(key__in=[chunk_s3_key(digest) for digest in unique]).delete()
+    existing = set(ResumeChunk.objects.filter(digest__in=unique).values_list('digest', flat=True))
+    new = {digest: chunk for digest, chunk in unique.items() if digest not in existing}
+
+    if new:
+        client = get_s3_client()
+
+        def put(item):
+            digest, chunk = item
+            client.put_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=chunk_s3_key(digest), Body=bytes(chunk))
+
+        list(get_storage_executor().map(put, new.items()))
+        ResumeChunk.objects.bulk_create(
+            [ResumeChunk(digest=digest, size=len(chunk)) for digest, chunk in new.items()],
+            ignore_conflicts=True
+        )
+    logger.info(
+        f"Stored {len(new)} of {len(chunks)} chunks "
+        f"({sum(len(chunk) for chunk in new.values())} of {len(content)} bytes)"
+    )
+    return [digest for digest, _ in chunks]
+
+
+def record_resume_revision(resume, s3_key: str, size: int, original_filename: str, sha256: str) -> ResumeRevision:
+    """
+    Add a revision holding the whole file stored under s3_key to a locked
+    resume, dropping the oldest beyond MAX_REVISIONS_PER_RESUME
+    """
+    number = (resume.revisions.aggregate(latest=Max('number'))['latest'] or 0) + 1
+    revision = ResumeRevision.objects.create(
+        resume=resume,
+        number=number,
+        original_filename=original_filename,
+        size=size,
+        sha256=sha256,
+        s3_key=s3_key
+    )
+    stale = list(resume.revisions.order_by('-number').values_list('id', flat=True)[MAX_REVISIONS_PER_RESUME:])
+    if stale:
+        ResumeRevision.objects.filter(id__in=stale).delete()
+    logger.info(f"Recorded revision {number} of resume {resume.id}")
+    return revision
+
+
+def chunk_resume_revision(revision: ResumeRevision) -> bool:
+    """
+    Replace the whole file of a superseded revision with its chunks, then
+    queue the file for deletion. Returns False if the revision changed or
+    went away meanwhile; chunks stored for it are then collected later.
+    """
+    s3_key = revision.s3_key
+    content = read_stored_file(s3_key)
+    chunks = store_chunks(content)
+    with transaction.atomic():
+        updated = ResumeRevision.objects.filter(id=revision.id, s3_key=s3_key).update(
+            chunks=chunks,
+            size=len(content),
+            sha256=hashlib.sha256(content).hexdigest(),
+            s3_key=''
+        )
+        if updated:
+            enqueue_s3_deletions([s3_key])
+    return bool(updated)
+
+
+def chunk_superseded_revisions() -> int:
+    """
+    Chunk every revision still held as a whole file that is no longer its
+    resume's current file. Uploads only ever store the whole file, so the
+    request path never reads files back or chunks them.
+    """
+    pending = ResumeRevision.objects.exclude(s3_key='').exclude(s3_key=F('resume__s3_key')).order_by('id')
+    chunked = 0
+    for revision in pending.iterator():
+        try:
+            if chunk_resume_revision(revision):
+                chunked += 1
+        except Exception as e:
+            logger.error(f"Error chunking revision {revision.id} from {revision.s3_key}: {str(e)}")
+    logger.info(f"Chunked {chunked} superseded resume revisions")
+    return chunked
+
+
+def collect_resume_chunks(grace: timedelta = timedelta(hours=1)) -> int:
+    """
+    Remove chunks no revision uses and queue their objects for deletion.
+    Chunks used within the grace period are kept, since an upload may be
+    about to reference them.
+    """
+    chunks = connection.ops.quote_name(ResumeChunk._meta.db_table)
+    revisions = connection.ops.quote_name(ResumeRevision._meta.db_table)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {chunks} c WHERE c.last_used_at < %s AND NOT EXISTS "
+            f"(SELECT 1 FROM {revisions} r WHERE r.chunks @> ARRAY[c.digest]) RETURNING c.digest",
+            [timezone.now() - grace]
+        )
+        digests = [row[0] for row in cursor.fetchall()]
+        enqueue_s3_deletions([chunk_s3_key(digest) for digest in digests])
+    logger.info(f"Collected {len(digests)} unused resume chunks")
+    return len(digests)
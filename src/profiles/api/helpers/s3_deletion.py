@@ -0,0 +1,83 @@
+from typing import Iterable, Optional, Tuple
+from django.conf import settings
+from django.db import transaction
+from profiles.models import PendingS3Deletion, Resume, ResumeChunk
+from profiles.models.resume_chunk import CHUNK_KEY_PREFIX, chunk_s3_key
+from profiles.utils.storage.async_storage import get_s3_client
+from profiles.utils.storage.resume_storage import get_resume_cache
+from profiles.utils.logger.logging_config import logger
+
+# Most keys S3 accepts in one DeleteObjects request
+MAX_DELETE_BATCH = 1000
+
+
+def enqueue_s3_deletions(keys: Iterable[str]) -> None:
+    """
+    Queue S3 objects for deletion instead of deleting them inline. The queue
+    row is written in the current transaction, so a rollback keeps the object.
+    """
+    keys = [key for key in set(keys) if key]
+    if not keys:
+        return
+    PendingS3Deletion.objects.bulk_create([PendingS3Deletion(key=key) for key in keys], ignore_conflicts=True)
+    logger.info(f"Queued {len(keys)} S3 objects for deletion")
+
+    cache = get_resume_cache()
+    if cache is not None:
+        transaction.on_commit(lambda: [cache.discard(key) for key in keys], robust=True)
+
+
+def flush_s3_deletions(batch_size: int = MAX_DELETE_BATCH, limit: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Delete queued objects with one DeleteObjects request per batch of up to
+    1000 keys. Keys referenced again by a resume or a chunk row are dropped
+    from the queue without deleting; failed keys stay queued for the next run. Concurrent
+    flushes skip each other's rows. Returns (deleted, failed).
+    """
+    batch_size = min(batch_size, MAX_DELETE_BATCH)
+    client = get_s3_client()
+    deleted = failed = 0
+    last_id = 0
+
+    while limit is None or deleted + failed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - deleted - failed)
+        with transaction.atomic():
+            batch = list(
+                PendingS3Deletion.objects.select_for_update(skip_locked=True)
+                .filter(id__gt=last_id).order_by('id')[:size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            referenced = set(Resume.objects.filter(s3_key__in=[row.key for row in batch]).values_list('s3_key', flat=True))
+            # A collected chunk may have been stored again by a later upload
+            digests = [row.key.rsplit('/', 1)[-1] for row in batch if row.key.startswith(CHUNK_KEY_PREFIX)]
+            if digests:
+                referenced.update(chunk_s3_key(digest) for digest in
+                                  ResumeChunk.objects.filter(digest__in=digests).values_list('digest', flat=True))
+            keys = [row.key for row in batch if row.key not in referenced]
+            errors = {}
+            if keys:
+                response = client.delete_objects(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                    Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+                )
+                errors = {error['Key']: f"{error.get('Code')}: {error.get('Message')}" for error in response.get('Errors', [])}
+
+            done, retry = [], []
+            for row in batch:
+                if row.key in errors:
+                    row.attempts += 1
+                    row.last_error = errors[row.key]
+                    retry.append(row)
+                else:
+                    done.append(row.id)
+            PendingS3Deletion.objects.filter(id__in=done).delete()
+            PendingS3Deletion.objects.bulk_update(retry, ['attempts', 'last_error'])
+
+        deleted += len(keys) - len(errors)
+        failed += len(errors)
+        logger.info(f"Flushed S3 deletion batch: {len(keys) - len(errors)} deleted, {len(errors)} failed")
+
+    return deleted, failed
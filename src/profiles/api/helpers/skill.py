@@ -1,19 +1,32 @@
 from typing import List
-from django.db import IntegrityError
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import IntegrityError, OperationalError, connection, transaction
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest, Upper
+from asgiref.sync import sync_to_async
 from profiles.models.skill import Skill
 from profiles.models.user_profile import UserProfile
-from better_profanity import profanity
+from profiles.api.helpers.skill_canonical import resolve_canonical_skill
+from profiles.api.helpers.skill_cooccurrence import update_skill_cooccurrence
 from django.core.exceptions import ValidationError
-
-# Configure profanity filter
-profanity.load_censor_words()
+from profiles.utils.validators.profanity import get_profanity_matcher
+from profiles.utils.logger.logging_config import logger
 
 async def create_skill(name: str) -> Skill:
-    """Create a new skill, handling duplicates gracefully"""
+    """Create a new skill, returning the existing one if the name is a spelling variant or alias of it"""
     # Validate name for offensive content
-    if profanity.contains_profanity(name.strip()):
+    if get_profanity_matcher().contains_profanity(name.strip()):
         raise ValidationError("Skill name contains inappropriate content")
-        
+
+    canonical_id = await resolve_canonical_skill(name)
+    if canonical_id is not None:
+        try:
+            return await Skill.objects.aget(id=canonical_id)
+        except Skill.DoesNotExist:
+            # Deleted since the canonical map was built
+            pass
+
     try:
         return await Skill.objects.acreate(name=name.strip())
     except IntegrityError:
@@ -23,7 +36,7 @@ async def create_skill(name: str) -> Skill:
 async def update_skill(skill_id: int, name: str) -> Skill:
     """Update a skill's name"""
     # Validate name for offensive content
-    if profanity.contains_profanity(name.strip()):
+    if get_profanity_matcher().contains_profanity(name.strip()):
         raise ValidationError("Skill name contains inappropriate content")
         
     skill = await Skill.objects.aget(id=skill_id)
@@ -46,21 +59,98 @@ async def get_skill(skill_id: int) -> Skill:
     """Get a skill by ID"""
     return await Skill.objects.aget(id=skill_id)
 
-async def get_all_skills() -> List[Skill]:
-    """Get all skills"""
-    return [skill async for skill in Skill.objects.all()]
+def _ranked_skill_search_queryset(query: str):
+    """
+    Skills whose name starts with the query or is trigram-similar to it, ranked
+    by prefix match, then similarity, then usage count. Every predicate is on
+    UPPER(name), so it is served by the skill_name_trgm_idx GIN index.
+    """
+    search = query.strip().upper()
+    search_name = Upper('name')
+    is_prefix = Q(search_name__startswith=search)
+
+    skills = Skill.objects.alias(search_name=search_name)
+    if len(search) < 3:
+        # Too short to form a trigram; only prefix matches make sense
+        skills = skills.filter(is_prefix)
+    else:
+        skills = skills.filter(is_prefix | Q(search_name__trigram_word_similar=search))
+
+    return skills.annotate(
+        prefix_rank=Case(When(is_prefix, then=Value(0)), default=Value(1), output_field=IntegerField()),
+        similarity=TrigramWordSimilarity(search, search_name),
+    ).order_by('prefix_rank', '-similarity', '-usage_count', 'name')
+
+
+@sync_to_async
+def search_skills_ranked(query: str, limit: int, offset: int) -> List[Skill]:
+    """
+    Typo-tolerant skill search within the SKILL_SEARCH_TIMEOUT_MS budget.
+    If ranking does not finish in time, falls back to plain prefix matches.
+    """
+    try:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('statement_timeout', %s, true), "
+                    "set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                    [str(settings.SKILL_SEARCH_TIMEOUT_MS), str(settings.SKILL_SEARCH_MIN_SIMILARITY)]
+                )
+            return list(_ranked_skill_search_queryset(query)[offset:offset + limit])
+    except OperationalError as e:
+        logger.warning(f"Ranked skill search for '{query}' exceeded its budget, falling back to prefix search: {str(e)}")
+        return list(
+            Skill.objects.filter(name__istartswith=query.strip()).order_by('-usage_count', 'name')[offset:offset + limit]
+        )
+
+async def with_canonical_match(query: str, skills: List[Skill], limit: int) -> List[Skill]:
+    """Put the skill the query canonically names first in search results"""
+    canonical_id = await resolve_canonical_skill(query)
+    if canonical_id is None:
+        return skills
+    others = [skill for skill in skills if skill.id != canonical_id]
+    if len(others) == len(skills):
+        canonical = await Skill.objects.filter(id=canonical_id).afirst()
+        if canonical is None:
+            return skills
+    else:
+        canonical = next(skill for skill in skills if skill.id == canonical_id)
+    return [canonical, *others][:limit]
+
+def adjust_skill_usage(skill_ids, delta: int) -> None:
+    """Add delta to the usage count of the given skills in one query"""
+    if skill_ids:
+        Skill.objects.filter(id__in=skill_ids).update(usage_count=Greatest(F('usage_count') + delta, 0))
+
+@sync_to_async
+def update_profile_skills(profile: UserProfile, skill_ids: List[int]) -> None:
+    """
+    Replace a profile's skills, writing only the difference. Takes a constant
+    number of queries however many skills are sent.
+    """
+    wanted = set(skill_ids)
 
-async def update_profile_skills(profile: UserProfile, skill_ids: List[int]) -> None:
-    """Update a profile's skills"""
     # Verify all skills exist
-    skills = []
-    for skill_id in skill_ids:
-        try:
-            skill = await Skill.objects.aget(id=skill_id)
-            skills.append(skill)
-        except Skill.DoesNotExist:
-            raise ValueError(f"Skill with ID {skill_id} does not exist")
-    
-    # Update profile's skills
-    profile.skills.set(skills)
-    await profile.asave() 
\ No newline at end of file
+    found = Skill.objects.only('id').in_bulk(wanted)
+    missing = wanted - found.keys()
+    if missing:
+        raise ValueError(f"Skill with ID {min(missing)} does not exist")
+
+    with transaction.atomic():
+        # Lock the profile, so concurrent updates diff against each other's result
+        # instead of applying overlapping usage and co-occurrence deltas
+        UserProfile.objects.select_for_update().only('id').get(id=profile.id)
+        current = set(profile.skills.values_list('id', flat=True))
+        to_add = wanted - current
+        to_remove = current - wanted
+
+        # add()/remove() keep the m2m signals that maintain snapshots and the change log
+        if to_add:
+            profile.skills.add(*to_add)
+        if to_remove:
+            profile.skills.remove(*to_remove)
+        if to_add or to_remove:
+            adjust_skill_usage(to_add, 1)
+            adjust_skill_usage(to_remove, -1)
+            update_skill_cooccurrence(current, wanted)
+            profile.save(update_fields=['updated_at'])
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Optional
+from django.conf import settings
+from django.db import connections, transaction
+from asgiref.sync import sync_to_async
+from profiles.models import Skill, SkillAlias
+from profiles.utils.search.canonical import canonical_skill_key
+from profiles.utils.search.skill_extractor import SkillExtractor
+from profiles.utils.logger.logging_config import logger
+
+
+class SkillCanonicalMap:
+    """
+    Per-process map from canonical skill keys to skill ids, compiled from skill
+    names and the alias table, along with a SkillExtractor over the same names.
+    Built on first use, extended in place when skills or aliases are added,
+    and rebuilt after any change or every SKILL_CANONICAL_REBUILD_SECONDS to
+    pick up other processes' writes.
+    """
+
+    def __init__(self):
+        self._map = None
+        self._extractor = None
+        self._names = {}
+        self._built_at = 0.0
+        self._stale = False
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._rebuilding = False
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._map is not None
+
+    def build(self) -> dict:
+        mapping = {}
+        skills = list(Skill.objects.order_by('-id').values_list('id', 'name'))
+        # Highest id first, so the oldest skill wins when several names collide
+        for skill_id, name in skills:
+            key = canonical_skill_key(name)
+            if key:
+                mapping[key] = skill_id
+        # Aliases are explicit and override name collisions
+        aliases = list(SkillAlias.objects.values_list('alias', 'skill_id'))
+        mapping.update(aliases)
+
+        # Every spelling found in text resolves to its canonical skill
+        names = [(name, mapping.get(canonical_skill_key(name), skill_id)) for skill_id, name in skills]
+        extractor = SkillExtractor([*names, *aliases])
+
+        self._names = dict(skills)
+        self._extractor = extractor
+        self._map = mapping
+        self._built_at = time.time()
+        self._stale = False
+        logger.info(f"Built skill canonical map with {len(mapping)} keys and {len(extractor)} extraction patterns")
+        return mapping
+
+    def ensure_built(self) -> dict:
+        """Build the map on first use, once even under concurrent requests"""
+        with self._build_lock:
+            return self._map if self._map is not None else self.build()
+
+    def _rebuild_in_background(self) -> None:
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+
+        def run():
+            try:
+                self.build()
+            except Exception as e:
+                logger.error(f"Error rebuilding skill canonical map: {str(e)}")
+            finally:
+                self._rebuilding = False
+                connections.close_all()
+
+        threading.Thread(target=run, name="skill-canonical-map", daemon=True).start()
+
+    async def get_map(self) -> dict:
+        mapping = self._map
+        if mapping is None:
+            return await sync_to_async(self.ensure_built)()
+        if self._stale or time.time() - self._built_at >= settings.SKILL_CANONICAL_REBUILD_SECONDS:
+            self._rebuild_in_background()
+        return mapping
+
+    async def get_extractor(self) -> SkillExtractor:
+        await self.get_map()
+        return self._extractor
+
+    def skill_name(self, skill_id: int) -> Optional[str]:
+        return self._names.get(skill_id)
+
+    def add(self, name: str, skill_id: int, override: bool = False) -> None:
+        """Map a name's key to a skill once the current transaction commits"""
+        key = canonical_skill_key(name)
+        if not key or self._map is None:
+            return
+
+        def run():
+            if self._map is not None and (override or key not in self._map):
+                self._map[key] = skill_id
+            # The extractor is compiled; pick the name up on the next rebuild
+            self._stale = True
+
+        transaction.on_commit(run, robust=True)
+
+    def mark_stale(self) -> None:
+        """Rebuild the map on next use, e.g. after a skill is renamed or deleted"""
+        if self._map is not None:
+            transaction.on_commit(lambda: setattr(self, '_stale', True), robust=True)
+
+
+skill_canonical_map = SkillCanonicalMap()
+
+
+async def resolve_canonical_skill(name: str) -> Optional[int]:
+    """Id of the skill a name is a spelling variant or alias of, if any"""
+    key = canonical_skill_key(name)
+    if not key:
+        return None
+    mapping = await skill_canonical_map.get_map()
+    return mapping.get(key)
+
@@ -0,0 +1,109 @@
+import base64
+import gzip
+import hashlib
+import re
+from typing import List, Optional, Tuple
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import HttpResponse, HttpResponseNotModified
+from asgiref.sync import sync_to_async
+from pydantic import TypeAdapter
+from profiles.models import Skill
+from profiles.api.schemas.skill import SkillResponse
+from profiles.api.helpers.etag import etag_matches
+from profiles.utils.logger.logging_config import logger
+
+CATALOG_CACHE_KEY = "skills:catalog:{count}:{updated}"
+
+accepts_gzip = re.compile(r"\bgzip\b").search
+
+_catalog_adapter = TypeAdapter(List[SkillResponse])
+
+
+def get_catalog_cache():
+    return caches[settings.SKILL_CATALOG_CACHE_ALIAS]
+
+
+def encode_skill_cursor(name: str) -> str:
+    return base64.urlsafe_b64encode(name.encode()).decode()
+
+
+def decode_skill_cursor(cursor: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("Invalid cursor")
+
+
+async def get_skills_page(cursor: Optional[str], limit: int) -> Tuple[List[Skill], Optional[str]]:
+    """
+    One page of skills ordered by name, using the name of the last skill seen
+    as a keyset cursor. Returns the page and the cursor of the next one.
+    """
+    skills = Skill.objects.order_by('name')
+    if cursor:
+        skills = skills.filter(name__gt=decode_skill_cursor(cursor))
+
+    # Fetch one extra row to know whether another page follows
+    page = [skill async for skill in skills[:limit + 1]]
+    if len(page) <= limit:
+        return page, None
+    page = page[:limit]
+    return page, encode_skill_cursor(page[-1].name)
+
+
+def catalog_cache_key() -> str:
+    """
+    Cache key of the current catalog, from the skill count and latest update.
+    Every worker sees a change on its next request, whichever process made it.
+    """
+    stats = Skill.objects.aggregate(count=Count('id'), updated=Max('updated_at'))
+    updated = stats['updated'].timestamp() if stats['updated'] else 0
+    return CATALOG_CACHE_KEY.format(count=stats['count'], updated=updated)
+
+
+def build_skill_catalog(cache_key: str) -> dict:
+    """Serialize and gzip every skill once; the content hash versions the catalog"""
+    body = _catalog_adapter.dump_json(list(Skill.objects.order_by('name')))
+    version = hashlib.sha256(body).hexdigest()[:16]
+    catalog = {
+        "version": version,
+        "etag": f'"skills-{version}"',
+        "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+    }
+    get_catalog_cache().set(cache_key, catalog, timeout=settings.SKILL_CATALOG_CACHE_SECONDS)
+    logger.info(f"Built skill catalog version {version} ({len(catalog['gzip'])} bytes gzipped)")
+    return catalog
+
+
+def load_skill_catalog() -> dict:
+    """The current catalog, rebuilt only after skills have changed"""
+    cache_key = catalog_cache_key()
+    catalog = get_catalog_cache().get(cache_key)
+    if catalog is None:
+        catalog = build_skill_catalog(cache_key)
+    return catalog
+
+
+async def get_skill_catalog() -> dict:
+    return await sync_to_async(load_skill_catalog)()
+
+
+def skill_catalog_response(request, catalog: dict) -> HttpResponse:
+    """Serve the catalog as stored, or 304 if the client already has this version"""
+    if etag_matches(request, catalog["etag"]):
+        response = HttpResponseNotModified()
+    elif accepts_gzip(request.headers.get('Accept-Encoding', '')):
+        response = HttpResponse(catalog["gzip"], content_type='application/json')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(gzip.decompress(catalog["gzip"]), content_type='application/json')
+
+    response['ETag'] = catalog["etag"]
+    response['Cache-Control'] = 'private, no-cache'
+    response['Vary'] = 'Accept-Encoding'
+    response['X-Catalog-Version'] = catalog["version"]
+    return response
+
@@ -0,0 +1,96 @@
+from collections import Counter
+from typing import Iterable, List
+from django.db import connection, transaction
+from django.db.models import Sum
+from asgiref.sync import sync_to_async
+from profiles.models import SkillCooccurrence, UserProfile
+from profiles.utils.logger.logging_config import logger
+
+
+def _table_names():
+    through = UserProfile.skills.through
+    return (
+        connection.ops.quote_name(SkillCooccurrence._meta.db_table),
+        connection.ops.quote_name(through._meta.db_table),
+        through._meta.get_field('userprofile').column,
+        through._meta.get_field('skill').column,
+    )
+
+
+def cooccurrence_deltas(before: Iterable[int], after: Iterable[int]) -> Counter:
+    """
+    Change in pair counts when one profile's skills go from before to after:
+    +1 for each ordered pair that now co-occurs, -1 for each that no longer does
+    """
+    before, after = set(before), set(after)
+    deltas = Counter()
+    for skills, gone, sign in ((after, after - before, 1), (before, before - after, -1)):
+        for skill_id in gone:
+            for other_id in skills:
+                if other_id == skill_id:
+                    continue
+                deltas[(skill_id, other_id)] += sign
+                # Pairs of two changed skills are counted once, from the first of them
+                if other_id not in gone:
+                    deltas[(other_id, skill_id)] += sign
+    return deltas
+
+
+def update_skill_cooccurrence(before: Iterable[int], after: Iterable[int]) -> None:
+    """Apply one profile's skill change to the co-occurrence counts in two statements"""
+    deltas = cooccurrence_deltas(before, after)
+    # Sorted, so concurrent updates lock shared pairs in the same order instead of deadlocking
+    deltas = {pair: delta for pair, delta in sorted(deltas.items()) if delta}
+    if not deltas:
+        return
+
+    cooccurrences, *_ = _table_names()
+    skill_ids, other_ids = zip(*deltas)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {cooccurrences} (skill_id, other_id, count) "
+            f"SELECT * FROM unnest(%s::bigint[], %s::bigint[], %s::integer[]) "
+            f"ON CONFLICT (skill_id, other_id) DO UPDATE SET count = {cooccurrences}.count + EXCLUDED.count",
+            [list(skill_ids), list(other_ids), list(deltas.values())]
+        )
+        if any(delta < 0 for delta in deltas.values()):
+            cursor.execute(
+                f"DELETE FROM {cooccurrences} WHERE skill_id = ANY(%s) AND count <= 0",
+                [list(set(skill_ids))]
+            )
+
+
+def rebuild_skill_cooccurrence() -> int:
+    """
+    Recompute every pair count from the profile skill links, as the sparse
+    product of the profile-by-skill matrix with itself, in a single query
+    """
+    cooccurrences, links, profile_column, skill_column = _table_names()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {cooccurrences}")
+        cursor.execute(
+            f"INSERT INTO {cooccurrences} (skill_id, other_id, count) "
+            f"SELECT a.{skill_column}, b.{skill_column}, count(*) FROM {links} a "
+            f"JOIN {links} b ON a.{profile_column} = b.{profile_column} AND a.{skill_column} <> b.{skill_column} "
+            f"GROUP BY a.{skill_column}, b.{skill_column}"
+        )
+        pairs = cursor.rowcount
+    logger.info(f"Rebuilt skill co-occurrence with {pairs} pairs")
+    return pairs
+
+
+@sync_to_async
+def get_skill_recommendations(profile_id: int, limit: int) -> List[dict]:
+    """
+    Skills most often listed alongside the profile's skills that it does not
+    list yet, answered from the precomputed pair counts in one indexed query
+    """
+    profile_skills = UserProfile.skills.through.objects.filter(userprofile_id=profile_id).values('skill_id')
+    rows = SkillCooccurrence.objects.filter(
+        skill_id__in=profile_skills
+    ).exclude(
+        other_id__in=profile_skills
+    ).values('other_id', 'other__name').annotate(
+        score=Sum('count')
+    ).order_by('-score', 'other__name')[:limit]
+    return [{"id": row['other_id'], "name": row['other__name'], "score": row['score']} for row in rows]
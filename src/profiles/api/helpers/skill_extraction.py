@@ -0,0 +1,68 @@
+from typing import List
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from profiles.models import UserProfile, WorkExperience
+from profiles.api.helpers.skill_canonical import skill_canonical_map
+from profiles.utils.search.canonical import canonical_skill_key
+
+
+def validate_extraction_texts(texts: List[str]) -> None:
+    if not texts or len(texts) > settings.SKILL_EXTRACTION_MAX_TEXTS:
+        raise ValidationError(f"Send between 1 and {settings.SKILL_EXTRACTION_MAX_TEXTS} texts")
+    if any(len(text) > settings.SKILL_EXTRACTION_MAX_TEXT_LENGTH for text in texts):
+        raise ValidationError(f"Texts are limited to {settings.SKILL_EXTRACTION_MAX_TEXT_LENGTH} characters")
+
+
+async def _extract_many(extractor, texts: List[str]) -> List[List[int]]:
+    """
+    Scan texts on a worker thread rather than the event loop, which a request
+    with many long texts would otherwise hold for the whole scan
+    """
+    return await sync_to_async(extractor.extract_many, thread_sensitive=False)(texts)
+
+
+def _skill_refs(skill_ids) -> List[dict]:
+    return [{"id": skill_id, "name": skill_canonical_map.skill_name(skill_id)} for skill_id in skill_ids]
+
+
+async def extract_skills(texts: List[str]) -> List[List[dict]]:
+    """Skills mentioned in each text, in order of first mention"""
+    extractor = await skill_canonical_map.get_extractor()
+    return [_skill_refs(skill_ids) for skill_ids in await _extract_many(extractor, texts)]
+
+
+async def get_skill_gaps(profile_id: int, texts: List[str], include_experience: bool = False) -> List[dict]:
+    """
+    For each text (e.g. a job description), the skills it mentions that the
+    profile has and those it lacks. With include_experience, skills mentioned
+    in the profile's work experience descriptions count as skills it has.
+    """
+    extractor = await skill_canonical_map.get_extractor()
+    mapping = await skill_canonical_map.get_map()
+
+    # Compare canonical skills, so a profile listing a spelling variant is covered
+    has = {
+        mapping.get(canonical_skill_key(name), skill_id)
+        async for skill_id, name in UserProfile.skills.through.objects.filter(
+            userprofile_id=profile_id
+        ).values_list('skill_id', 'skill__name')
+    }
+    if include_experience:
+        descriptions = [
+            description async for description in WorkExperience.objects.filter(
+                user_profile_id=profile_id
+            ).values_list('description', flat=True)
+        ]
+        has |= await sync_to_async(extractor.extract_set, thread_sensitive=False)(descriptions)
+
+    gaps = []
+    for skill_ids in await _extract_many(extractor, texts):
+        matched = [skill_id for skill_id in skill_ids if skill_id in has]
+        missing = [skill_id for skill_id in skill_ids if skill_id not in has]
+        gaps.append({
+            "matched": _skill_refs(matched),
+            "missing": _skill_refs(missing),
+            "coverage": len(matched) / len(skill_ids) if skill_ids else 1.0,
+        })
+    return gaps
@@ -0,0 +1,109 @@
+from functools import partial
+from typing import Iterable, Optional
+from django.db import transaction
+from asgiref.sync import sync_to_async
+from pydantic import TypeAdapter
+from profiles.models import (
+    UserProfile,
+    Education,
+    WorkExperience,
+    EqualEmploymentData,
+    SocialLink,
+    Skill,
+    Resume,
+    ProfileSnapshot,
+)
+from profiles.api.schemas.bundle import ProfileBundleResponse
+from profiles.api.helpers.bundle import get_profile_bundle_queryset, build_profile_bundle
+from profiles.utils.logger.logging_config import logger
+
+# Loaders for each section of the snapshot document, keyed by bundle field name
+SECTION_LOADERS = {
+    'profile': lambda profile_id: UserProfile.objects.select_related('user').get(id=profile_id),
+    'education': lambda profile_id: list(Education.objects.filter(user_profile_id=profile_id)),
+    'work_experience': lambda profile_id: list(WorkExperience.objects.filter(user_profile_id=profile_id)),
+    'skills': lambda profile_id: list(Skill.objects.filter(userprofile__id=profile_id)),
+    'social_links': lambda profile_id: list(
+        SocialLink.objects.filter(user_profile_id=profile_id).order_by('platform')
+    ),
+    'equal_employment': lambda profile_id: EqualEmploymentData.objects.filter(
+        user_profile_id=profile_id
+    ).first(),
+    'default_resume': lambda profile_id: Resume.objects.filter(
+        user_profile_id=profile_id
+    ).order_by('-is_default', '-updated_at').first(),
+}
+
+# Serializers for each section, built from the bundle response schema
+SECTION_ADAPTERS = {
+    name: TypeAdapter(field.annotation)
+    for name, field in ProfileBundleResponse.model_fields.items()
+}
+
+
+def serialize_profile_bundle(bundle: dict) -> dict:
+    """Serialize an assembled bundle into the JSON document stored in a snapshot"""
+    return ProfileBundleResponse.model_validate(bundle).model_dump(mode='json')
+
+
+def rebuild_profile_snapshot(profile_id: int) -> Optional[ProfileSnapshot]:
+    """Rebuild the full snapshot document for a profile"""
+    profile = get_profile_bundle_queryset().filter(id=profile_id).first()
+    if profile is None:
+        logger.debug(f"Profile {profile_id} no longer exists, skipping snapshot rebuild")
+        return None
+
+    snapshot, _ = ProfileSnapshot.objects.update_or_create(
+        user_profile_id=profile_id,
+        defaults={'data': serialize_profile_bundle(build_profile_bundle(profile))}
+    )
+    logger.info(f"Rebuilt snapshot for profile {profile_id}")
+    return snapshot
+
+
+def refresh_profile_snapshot(profile_id: int, sections: Iterable[str]) -> Optional[ProfileSnapshot]:
+    """Re-serialize only the given sections of a profile's snapshot"""
+    with transaction.atomic():
+        snapshot = ProfileSnapshot.objects.select_for_update().filter(
+            user_profile_id=profile_id
+        ).first()
+        if snapshot is None:
+            return rebuild_profile_snapshot(profile_id)
+
+        try:
+            for section in sections:
+                value = SECTION_LOADERS[section](profile_id)
+                snapshot.data[section] = SECTION_ADAPTERS[section].dump_python(
+                    SECTION_ADAPTERS[section].validate_python(value),
+                    mode='json'
+                )
+        except UserProfile.DoesNotExist:
+            return None
+
+        snapshot.save(update_fields=['data', 'updated_at'])
+        logger.debug(f"Refreshed snapshot sections {sorted(sections)} for profile {profile_id}")
+        return snapshot
+
+
+def schedule_snapshot_refresh(profile_id: int, section: str) -> None:
+    """Refresh a snapshot section once the current transaction commits"""
+    transaction.on_commit(partial(refresh_profile_snapshot, profile_id, {section}), robust=True)
+
+
+def invalidate_profile_snapshots(**filters) -> None:
+    """Drop snapshots matching the given filters; they are rebuilt on next read"""
+    deleted, _ = ProfileSnapshot.objects.filter(**filters).delete()
+    if deleted:
+        logger.info(f"Invalidated {deleted} profile snapshots")
+
+
+async def get_profile_snapshot_data(profile: UserProfile) -> dict:
+    """
+    Get the snapshot document for a profile loaded with select_related('snapshot'),
+    rebuilding it if it does not exist yet.
+    """
+    try:
+        return profile.snapshot.data
+    except ProfileSnapshot.DoesNotExist:
+        snapshot = await sync_to_async(rebuild_profile_snapshot)(profile.id)
+        return snapshot.data if snapshot else {}
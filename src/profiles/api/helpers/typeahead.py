@@ -0,0 +1,109 @@
+import threading
+import time
+from typing import List
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count
+from asgiref.sync import sync_to_async
+from profiles.models import Skill, Education, WorkExperience
+from profiles.utils.search.prefix_index import PrefixIndex
+from profiles.utils.logger.logging_config import logger
+
+# (display value, weight, payload) rows each typeahead index is built from
+TYPEAHEAD_SOURCES = {
+    'skills': lambda: Skill.objects.values_list('name', 'usage_count', 'id').order_by(),
+    'schools': lambda: (
+        (name, weight, None) for name, weight in Education.objects.values('school_name').annotate(
+            weight=Count('id')
+        ).values_list('school_name', 'weight').order_by()
+    ),
+    'companies': lambda: (
+        (name, weight, None) for name, weight in WorkExperience.objects.values('company').annotate(
+            weight=Count('id')
+        ).values_list('company', 'weight').order_by()
+    ),
+}
+
+
+class TypeaheadRegistry:
+    """
+    Per-process prefix indexes, built on first use, kept current by model
+    signals and rebuilt in the background every TYPEAHEAD_REBUILD_SECONDS to
+    pick up writes made by other processes.
+    """
+
+    def __init__(self):
+        self._indexes = {}
+        self._built_at = {}
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._rebuilding = set()
+
+    def is_loaded(self, source: str) -> bool:
+        return source in self._indexes
+
+    def build(self, source: str) -> PrefixIndex:
+        index = PrefixIndex(
+            top_k=settings.TYPEAHEAD_MAX_RESULTS,
+            precomputed_length=settings.TYPEAHEAD_PRECOMPUTED_PREFIX_LENGTH
+        )
+        index.build(TYPEAHEAD_SOURCES[source]())
+        self._indexes[source] = index
+        self._built_at[source] = time.time()
+        logger.info(f"Built {source} typeahead index with {len(index)} entries")
+        return index
+
+    def ensure_built(self, source: str) -> PrefixIndex:
+        """Build an index on first use, once even under concurrent requests"""
+        with self._build_lock:
+            index = self._indexes.get(source)
+            return index if index is not None else self.build(source)
+
+    def _rebuild_in_background(self, source: str) -> None:
+        with self._lock:
+            if source in self._rebuilding:
+                return
+            self._rebuilding.add(source)
+
+        def run():
+            try:
+                self.build(source)
+            except Exception as e:
+                logger.error(f"Error rebuilding {source} typeahead index: {str(e)}")
+            finally:
+                self._rebuilding.discard(source)
+                connections.close_all()
+
+        threading.Thread(target=run, name=f"typeahead-{source}", daemon=True).start()
+
+    async def get_index(self, source: str) -> PrefixIndex:
+        index = self._indexes.get(source)
+        if index is None:
+            return await sync_to_async(self.ensure_built)(source)
+        if time.time() - self._built_at[source] >= settings.TYPEAHEAD_REBUILD_SECONDS:
+            self._rebuild_in_background(source)
+        return index
+
+    def apply(self, source: str, method: str, *args, **kwargs) -> None:
+        """Apply a change to a loaded index once the current transaction commits"""
+        if source not in self._indexes:
+            return
+
+        def run():
+            index = self._indexes.get(source)
+            if index is not None:
+                getattr(index, method)(*args, **kwargs)
+
+        transaction.on_commit(run, robust=True)
+
+
+typeahead_registry = TypeaheadRegistry()
+
+
+async def get_typeahead_suggestions(source: str, prefix: str, limit: int) -> List[dict]:
+    """Heaviest values of a typeahead source starting with the prefix"""
+    index = await typeahead_registry.get_index(source)
+    return [
+        {"value": value, "weight": weight, "id": payload}
+        for value, weight, payload in index.lookup(prefix, limit)
+    ]
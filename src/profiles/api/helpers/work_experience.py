@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from asgiref.sync import sync_to_async
 from profiles.models import WorkExperience
+from profiles.api.helpers.changes import update_with_change_log
 from profiles.utils.logger.logging_config import logger
 
 @sync_to_async
@@ -12,7 +13,12 @@ def create_work_experience(profile, data):
         with transaction.atomic():
             # If this is marked as current job, unmark others
             if data.is_current:
-                WorkExperience.objects.filter(user_profile=profile, is_current=True).update(is_current=False)
+                update_with_change_log(
+                    WorkExperience.objects.filter(user_profile=profile, is_current=True),
+                    profile.id,
+                    'work_experience',
+                    is_current=False
+                )
             
             # Create work experience entry
             work_exp = WorkExperience.objects.create(
@@ -47,10 +53,15 @@ def update_work_experience(profile_id: int, work_exp_id: int, data):
             
             # If setting this as current, unmark others
             if data.is_current:
-                WorkExperience.objects.filter(
-                    user_profile_id=profile_id,
-                    is_current=True
-                ).exclude(id=work_exp_id).update(is_current=False)
+                update_with_change_log(
+                    WorkExperience.objects.filter(
+                        user_profile_id=profile_id,
+                        is_current=True
+                    ).exclude(id=work_exp_id),
+                    profile_id,
+                    'work_experience',
+                    is_current=False
+                )
             
             # Update fields
             update_dict = data.dict(exclude_unset=True)
@@ -0,0 +1,20 @@
+from typing import List, Optional
+from ninja import Schema
+from profiles.api.schemas.profile import ProfileResponse
+from profiles.api.schemas.education import EducationResponse
+from profiles.api.schemas.work_experience import WorkExperienceResponse
+from profiles.api.schemas.skill import SkillResponse
+from profiles.api.schemas.social_link import SocialLinkResponse
+from profiles.api.schemas.equal_employment import EqualEmploymentSummary
+from profiles.api.schemas.resume import ResumeResponse
+
+
+class ProfileBundleResponse(Schema):
+    """Everything needed to autofill an application form, in one response"""
+    profile: ProfileResponse
+    education: List[EducationResponse]
+    work_experience: List[WorkExperienceResponse]
+    skills: List[SkillResponse]
+    social_links: List[SocialLinkResponse]
+    equal_employment: Optional[EqualEmploymentSummary] = None
+    default_resume: Optional[ResumeResponse] = None
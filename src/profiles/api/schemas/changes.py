@@ -0,0 +1,16 @@
+from typing import Any, Dict, List, Optional
+from ninja import Schema
+
+
+class ProfileChangeEntry(Schema):
+    """A row that was created or updated (with its data), or deleted (a tombstone)"""
+    resource: str
+    id: int
+    action: str
+    data: Optional[Dict[str, Any]] = None
+
+
+class ProfileChangesResponse(Schema):
+    """Changes since a cursor; pass `cursor` as `since` on the next call"""
+    cursor: int
+    changes: List[ProfileChangeEntry]
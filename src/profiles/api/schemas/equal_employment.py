@@ -55,16 +55,16 @@ class EthnicitiesResponse(EthnicitiesValue):
     is_hispanic_latinx: bool
 
 class EqualEmploymentSummary(Schema):
-    authorized_us: str
-    authorized_canada: str
-    authorized_uk: str
-    requires_sponsorship: str
+    authorized_us: Optional[str] = None
+    authorized_canada: Optional[str] = None
+    authorized_uk: Optional[str] = None
+    requires_sponsorship: Optional[str] = None
     ethnicities: List[str]
     is_hispanic_latinx: bool
-    gender: str
-    has_disability: str
-    is_lgbtq: str
-    is_veteran: str
+    gender: Optional[str] = None
+    has_disability: Optional[str] = None
+    is_lgbtq: Optional[str] = None
+    is_veteran: Optional[str] = None
 
 class CompletionStatus(Schema):
     work_auth_complete: bool
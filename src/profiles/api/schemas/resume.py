@@ -1,8 +1,8 @@
 from pydantic import Field
 from ninja import Schema
 from datetime import datetime
-from typing import Optional
-from profiles.models.resume import MAX_TITLE_LENGTH
+from typing import Dict, Optional
+from profiles.models.resume import MAX_FILENAME_LENGTH, MAX_TITLE_LENGTH
 
 
 # File validation constants
@@ -37,4 +37,41 @@ class ResumeResponse(ResumeBase):
     id: int
     original_filename: str
     is_default: bool
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+
+class ResumeUploadUrlRequest(ResumeBase):
+    """Schema for requesting a presigned resume upload URL"""
+    file_name: str = Field(..., max_length=MAX_FILENAME_LENGTH)
+    size: int = Field(..., gt=0, le=MAX_FILE_SIZE)
+
+
+class ResumeUploadUrlResponse(Schema):
+    """Presigned PUT URL, the headers to send with it and the token to confirm the upload with"""
+    upload_url: str
+    upload_token: str
+    headers: Dict[str, str]
+    expires_in: int
+
+
+class ResumeUploadConfirm(Schema):
+    """Schema for confirming a presigned upload"""
+    upload_token: str
+
+    class Config:
+        extra = "forbid"
+
+
+class ResumeFileUrl(Schema):
+    """Presigned URL serving a resume file"""
+    url: str
+    expires_in: int
+
+
+class ResumeRevisionResponse(Schema):
+    """Schema for a stored revision of a resume"""
+    number: int
+    original_filename: str
+    size: int
+    sha256: str
+    created_at: datetime
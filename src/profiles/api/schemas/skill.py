@@ -36,6 +36,35 @@ class SkillResponse(ModelSchema):
         model = Skill
         model_fields = ['id', 'name', 'created_at', 'updated_at']
 
+class SkillRecommendation(Schema):
+    """Schema for a skill recommended from co-occurrence"""
+    id: int
+    name: str
+    score: int  # Co-occurrences with the profile's skills
+
+class SkillExtractionRequest(Schema):
+    """Schema for texts to find skills in, e.g. job descriptions"""
+    texts: List[str]
+
+class SkillGapRequest(SkillExtractionRequest):
+    """Schema for texts to compare a profile's skills against"""
+    include_experience: bool = False  # Count skills mentioned in work experience as held
+
+class ExtractedSkill(Schema):
+    """Schema for a skill found in text"""
+    id: int
+    name: str
+
+class SkillExtractionResult(Schema):
+    """Schema for the skills found in one text"""
+    skills: List[ExtractedSkill]
+
+class SkillGapResult(Schema):
+    """Schema for the skills of one text a profile has and lacks"""
+    matched: List[ExtractedSkill]
+    missing: List[ExtractedSkill]
+    coverage: float  # Share of the text's skills the profile has
+
 class ProfileSkillsUpdate(Schema):
     """Schema for updating a profile's skills"""
     skill_ids: List[int]
\ No newline at end of file
@@ -0,0 +1,9 @@
+from typing import Optional
+from ninja import Schema
+
+
+class TypeaheadSuggestion(Schema):
+    """A typeahead suggestion and how often it is used"""
+    value: str
+    weight: int
+    id: Optional[int] = None  # Skill id, for skill suggestions
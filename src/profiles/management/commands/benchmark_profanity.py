@@ -0,0 +1,73 @@
+import time
+from better_profanity import Profanity
+from better_profanity.utils import get_complete_path_of_file, read_wordlist
+from django.core.management.base import BaseCommand, CommandError
+from profiles.utils.validators.profanity import ProfanityMatcher
+
+# Clean names resembling real skills, some close to blocked words
+SAMPLE_SKILLS = [
+    "Python", "JavaScript", "Node.js", "C++", "C#", "Machine Learning", "Fog Computing",
+    "Assembly", "Class Design", "Data Science", "Shell Scripting", "Cocoa Touch",
+    "Hadoop", "Spring Boot", "Analytics", "Scunthorpe Logistics", "Public Speaking",
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare the compiled profanity matcher with better_profanity on the same names'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--file', help='Names to screen, one per line (default: a generated sample)')
+        parser.add_argument('--repeat', type=int, default=20, help='Times to screen the names (default: 20)')
+
+    def handle(self, *args, **options):
+        names = self._load_names(options['file'])
+        words = list(read_wordlist(get_complete_path_of_file("profanity_wordlist.txt")))
+        names = names * max(options['repeat'], 1)
+
+        started = time.perf_counter()
+        baseline = Profanity(words)
+        baseline_load = time.perf_counter() - started
+        started = time.perf_counter()
+        baseline_results = [baseline.contains_profanity(name) for name in names]
+        baseline_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matcher = ProfanityMatcher(words)
+        matcher_load = time.perf_counter() - started
+        started = time.perf_counter()
+        matcher_results = matcher.screen(names)
+        matcher_time = time.perf_counter() - started
+
+        disagreements = sorted({
+            name for name, expected, found in zip(names, baseline_results, matcher_results)
+            if expected != found
+        })
+
+        self.stdout.write(f'Screened {len(names)} names against {len(words)} blocked words')
+        self.stdout.write(
+            f'better_profanity: load {baseline_load * 1000:.1f} ms, '
+            f'{baseline_time / len(names) * 1e6:.1f} us/name, {sum(baseline_results)} blocked'
+        )
+        self.stdout.write(
+            f'compiled matcher: compile {matcher_load * 1000:.1f} ms, '
+            f'{matcher_time / len(names) * 1e6:.1f} us/name, {sum(matcher_results)} blocked'
+        )
+        self.stdout.write(self.style.SUCCESS(f'Speedup: {baseline_time / matcher_time:.1f}x'))
+        if disagreements:
+            self.stdout.write(self.style.WARNING(f'{len(disagreements)} names judged differently:'))
+            for name in disagreements[:20]:
+                self.stdout.write(f'  {name}')
+
+    def _load_names(self, path):
+        if path:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    return [line.strip() for line in f if line.strip()]
+            except OSError as e:
+                raise CommandError(f'Cannot read {path}: {str(e)}')
+
+        # Blocked words in the disguises users try, mixed with clean skill names
+        names = list(SAMPLE_SKILLS)
+        for word in read_wordlist(get_complete_path_of_file("profanity_wordlist.txt")):
+            names += [word.title(), word.replace('a', '@').replace('e', '3'), f'Senior {word} Engineer', f'{word}ing']
+        return names
@@ -0,0 +1,16 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from profiles.api.helpers.resume_revision import chunk_superseded_revisions, collect_resume_chunks
+
+class Command(BaseCommand):
+    help = ('Chunk superseded resume revisions, then remove resume chunks no revision uses '
+            'and queue their objects for flush_s3_deletions; run periodically')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=float, default=1,
+                            help='Keep chunks used more recently than this')
+
+    def handle(self, *args, **options):
+        chunked = chunk_superseded_revisions()
+        collected = collect_resume_chunks(timedelta(hours=options['grace_hours']))
+        self.stdout.write(self.style.SUCCESS(f'Chunked {chunked} revisions, collected {collected} unused chunks'))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from profiles.api.helpers.s3_deletion import MAX_DELETE_BATCH, flush_s3_deletions
+
+class Command(BaseCommand):
+    help = 'Delete queued S3 objects in batches with DeleteObjects; run periodically'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=MAX_DELETE_BATCH,
+                            help=f'Keys per DeleteObjects request, at most {MAX_DELETE_BATCH}')
+        parser.add_argument('--limit', type=int, default=None, help='Stop after this many keys')
+
+    def handle(self, *args, **options):
+        deleted, failed = flush_s3_deletions(options['batch_size'], options['limit'])
+        if failed:
+            self.stdout.write(self.style.WARNING(f'Deleted {deleted} objects, {failed} failed and stay queued'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} objects'))
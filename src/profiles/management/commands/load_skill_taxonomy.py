@@ -0,0 +1,118 @@
+import csv
+import json
+import time
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from profiles.models import Skill, SkillAlias
+from profiles.utils.search.canonical import canonical_skill_key
+from profiles.utils.validators.profanity import get_profanity_matcher
+from profiles.utils.logger.logging_config import logger
+
+NAME_MAX_LENGTH = Skill._meta.get_field('name').max_length
+
+class Command(BaseCommand):
+    help = (
+        'Load skills from a CSV or JSONL taxonomy file, streaming it and inserting '
+        'new skills in chunks. Safe to re-run: existing skills and spelling variants are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file with a header row, or JSONL file of objects or strings')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl'],
+            help='File format (defaults to the file extension)'
+        )
+        parser.add_argument(
+            '--field',
+            default='name',
+            help='CSV column or JSON key holding the skill name (default: name)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Skills inserted per query (default: 5000)'
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        file_format = options['format'] or path.suffix.lstrip('.').lower()
+        if file_format not in ('csv', 'jsonl'):
+            raise CommandError(f'Cannot tell the format of {path}; pass --format csv or --format jsonl')
+        if not path.is_file():
+            raise CommandError(f'File not found: {path}')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be positive')
+
+        started = time.perf_counter()
+
+        # Canonical keys already taken by a skill or alias; variants of them are not loaded
+        seen = {canonical_skill_key(name) for name in Skill.objects.values_list('name', flat=True).iterator()}
+        seen.update(SkillAlias.objects.values_list('alias', flat=True))
+
+        existing = Skill.objects.count()
+        self.blocked = 0
+        read = skipped = invalid = 0
+        chunk = []
+        try:
+            for name in self._read_names(path, file_format, options['field']):
+                read += 1
+                name = ' '.join(name.split())
+                key = canonical_skill_key(name)
+                if not key or len(name) > NAME_MAX_LENGTH:
+                    invalid += 1
+                    continue
+                if key in seen:
+                    skipped += 1
+                    continue
+                seen.add(key)
+                chunk.append(Skill(name=name))
+                if len(chunk) >= options['chunk_size']:
+                    self._insert(chunk, read)
+                    chunk = []
+            if chunk:
+                self._insert(chunk, read)
+        except (csv.Error, json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Error reading skill taxonomy {path}: {str(e)}")
+            raise CommandError(f'Failed to read {path} after {read} rows: {str(e)}')
+
+        # Rows lost to concurrent inserts are not counted as created
+        created = Skill.objects.count() - existing
+
+        elapsed = time.perf_counter() - started
+        rate = read / elapsed if elapsed else read
+        logger.info(f"Loaded skill taxonomy {path}: {created} created, {skipped} existing, {invalid} invalid, {self.blocked} blocked in {elapsed:.2f}s")
+        self.stdout.write(self.style.SUCCESS(
+            f'Read {read} rows in {elapsed:.2f}s ({rate:,.0f} rows/s): '
+            f'{created} created, {skipped} already present, {invalid} invalid, {self.blocked} blocked'
+        ))
+
+    def _read_names(self, path, file_format, field):
+        """Yield skill names from the file one row at a time"""
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            if file_format == 'csv':
+                reader = csv.DictReader(f)
+                if field not in (reader.fieldnames or []):
+                    raise CommandError(f'Column "{field}" not found in {path}')
+                for row in reader:
+                    yield row[field] or ''
+                return
+
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                value = row.get(field) if isinstance(row, dict) else row
+                yield value if isinstance(value, str) else ''
+
+    def _insert(self, chunk, read) -> None:
+        """Drop inappropriate names, then insert the chunk in its own transaction, ignoring names created concurrently"""
+        blocked = get_profanity_matcher().screen(skill.name for skill in chunk)
+        if any(blocked):
+            chunk = [skill for skill, is_blocked in zip(chunk, blocked) if not is_blocked]
+            self.blocked += sum(blocked)
+        with transaction.atomic():
+            Skill.objects.bulk_create(chunk, ignore_conflicts=True)
+        self.stdout.write(f'Inserted {len(chunk)} skills ({read} rows read)')
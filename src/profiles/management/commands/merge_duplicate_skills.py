@@ -0,0 +1,215 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from profiles.models import Skill, SkillAlias, SkillCooccurrence, UserProfile, ProfileSnapshot, ProfileChange
+from profiles.utils.search.canonical import canonical_skill_key
+from profiles.utils.logger.logging_config import logger
+
+class Command(BaseCommand):
+    help = (
+        'Merge skills whose names are spelling variants of each other, or aliases of '
+        'another skill, into one skill and move their profile links in bulk'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--alias',
+            action='append',
+            default=[],
+            metavar='ALIAS=SKILL',
+            help='Record ALIAS as another name for the skill named SKILL before merging (repeatable)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the merges without changing anything'
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            aliases = self._add_aliases(options['alias'], options['dry_run'])
+            merges = self._plan_merges(aliases)
+            if not merges:
+                self.stdout.write(self.style.SUCCESS('No duplicate skills found'))
+                return
+
+            names = dict(Skill.objects.filter(
+                id__in=[*merges, *merges.values()]
+            ).values_list('id', 'name'))
+            for old_id, new_id in sorted(merges.items(), key=lambda item: names[item[1]]):
+                self.stdout.write(f'{names[old_id]} -> {names[new_id]}')
+
+            if options['dry_run']:
+                self.stdout.write(self.style.WARNING(f'Dry run: would merge {len(merges)} skills'))
+                transaction.set_rollback(True)
+                return
+
+            moved, profiles = self._move_profile_links(merges)
+            self._keep_merged_names(merges, names)
+            Skill.objects.filter(id__in=merges).delete()
+
+        logger.info(f"Merged {len(merges)} duplicate skills, moving {moved} links on {profiles} profiles")
+        self.stdout.write(self.style.SUCCESS(
+            f'Merged {len(merges)} skills, moved {moved} profile links on {profiles} profiles'
+        ))
+
+    def _add_aliases(self, specs, dry_run) -> dict:
+        """Resolve --alias options to canonical keys and store them in the alias table"""
+        aliases = {}
+        if not specs:
+            return aliases
+        skill_by_key = {}
+        for skill_id, name in Skill.objects.order_by('-id').values_list('id', 'name'):
+            skill_by_key[canonical_skill_key(name)] = skill_id
+
+        for spec in specs:
+            alias, _, skill_name = spec.partition('=')
+            skill_id = skill_by_key.get(canonical_skill_key(skill_name))
+            if not canonical_skill_key(alias) or skill_id is None:
+                raise CommandError(f'Invalid alias "{spec}": expected ALIAS=SKILL naming an existing skill')
+            aliases[canonical_skill_key(alias)] = skill_id
+            if not dry_run:
+                SkillAlias.objects.update_or_create(alias=canonical_skill_key(alias), defaults={'skill_id': skill_id})
+        return aliases
+
+    def _plan_merges(self, extra_aliases: dict) -> dict:
+        """
+        Map each skill to merge away to the skill it is merged into. Skills sharing
+        a canonical key merge into the alias target for that key if there is one,
+        otherwise into the most used of them (oldest on ties).
+        """
+        groups = {}
+        for skill_id, name in Skill.objects.values_list('id', 'name'):
+            groups.setdefault(canonical_skill_key(name), []).append(skill_id)
+        aliases = dict(SkillAlias.objects.values_list('alias', 'skill_id'))
+        aliases.update(extra_aliases)
+
+        contested = [ids for key, ids in groups.items() if len(ids) > 1 and key not in aliases]
+        usage = dict(Skill.objects.filter(
+            id__in=[skill_id for ids in contested for skill_id in ids]
+        ).values_list('id', 'usage_count'))
+
+        merges = {}
+        for key, ids in groups.items():
+            target = aliases.get(key)
+            if target is None:
+                if len(ids) < 2:
+                    continue
+                target = min(ids, key=lambda skill_id: (-usage[skill_id], skill_id))
+            for skill_id in ids:
+                if skill_id != target:
+                    merges[skill_id] = target
+
+        # A target may itself be merged away; follow each chain to its end
+        for old_id in list(merges):
+            new_id, seen = merges[old_id], {old_id}
+            while new_id in merges and new_id not in seen:
+                seen.add(new_id)
+                new_id = merges[new_id]
+            merges[old_id] = new_id
+        return {old_id: new_id for old_id, new_id in merges.items() if old_id != new_id}
+
+    def _move_profile_links(self, merges: dict):
+        """
+        Repoint profile skill links with set-based SQL, so the cost does not grow
+        with one query per link. Bumps versions, drops snapshots and logs the
+        change for every affected profile, as the m2m signals would, and
+        recounts the usage and co-occurrence of the skills merged into.
+        """
+        through = UserProfile.skills.through
+        profile_column = through._meta.get_field('userprofile').column
+        skill_column = through._meta.get_field('skill').column
+        links = connection.ops.quote_name(through._meta.db_table)
+        changes = connection.ops.quote_name(ProfileChange._meta.db_table)
+        profiles_table = connection.ops.quote_name(UserProfile._meta.db_table)
+        snapshots = connection.ops.quote_name(ProfileSnapshot._meta.db_table)
+        skills = connection.ops.quote_name(Skill._meta.db_table)
+        cooccurrences = connection.ops.quote_name(SkillCooccurrence._meta.db_table)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMPORARY TABLE skill_merge_map (old_id bigint PRIMARY KEY, new_id bigint NOT NULL) "
+                "ON COMMIT DROP"
+            )
+            cursor.execute(
+                "INSERT INTO skill_merge_map SELECT * FROM unnest(%s::bigint[], %s::bigint[])",
+                [list(merges), list(merges.values())]
+            )
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE skill_merge_profiles ON COMMIT DROP AS "
+                f"SELECT DISTINCT l.{profile_column} AS profile_id FROM {links} l "
+                f"JOIN skill_merge_map m ON l.{skill_column} = m.old_id"
+            )
+            cursor.execute("SELECT count(*) FROM skill_merge_profiles")
+            profiles = cursor.fetchone()[0]
+
+            # Change log entries carry the version bumped here, as _log_changes numbers them
+            cursor.execute(
+                f"UPDATE {profiles_table} SET version = version + 1 "
+                f"WHERE id IN (SELECT profile_id FROM skill_merge_profiles)"
+            )
+            cursor.execute(
+                f"INSERT INTO {changes} (user_profile_id, resource, object_id, action, version, created_at) "
+                f"SELECT l.{profile_column}, 'skill', l.{skill_column}, 'delete', p.version, now() FROM {links} l "
+                f"JOIN skill_merge_map m ON l.{skill_column} = m.old_id "
+                f"JOIN {profiles_table} p ON p.id = l.{profile_column}"
+            )
+            cursor.execute(
+                f"INSERT INTO {changes} (user_profile_id, resource, object_id, action, version, created_at) "
+                f"SELECT DISTINCT l.{profile_column}, 'skill', m.new_id, 'upsert', p.version, now() FROM {links} l "
+                f"JOIN skill_merge_map m ON l.{skill_column} = m.old_id "
+                f"JOIN {profiles_table} p ON p.id = l.{profile_column}"
+            )
+            cursor.execute(
+                f"INSERT INTO {links} ({profile_column}, {skill_column}) "
+                f"SELECT l.{profile_column}, m.new_id FROM {links} l "
+                f"JOIN skill_merge_map m ON l.{skill_column} = m.old_id "
+                f"ON CONFLICT ({profile_column}, {skill_column}) DO NOTHING"
+            )
+            cursor.execute(
+                f"DELETE FROM {links} l USING skill_merge_map m WHERE l.{skill_column} = m.old_id"
+            )
+            moved = cursor.rowcount
+
+            cursor.execute(
+                f"DELETE FROM {snapshots} WHERE user_profile_id IN (SELECT profile_id FROM skill_merge_profiles)"
+            )
+            cursor.execute(
+                f"UPDATE {skills} s SET usage_count = "
+                f"(SELECT count(*) FROM {links} l WHERE l.{skill_column} = s.id) "
+                f"WHERE s.id IN (SELECT new_id FROM skill_merge_map)"
+            )
+            # Pairs of merged skills move to the skills they merge into, where
+            # profiles listing both now count once; recount them from the links
+            cursor.execute(
+                "CREATE TEMPORARY TABLE skill_merge_skills ON COMMIT DROP AS "
+                "SELECT old_id AS skill_id FROM skill_merge_map UNION SELECT new_id FROM skill_merge_map"
+            )
+            cursor.execute(
+                f"DELETE FROM {cooccurrences} WHERE skill_id IN (SELECT skill_id FROM skill_merge_skills) "
+                f"OR other_id IN (SELECT skill_id FROM skill_merge_skills)"
+            )
+            cursor.execute(
+                f"INSERT INTO {cooccurrences} (skill_id, other_id, count) "
+                f"SELECT a.{skill_column}, b.{skill_column}, count(*) FROM {links} a "
+                f"JOIN {links} b ON a.{profile_column} = b.{profile_column} AND a.{skill_column} <> b.{skill_column} "
+                f"WHERE a.{skill_column} IN (SELECT new_id FROM skill_merge_map) "
+                f"OR b.{skill_column} IN (SELECT new_id FROM skill_merge_map) "
+                f"GROUP BY a.{skill_column}, b.{skill_column}"
+            )
+        return moved, profiles
+
+    def _keep_merged_names(self, merges: dict, names: dict) -> None:
+        """Repoint aliases of merged skills and keep their names as aliases, so they resolve on create and search"""
+        merged_by_target = {}
+        for old_id, new_id in merges.items():
+            merged_by_target.setdefault(new_id, []).append(old_id)
+        for new_id, old_ids in merged_by_target.items():
+            SkillAlias.objects.filter(skill_id__in=old_ids).update(skill_id=new_id)
+        SkillAlias.objects.bulk_create(
+            [
+                SkillAlias(alias=canonical_skill_key(names[old_id]), skill_id=new_id)
+                for old_id, new_id in merges.items()
+                if canonical_skill_key(names[old_id]) != canonical_skill_key(names[new_id])
+            ],
+            ignore_conflicts=True
+        )
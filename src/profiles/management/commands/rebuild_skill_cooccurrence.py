@@ -0,0 +1,18 @@
+import time
+from django.core.management.base import BaseCommand
+from profiles.api.helpers.skill_cooccurrence import rebuild_skill_cooccurrence
+from profiles.utils.logger.logging_config import logger
+
+class Command(BaseCommand):
+    help = 'Recompute skill co-occurrence counts from every profile; run after bulk changes to profile skills'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            pairs = rebuild_skill_cooccurrence()
+        except Exception as e:
+            logger.error(f"Error rebuilding skill co-occurrence: {str(e)}")
+            raise
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {pairs} co-occurring skill pairs in {time.perf_counter() - started:.2f}s'
+        ))
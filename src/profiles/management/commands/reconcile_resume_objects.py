@@ -0,0 +1,55 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from profiles.models import PendingS3Deletion, Resume, ResumeChunk, ResumeRevision
+from profiles.models.resume_chunk import CHUNK_KEY_PREFIX, chunk_s3_key
+from profiles.api.helpers.s3_deletion import enqueue_s3_deletions
+from profiles.utils.storage.async_storage import get_s3_client
+from profiles.utils.logger.logging_config import logger
+
+class Command(BaseCommand):
+    help = 'Find resume files and chunks in the bucket that nothing references, and optionally queue them for deletion'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='', help='Only list keys under this prefix, e.g. chunks/')
+        parser.add_argument('--min-age-hours', type=float, default=24,
+                            help='Ignore newer objects, which may belong to uploads still in flight')
+        parser.add_argument('--enqueue', action='store_true', help='Queue orphans for flush_s3_deletions')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['min_age_hours'])
+        paginator = get_s3_client().get_paginator('list_objects_v2')
+        listed = orphaned = orphaned_bytes = 0
+
+        # Each listing page of up to 1000 keys is checked against the table in one query
+        for page in paginator.paginate(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Prefix=options['prefix']):
+            objects = {obj['Key']: obj['Size'] for obj in page.get('Contents', []) if obj['LastModified'] < cutoff}
+            listed += len(page.get('Contents', []))
+            if not objects:
+                continue
+            known = set(Resume.objects.filter(s3_key__in=objects).values_list('s3_key', flat=True))
+            known.update(ResumeRevision.objects.filter(s3_key__in=objects).values_list('s3_key', flat=True))
+            known.update(PendingS3Deletion.objects.filter(key__in=objects).values_list('key', flat=True))
+            digests = [key.rsplit('/', 1)[-1] for key in objects if key.startswith(CHUNK_KEY_PREFIX)]
+            if digests:
+                known.update(chunk_s3_key(digest) for digest in
+                             ResumeChunk.objects.filter(digest__in=digests).values_list('digest', flat=True))
+            orphans = [key for key in objects if key not in known]
+            if not orphans:
+                continue
+
+            orphaned += len(orphans)
+            orphaned_bytes += sum(objects[key] for key in orphans)
+            for key in orphans:
+                self.stdout.write(key)
+            if options['enqueue']:
+                with transaction.atomic():
+                    enqueue_s3_deletions(orphans)
+
+        summary = f'Listed {listed} objects, {orphaned} orphaned ({orphaned_bytes} bytes)'
+        if orphaned and options['enqueue']:
+            summary += ', queued for deletion'
+        logger.info(summary)
+        self.stdout.write(self.style.WARNING(summary) if orphaned else self.style.SUCCESS(summary))
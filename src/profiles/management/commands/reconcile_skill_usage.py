@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from profiles.models import Skill, UserProfile
+from profiles.utils.logger.logging_config import logger
+
+class Command(BaseCommand):
+    help = 'Recount how many profiles list each skill and correct drifted usage counts; run periodically'
+
+    def handle(self, *args, **options):
+        through = UserProfile.skills.through
+        skill_column = through._meta.get_field('skill').column
+        links = connection.ops.quote_name(through._meta.db_table)
+        skills = connection.ops.quote_name(Skill._meta.db_table)
+
+        # One aggregate pass over the links; only drifted rows are written
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {skills} s SET usage_count = counts.actual "
+                f"FROM (SELECT s2.id, count(l.{skill_column}) AS actual FROM {skills} s2 "
+                f"LEFT JOIN {links} l ON l.{skill_column} = s2.id GROUP BY s2.id) counts "
+                f"WHERE s.id = counts.id AND s.usage_count <> counts.actual"
+            )
+            corrected = cursor.rowcount
+
+        if corrected:
+            logger.warning(f"Corrected usage counts of {corrected} skills")
+            self.stdout.write(self.style.WARNING(f'Corrected usage counts of {corrected} skills'))
+        else:
+            self.stdout.write(self.style.SUCCESS('All skill usage counts are accurate'))
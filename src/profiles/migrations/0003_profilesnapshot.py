@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-18 10:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0002_customuser_username_alter_customuser_auth0_id_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileSnapshot",
+            fields=[
+                (
+                    "user_profile",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="snapshot",
+                        serialize=False,
+                        to="profiles.userprofile",
+                    ),
+                ),
+                ("data", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
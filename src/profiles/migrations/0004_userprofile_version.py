@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-18 10:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0003_profilesnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userprofile",
+            name="version",
+            field=models.PositiveBigIntegerField(default=1, editable=False),
+        ),
+    ]
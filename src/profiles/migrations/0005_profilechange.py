@@ -0,0 +1,70 @@
+# Generated by Django 5.1.3 on 2026-10-18 10:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0004_userprofile_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        choices=[
+                            ("profile", "profile"),
+                            ("education", "education"),
+                            ("work_experience", "work_experience"),
+                            ("skill", "skill"),
+                            ("social_link", "social_link"),
+                            ("equal_employment", "equal_employment"),
+                            ("resume", "resume"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[("upsert", "upsert"), ("delete", "delete")],
+                        max_length=10,
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "user_profile",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="changes",
+                        to="profiles.userprofile",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["version", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["user_profile", "version"],
+                        name="profile_change_version_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0006_skill_name_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillAlias",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("alias", models.CharField(max_length=100, unique=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "skill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aliases",
+                        to="profiles.skill",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Skill aliases",
+                "ordering": ["alias"],
+            },
+        ),
+    ]
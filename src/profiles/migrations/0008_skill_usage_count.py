@@ -0,0 +1,38 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:16
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_usage_counts(apps, schema_editor):
+    Skill = apps.get_model("profiles", "Skill")
+    Link = apps.get_model("profiles", "UserProfile").skills.through
+    counts = (
+        Link.objects.filter(skill_id=OuterRef("pk"))
+        .order_by()
+        .values("skill_id")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    Skill.objects.update(usage_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0007_skillalias"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="skill",
+            name="usage_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="skill",
+            index=models.Index(fields=["-usage_count", "name"], name="skill_usage_idx"),
+        ),
+        migrations.RunPython(populate_usage_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0009_skillcooccurrence"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="sha256",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:32
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0011_pending_s3_deletion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumeChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("digest", models.CharField(max_length=64, unique=True)),
+                ("size", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("last_used_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ResumeRevision",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.PositiveIntegerField()),
+                ("original_filename", models.CharField(max_length=255)),
+                ("size", models.PositiveIntegerField()),
+                ("sha256", models.CharField(blank=True, max_length=64)),
+                (
+                    "s3_key",
+                    models.CharField(blank=True, db_index=True, max_length=255),
+                ),
+                (
+                    "chunks",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=64),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "resume",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="revisions",
+                        to="profiles.resume",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-number"],
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["chunks"], name="resume_revision_chunks_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("resume", "number"),
+                        name="unique_resume_revision_number",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -5,15 +5,29 @@ from .work_experience import WorkExperience
 from .equal_employment import EqualEmploymentData
 from .social_link import SocialLink
 from .skill import Skill
+from .skill_alias import SkillAlias
+from .skill_cooccurrence import SkillCooccurrence
 from .resume import Resume
+from .pending_s3_deletion import PendingS3Deletion
+from .resume_chunk import ResumeChunk
+from .resume_revision import ResumeRevision
+from .profile_snapshot import ProfileSnapshot
+from .profile_change import ProfileChange
 
 __all__ = [
     'CustomUser',
     'UserProfile',
     'Resume',
+    'PendingS3Deletion',
+    'ResumeChunk',
+    'ResumeRevision',
     'Education',
     'WorkExperience',
     'EqualEmploymentData',
     'SocialLink',
     'Skill',
+    'SkillAlias',
+    'SkillCooccurrence',
+    'ProfileSnapshot',
+    'ProfileChange',
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from profiles.models import UserProfile
+from profiles.models.managers import ProfileOwnedQuerySet
 class Education(models.Model):
     DEGREE_CHOICES = [
         ("High School", "High School"),
@@ -43,6 +44,8 @@ class Education(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(4)]
     )
 
+    objects = ProfileOwnedQuerySet.as_manager()
+
     class Meta:
         ordering = ['-start_year', '-start_month']
         verbose_name_plural = "Education"
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
 from profiles.models import UserProfile
+from profiles.models.managers import ProfileOwnedQuerySet
 
 class EqualEmploymentData(models.Model):
     ETHNICITY_CHOICES = [
@@ -109,6 +110,8 @@ class EqualEmploymentData(models.Model):
         null=True
     )
     
+    objects = ProfileOwnedQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         # Auto-populate is_hispanic_latinx based on ethnicities
         self.is_hispanic_latinx = 'Hispanic/Latinx' in self.ethnicities
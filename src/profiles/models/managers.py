@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class ProfileOwnedQuerySet(models.QuerySet):
+    """Queryset for rows belonging to a profile that can be scoped to the profile's owner"""
+    owner_field = 'user_profile__user_id'
+
+    def owned_by(self, user):
+        """Rows the user may access: their own, or every row for a superuser"""
+        if user.is_superuser:
+            return self.all()
+        return self.filter(**{self.owner_field: user.pk})
+
+
+class UserProfileQuerySet(ProfileOwnedQuerySet):
+    owner_field = 'user_id'
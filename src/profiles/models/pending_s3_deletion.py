@@ -0,0 +1,15 @@
+from django.db import models
+from profiles.models.resume import MAX_FILENAME_LENGTH
+
+class PendingS3Deletion(models.Model):
+    """S3 object queued for deletion; flushed in batches by the flush_s3_deletions command"""
+    key = models.CharField(max_length=MAX_FILENAME_LENGTH, unique=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return self.key
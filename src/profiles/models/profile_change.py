@@ -0,0 +1,38 @@
+from django.db import models
+from profiles.models import UserProfile
+
+class ProfileChange(models.Model):
+    """
+    Append-only log of changes to a profile's rows. Each entry carries the
+    profile version its write bumped to, which doubles as the sync cursor.
+    """
+    RESOURCE_CHOICES = [
+        ('profile', 'profile'),
+        ('education', 'education'),
+        ('work_experience', 'work_experience'),
+        ('skill', 'skill'),
+        ('social_link', 'social_link'),
+        ('equal_employment', 'equal_employment'),
+        ('resume', 'resume'),
+    ]
+
+    ACTION_CHOICES = [
+        ('upsert', 'upsert'),
+        ('delete', 'delete'),
+    ]
+
+    user_profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='changes')
+    resource = models.CharField(max_length=20, choices=RESOURCE_CHOICES)
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    version = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['version', 'id']
+        indexes = [
+            models.Index(fields=['user_profile', 'version'], name='profile_change_version_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.resource} {self.object_id} on profile {self.user_profile_id}"
@@ -0,0 +1,16 @@
+from django.db import models
+from profiles.models import UserProfile
+
+class ProfileSnapshot(models.Model):
+    """Pre-serialized profile bundle, rebuilt whenever the profile or its related rows change"""
+    user_profile = models.OneToOneField(
+        UserProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='snapshot'
+    )
+    data = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Snapshot for profile {self.user_profile_id}"
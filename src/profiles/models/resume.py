@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from profiles.utils.storage.resume_storage import ResumeStorage
 from profiles.models import UserProfile
+from profiles.models.managers import ProfileOwnedQuerySet
 from profiles.utils.logger.logging_config import logger
 
 # Constants
@@ -28,10 +29,13 @@ class Resume(models.Model):
         blank=True,
         null=True
     )
+    sha256 = models.CharField(max_length=64, blank=True)  # Hex digest of the file content
     is_default = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProfileOwnedQuerySet.as_manager()
+
     class Meta:
         ordering = ['-updated_at']
         constraints = [
@@ -69,16 +73,11 @@ class Resume(models.Model):
         super().save(*args, **kwargs)
 
     def delete(self, *args, **kwargs):
-        """Delete resume and its S3 file"""
+        """Delete resume; its S3 file is queued for deletion by the post_delete signal"""
         try:
             # Store if this was the default resume
             was_default = self.is_default
             
-            # Delete the file
-            if self.file:
-                logger.info(f"Deleting S3 file for resume: {self.s3_key}")
-                self.file.delete(save=False)
-            
             # Delete the database record
             super().delete(*args, **kwargs)
             logger.info(f"Deleted resume record: {self.id}")
@@ -97,7 +96,7 @@ class Resume(models.Model):
                 else:
                     logger.info("No resumes left to set as default")
         except Exception as e:
-            logger.error(f"Error deleting S3 file: {str(e)}")
+            logger.error(f"Error deleting resume: {str(e)}")
             raise
 
     def __str__(self):
@@ -0,0 +1,27 @@
+from django.db import models
+
+
+CHUNK_KEY_PREFIX = 'chunks/'
+
+
+def chunk_s3_key(digest: str) -> str:
+    return f"{CHUNK_KEY_PREFIX}{digest[:2]}/{digest}"
+
+
+class ResumeChunk(models.Model):
+    """Content-defined chunk of resume revisions, stored once in S3 under its SHA-256"""
+    digest = models.CharField(max_length=64, unique=True)
+    size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Refreshed whenever a revision reuses the chunk, so collection never races an upload
+    last_used_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+
+    @property
+    def s3_key(self) -> str:
+        return chunk_s3_key(self.digest)
+
+    def __str__(self):
+        return f"{self.digest} ({self.size} bytes)"
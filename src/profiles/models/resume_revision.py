@@ -0,0 +1,36 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+from profiles.models.resume import Resume, MAX_FILENAME_LENGTH
+
+# Older revisions beyond this are dropped; their chunks are collected once unused
+MAX_REVISIONS_PER_RESUME = 20
+
+class ResumeRevision(models.Model):
+    """
+    One uploaded version of a resume: its whole file in S3 while it is
+    current, then the ordered digests of its chunks once superseded and
+    chunked by collect_resume_chunks
+    """
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='revisions')
+    number = models.PositiveIntegerField()
+    original_filename = models.CharField(max_length=MAX_FILENAME_LENGTH)
+    size = models.PositiveIntegerField()
+    sha256 = models.CharField(max_length=64, blank=True)  # Not known for presigned uploads until chunked
+    # Whole file, until the revision is chunked
+    s3_key = models.CharField(max_length=MAX_FILENAME_LENGTH, blank=True, db_index=True)
+    chunks = ArrayField(models.CharField(max_length=64), default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-number']
+        constraints = [
+            models.UniqueConstraint(fields=['resume', 'number'], name='unique_resume_revision_number'),
+        ]
+        indexes = [
+            # Finds the revisions still using a chunk
+            GinIndex(fields=['chunks'], name='resume_revision_chunks_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.resume_id} r{self.number}"
@@ -1,12 +1,23 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 class Skill(models.Model):
     name = models.CharField(max_length=100, unique=True)
+    # Number of profiles listing the skill, maintained on write and by reconcile_skill_usage
+    usage_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['name']
+        indexes = [
+            # Serves case-insensitive prefix/substring lookups (UPPER(name) LIKE ...)
+            # and trigram similarity search on UPPER(name)
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='skill_name_trgm_idx'),
+            # Serves most-used-first listings without counting profile links
+            models.Index(fields=['-usage_count', 'name'], name='skill_usage_idx'),
+        ]
         
     def __str__(self):
         return self.name
\ No newline at end of file
@@ -0,0 +1,20 @@
+from django.db import models
+from profiles.models.skill import Skill
+from profiles.utils.search.canonical import canonical_skill_key
+
+class SkillAlias(models.Model):
+    """Alternative spelling of a skill; stored as a canonical key"""
+    alias = models.CharField(max_length=100, unique=True)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['alias']
+        verbose_name_plural = "Skill aliases"
+
+    def __str__(self):
+        return f"{self.alias} -> {self.skill_id}"
+
+    def save(self, *args, **kwargs):
+        self.alias = canonical_skill_key(self.alias)
+        super().save(*args, **kwargs)
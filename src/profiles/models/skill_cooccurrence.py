@@ -0,0 +1,17 @@
+from django.db import models
+from profiles.models.skill import Skill
+
+class SkillCooccurrence(models.Model):
+    """Number of profiles listing both skills; one row per ordered pair that co-occurs at all"""
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='cooccurrences')
+    other = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='+')
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # Also serves lookups of every skill co-occurring with a given one
+            models.UniqueConstraint(fields=['skill', 'other'], name='skill_cooccurrence_pair'),
+        ]
+
+    def __str__(self):
+        return f"{self.skill_id} & {self.other_id}: {self.count}"
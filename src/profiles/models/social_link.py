@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import URLValidator
 from profiles.models import UserProfile
+from profiles.models.managers import ProfileOwnedQuerySet
 
 class SocialLink(models.Model):
     PLATFORM_CHOICES = [
@@ -14,6 +15,8 @@ class SocialLink(models.Model):
     platform = models.CharField(max_length=50, choices=PLATFORM_CHOICES)
     url = models.URLField(validators=[URLValidator()])
 
+    objects = ProfileOwnedQuerySet.as_manager()
+
     class Meta:
         unique_together = ['user_profile', 'platform']
     
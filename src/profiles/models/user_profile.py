@@ -1,5 +1,6 @@
 from django.db import models
 from profiles.models.custom_user import CustomUser
+from profiles.models.managers import UserProfileQuerySet
 from django.core.validators import EmailValidator
 
 class UserProfile(models.Model):
@@ -29,6 +30,11 @@ class UserProfile(models.Model):
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    
+    # Bumped on every write to the profile or any of its related rows
+    version = models.PositiveBigIntegerField(default=1, editable=False)
+
+    objects = UserProfileQuerySet.as_manager()
 
     class Meta:
         ordering = ['-created_at']
@@ -36,6 +42,17 @@ class UserProfile(models.Model):
     def __str__(self):
         return self.user.email
     
+    def save(self, *args, **kwargs):
+        """Save profile, bumping the version atomically instead of writing a stale in-memory value"""
+        if not self._state.adding:
+            self.version = models.F('version') + 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'version'}
+        super().save(*args, **kwargs)
+        if not isinstance(self.version, int):
+            self.refresh_from_db(fields=['version'])
+    
     @property
     def full_name(self):
         """Return user's full name from profile, fallback to user's name"""
@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from profiles.models import UserProfile
+from profiles.models.managers import ProfileOwnedQuerySet
 class WorkExperience(models.Model):
     EMPLOYMENT_TYPE_CHOICES = [
         ('Full-time', 'Full-time'),
@@ -40,6 +41,8 @@ class WorkExperience(models.Model):
     
     description = models.TextField()
     
+    objects = ProfileOwnedQuerySet.as_manager()
+
     class Meta:
         ordering = ['-start_year', '-start_month']
         verbose_name_plural = "Work Experience"
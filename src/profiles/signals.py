@@ -1,6 +1,35 @@
-from django.db.models.signals import post_save, post_migrate
+from django.db.models.signals import pre_save, post_save, post_delete, pre_delete, post_migrate, m2m_changed
+from functools import partial
+from django.db import transaction
 from django.dispatch import receiver
-from profiles.models import UserProfile, CustomUser
+from profiles.models import (
+    UserProfile,
+    CustomUser,
+    Education,
+    WorkExperience,
+    EqualEmploymentData,
+    SocialLink,
+    Skill,
+    Resume,
+    ResumeRevision,
+    SkillAlias,
+    ProfileChange,
+)
+from profiles.api.helpers.snapshot import schedule_snapshot_refresh, invalidate_profile_snapshots
+from profiles.api.helpers.profile_cache import invalidate_cached_profiles
+from profiles.api.helpers.changes import (
+    CHANGE_RESOURCE_BY_MODEL,
+    record_profile_changes,
+    record_change_for_profiles,
+)
+from profiles.api.helpers.typeahead import typeahead_registry
+from profiles.api.helpers.skill_canonical import skill_canonical_map
+from profiles.api.helpers.skill import adjust_skill_usage
+from profiles.api.helpers.skill_cooccurrence import update_skill_cooccurrence
+from profiles.api.helpers.s3_deletion import enqueue_s3_deletions
+from profiles.api.authentication import invalidate_cached_tokens
+from profiles.api.auth0 import user_cache as auth0_user_cache
+from rest_framework.authtoken.models import Token
 from django.apps import apps
 from profiles.utils.logger.logging_config import logger
 
@@ -36,3 +65,198 @@ def create_missing_profiles(sender, **kwargs):
                 
         except Exception as e:
             logger.error(f"Error in create_missing_profiles signal: {str(e)}")
+
+# Profile change tracking: version bumps, snapshot maintenance, change log and cache invalidation
+SNAPSHOT_SECTION_BY_MODEL = {
+    Education: 'education',
+    WorkExperience: 'work_experience',
+    EqualEmploymentData: 'equal_employment',
+    SocialLink: 'social_links',
+    Resume: 'default_resume',
+}
+
+def track_related_change(sender, instance, signal, **kwargs):
+    """Log the change, which bumps the profile version, and refresh the snapshot section backed by a related row"""
+    profile_id = instance.user_profile_id
+    action = 'delete' if signal is post_delete else 'upsert'
+    record_profile_changes(profile_id, CHANGE_RESOURCE_BY_MODEL[sender], [instance.id], action)
+    schedule_snapshot_refresh(profile_id, SNAPSHOT_SECTION_BY_MODEL[sender])
+    invalidate_cached_profiles([profile_id])
+
+for model in SNAPSHOT_SECTION_BY_MODEL:
+    post_save.connect(track_related_change, sender=model)
+    post_delete.connect(track_related_change, sender=model)
+
+@receiver(post_save, sender=UserProfile)
+def track_profile_change(sender, instance, **kwargs):
+    """Log the change and refresh the profile section of the snapshot when the profile is saved"""
+    record_profile_changes(instance.id, 'profile', [instance.id], 'upsert')
+    schedule_snapshot_refresh(instance.id, 'profile')
+    invalidate_cached_profiles([instance.id])
+
+@receiver(m2m_changed, sender=UserProfile.skills.through)
+def track_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Log changes, bumping versions, and refresh the skills section of the snapshot when profile skills change"""
+    change_action = 'delete' if action in ('post_remove', 'pre_clear') else 'upsert'
+    if not reverse:
+        if action == 'pre_clear':
+            record_profile_changes(instance.id, 'skill', instance.skills.values_list('id', flat=True), 'delete')
+        elif action in ('post_add', 'post_remove'):
+            record_profile_changes(instance.id, 'skill', pk_set, change_action)
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            schedule_snapshot_refresh(instance.id, 'skills')
+            invalidate_cached_profiles([instance.id])
+    elif action in ('post_add', 'post_remove'):
+        # Changed from the skill side, pk_set holds profile ids
+        record_change_for_profiles(pk_set, 'skill', instance.id, change_action)
+        for profile_id in pk_set:
+            schedule_snapshot_refresh(profile_id, 'skills')
+        invalidate_cached_profiles(pk_set)
+    elif action == 'pre_clear':
+        profile_ids = list(instance.userprofile_set.values_list('id', flat=True))
+        record_change_for_profiles(profile_ids, 'skill', instance.id, 'delete')
+        invalidate_profile_snapshots(user_profile_id__in=profile_ids)
+        invalidate_cached_profiles(profile_ids)
+
+@receiver(post_save, sender=Skill)
+@receiver(pre_delete, sender=Skill)
+def track_skill_change(sender, instance, signal, created=False, **kwargs):
+    """
+    Renaming or deleting a skill changes every profile listing it: log the
+    change, bumping their versions, and drop their snapshots so they rebuild on read
+    """
+    if created:
+        return
+    profile_ids = list(instance.userprofile_set.values_list('id', flat=True))
+    if not profile_ids:
+        return
+    action = 'delete' if signal is pre_delete else 'upsert'
+    record_change_for_profiles(profile_ids, 'skill', instance.id, action)
+    invalidate_profile_snapshots(user_profile_id__in=profile_ids)
+    invalidate_cached_profiles(profile_ids)
+
+@receiver(pre_delete, sender=UserProfile)
+def release_profile_skills(sender, instance, **kwargs):
+    """A deleted profile no longer counts towards the usage and co-occurrence of its skills"""
+    skill_ids = list(instance.skills.values_list('id', flat=True))
+    adjust_skill_usage(skill_ids, -1)
+    update_skill_cooccurrence(skill_ids, [])
+
+@receiver(post_delete, sender=UserProfile)
+def drop_cascade_changes(sender, instance, **kwargs):
+    """Drop entries logged for the profile's rows while the cascade deleted them"""
+    ProfileChange.objects.filter(user_profile_id=instance.id).delete()
+
+@receiver(post_delete, sender=Resume)
+def queue_resume_file_deletion(sender, instance, **kwargs):
+    """Queue the file of a deleted resume, including resumes removed by a profile cascade"""
+    if instance.file:
+        enqueue_s3_deletions([instance.file.name])
+
+@receiver(post_delete, sender=ResumeRevision)
+def queue_revision_file_deletion(sender, instance, **kwargs):
+    """Queue the whole file of a revision deleted before it was chunked"""
+    if instance.s3_key:
+        enqueue_s3_deletions([instance.s3_key])
+
+# Skill canonical map maintenance
+@receiver(post_save, sender=Skill)
+def update_canonical_skill(sender, instance, created, **kwargs):
+    """New skills claim their key if it is free; a rename may free or take over keys, so rebuild"""
+    if created:
+        skill_canonical_map.add(instance.name, instance.id)
+    else:
+        skill_canonical_map.mark_stale()
+
+@receiver(post_save, sender=SkillAlias)
+def update_canonical_alias(sender, instance, **kwargs):
+    skill_canonical_map.add(instance.alias, instance.skill_id, override=True)
+
+@receiver(post_delete, sender=Skill)
+@receiver(post_delete, sender=SkillAlias)
+def remove_canonical_key(sender, instance, **kwargs):
+    skill_canonical_map.mark_stale()
+
+# Typeahead index maintenance
+TYPEAHEAD_FIELDS = {
+    Skill: ('skills', 'name'),
+    Education: ('schools', 'school_name'),
+    WorkExperience: ('companies', 'company'),
+}
+
+@receiver(pre_save, sender=Skill)
+@receiver(pre_save, sender=Education)
+@receiver(pre_save, sender=WorkExperience)
+def stash_typeahead_value(sender, instance, **kwargs):
+    """Remember the value a row is indexed under before it changes"""
+    source, field = TYPEAHEAD_FIELDS[sender]
+    if instance.pk and typeahead_registry.is_loaded(source):
+        instance._typeahead_previous = sender.objects.filter(
+            pk=instance.pk
+        ).values_list(field, flat=True).first()
+
+@receiver(post_save, sender=Skill)
+@receiver(post_save, sender=Education)
+@receiver(post_save, sender=WorkExperience)
+def update_typeahead_value(sender, instance, created, **kwargs):
+    """Index new values and move renamed ones"""
+    source, field = TYPEAHEAD_FIELDS[sender]
+    value = getattr(instance, field)
+    previous = getattr(instance, '_typeahead_previous', None)
+    if sender is Skill:
+        if created:
+            typeahead_registry.apply(source, 'adjust', value, 0, payload=instance.id, keep_empty=True)
+        elif previous is not None and previous != value:
+            typeahead_registry.apply(source, 'rename_payload', instance.id, value)
+    elif created:
+        typeahead_registry.apply(source, 'adjust', value, 1)
+    elif previous is not None and previous != value:
+        typeahead_registry.apply(source, 'adjust', previous, -1)
+        typeahead_registry.apply(source, 'adjust', value, 1)
+
+@receiver(post_delete, sender=Skill)
+@receiver(post_delete, sender=Education)
+@receiver(post_delete, sender=WorkExperience)
+def remove_typeahead_value(sender, instance, **kwargs):
+    source, field = TYPEAHEAD_FIELDS[sender]
+    if sender is Skill:
+        typeahead_registry.apply(source, 'discard_payload', instance.id)
+    else:
+        typeahead_registry.apply(source, 'adjust', getattr(instance, field), -1)
+
+@receiver(m2m_changed, sender=UserProfile.skills.through)
+def update_skill_typeahead_weights(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep skill suggestion weights equal to the number of profiles using each skill"""
+    if not typeahead_registry.is_loaded('skills'):
+        return
+    if action in ('post_add', 'post_remove'):
+        delta = 1 if action == 'post_add' else -1
+        if reverse:
+            typeahead_registry.apply('skills', 'adjust_payload', instance.id, delta * len(pk_set))
+        else:
+            for skill_id in pk_set:
+                typeahead_registry.apply('skills', 'adjust_payload', skill_id, delta)
+    elif action == 'pre_clear':
+        if reverse:
+            typeahead_registry.apply('skills', 'adjust_payload', instance.id, -instance.userprofile_set.count())
+        else:
+            for skill_id in instance.skills.values_list('id', flat=True):
+                typeahead_registry.apply('skills', 'adjust_payload', skill_id, -1)
+
+# Token cache invalidation
+@receiver(post_delete, sender=Token)
+def revoke_cached_token(sender, instance, **kwargs):
+    """Stop accepting a revoked token as soon as the revocation commits"""
+    transaction.on_commit(partial(invalidate_cached_tokens, [instance.key]), robust=True)
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """Drop cached tokens of a user whose permissions or active status may have changed"""
+    try:
+        keys = list(Token.objects.filter(user_id=instance.id).values_list('key', flat=True))
+        if keys:
+            transaction.on_commit(partial(invalidate_cached_tokens, keys), robust=True)
+    except Exception as e:
+        logger.error(f"Error invalidating cached tokens for user {instance.id}: {str(e)}")
+    if instance.auth0_id:
+        transaction.on_commit(partial(auth0_user_cache.discard, instance.auth0_id), robust=True)
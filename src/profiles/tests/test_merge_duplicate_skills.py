@@ -0,0 +1,34 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from profiles.api.helpers.skill_cooccurrence import rebuild_skill_cooccurrence
+from profiles.models import CustomUser, Skill, SkillCooccurrence, UserProfile
+
+
+def cooccurrence_counts() -> dict:
+    return {
+        (skill_id, other_id): count
+        for skill_id, other_id, count in SkillCooccurrence.objects.values_list('skill_id', 'other_id', 'count')
+    }
+
+
+class MergeDuplicateSkillsTests(TestCase):
+    def _profile(self, email, *skills):
+        # Users get their profile from a signal
+        profile = UserProfile.objects.get(user=CustomUser.objects.create_user(email=email, password='x'))
+        profile.skills.add(*skills)
+        return profile
+
+    def test_merge_recounts_cooccurrence(self):
+        node, node_variant, react = (Skill.objects.create(name=name) for name in ('Node.js', 'NodeJS', 'React'))
+        self._profile('a@example.com', node, react)
+        self._profile('b@example.com', node_variant, react)
+        self._profile('c@example.com', node, node_variant)
+
+        call_command('merge_duplicate_skills', stdout=StringIO())
+
+        self.assertFalse(Skill.objects.filter(id=node_variant.id).exists())
+        merged = cooccurrence_counts()
+        self.assertEqual(merged, {(node.id, react.id): 2, (react.id, node.id): 2})
+        rebuild_skill_cooccurrence()
+        self.assertEqual(cooccurrence_counts(), merged)
@@ -0,0 +1,146 @@
+import io
+import os
+from datetime import timedelta
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from profiles.api.helpers.file_response import revision_file_response
+from profiles.api.helpers.resume import create_or_update_resume
+from profiles.api.helpers.resume_revision import (
+    chunk_superseded_revisions,
+    collect_resume_chunks,
+    store_chunks,
+)
+from profiles.api.helpers.s3_deletion import flush_s3_deletions
+from profiles.models import CustomUser, PendingS3Deletion, ResumeChunk, ResumeRevision, UserProfile
+from profiles.models.resume_chunk import CHUNK_KEY_PREFIX, chunk_s3_key
+from profiles.utils.storage.cdc import iter_chunks
+
+
+class FakeS3Client:
+    """In-memory stand-in for the few S3 calls the chunk store makes"""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = bytes(Body)
+
+    def get_object(self, Bucket, Key, **kwargs):
+        return {'Body': io.BytesIO(self.objects[Key])}
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete['Objects']:
+            self.objects.pop(obj['Key'], None)
+        return {}
+
+
+def patch_s3(test, s3):
+    for target in ('profiles.api.helpers.resume_revision.get_s3_client',
+                   'profiles.api.helpers.s3_deletion.get_s3_client',
+                   'profiles.api.helpers.file_response.get_s3_client',
+                   'profiles.utils.storage.resume_storage.get_s3_client'):
+        patcher = mock.patch(target, return_value=s3)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+
+
+class ChunkingTests(SimpleTestCase):
+    def test_chunks_reassemble_byte_for_byte(self):
+        content = os.urandom(300 * 1024)
+        chunks = list(iter_chunks(content))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b''.join(chunks), content)
+
+
+class ChunkCollectionTests(TestCase):
+    def setUp(self):
+        self.s3 = FakeS3Client()
+        patch_s3(self, self.s3)
+
+    def test_flush_keeps_chunk_stored_again_after_collection(self):
+        content = os.urandom(200 * 1024)
+        digests = store_chunks(content)
+        keys = {chunk_s3_key(digest) for digest in digests}
+
+        # No revision uses the chunks, so collection queues them
+        self.assertEqual(collect_resume_chunks(timedelta(0)), len(set(digests)))
+        self.assertEqual(set(PendingS3Deletion.objects.values_list('key', flat=True)), keys)
+
+        # A later upload with the same bytes stores them again
+        self.assertEqual(store_chunks(content), digests)
+        self.assertEqual(ResumeChunk.objects.count(), len(set(digests)))
+
+        flush_s3_deletions()
+        self.assertTrue(keys <= set(self.s3.objects))
+        self.assertFalse(PendingS3Deletion.objects.exists())
+
+    def test_flush_skips_chunk_rows_queued_before_reupload(self):
+        content = os.urandom(100 * 1024)
+        digests = store_chunks(content)
+        collect_resume_chunks(timedelta(0))
+
+        # The chunk rows came back without the queue being cleared, e.g. by an older writer
+        ResumeChunk.objects.bulk_create([ResumeChunk(digest=digest, size=1) for digest in set(digests)])
+        self.assertEqual(flush_s3_deletions(), (0, 0))
+        self.assertTrue({chunk_s3_key(digest) for digest in digests} <= set(self.s3.objects))
+
+    def test_flush_deletes_collected_chunks(self):
+        digests = store_chunks(os.urandom(100 * 1024))
+        collect_resume_chunks(timedelta(0))
+
+        deleted, failed = flush_s3_deletions()
+        self.assertEqual((deleted, failed), (len(set(digests)), 0))
+        self.assertFalse(self.s3.objects)
+
+
+class ResumeRevisionTests(TestCase):
+    def setUp(self):
+        self.s3 = FakeS3Client()
+        patch_s3(self, self.s3)
+        user = CustomUser.objects.create_user('revisions@example.com', password='x')
+        self.profile = UserProfile.objects.get(user=user)
+
+    def _upload(self, content):
+        return async_to_sync(create_or_update_resume)(self.profile, 'CV', SimpleUploadedFile('cv.pdf', content))
+
+    def _download(self, revision):
+        response = revision_file_response(RequestFactory().get('/'), revision)
+
+        async def read():
+            return b''.join([part async for part in response.streaming_content])
+
+        return async_to_sync(read)()
+
+    def _chunk_keys(self):
+        return {key for key in self.s3.objects if key.startswith(CHUNK_KEY_PREFIX)}
+
+    def test_uploads_are_stored_once_and_chunked_once_superseded(self):
+        first = os.urandom(300 * 1024)
+        resume = self._upload(first)
+        self.assertEqual(set(self.s3.objects), {resume.s3_key})
+
+        second = first[:150 * 1024] + os.urandom(1024) + first[150 * 1024:]
+        resume = self._upload(second)
+        old, current = ResumeRevision.objects.filter(resume=resume).order_by('number')
+        self.assertEqual(current.s3_key, resume.s3_key)
+        self.assertFalse(self._chunk_keys())
+
+        # Only the superseded revision is chunked, and its whole file queued for deletion
+        self.assertEqual(chunk_superseded_revisions(), 1)
+        old.refresh_from_db()
+        current.refresh_from_db()
+        self.assertEqual(old.s3_key, '')
+        self.assertEqual(self._chunk_keys(), {chunk_s3_key(digest) for digest in old.chunks})
+        self.assertEqual(current.s3_key, resume.s3_key)
+        self.assertTrue(PendingS3Deletion.objects.exists())
+
+        self.assertEqual(self._download(old), first)
+        self.assertEqual(self._download(current), second)
+
+        # Reassembled byte for byte once the whole file is gone
+        flush_s3_deletions()
+        self.assertEqual(set(self.s3.objects), self._chunk_keys() | {resume.s3_key})
+        self.assertEqual(self._download(old), first)
+        self.assertEqual(chunk_superseded_revisions(), 0)
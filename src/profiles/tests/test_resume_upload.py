@@ -0,0 +1,128 @@
+import hashlib
+from types import SimpleNamespace
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import MemoryFileUploadHandler
+from django.test import RequestFactory, SimpleTestCase
+from profiles.api.helpers.resume import discard_rejected_upload, store_upload
+from profiles.api.schemas.resume import MAX_FILE_SIZE
+from profiles.utils.storage.s3_upload_handler import (
+    DOC,
+    DOCX,
+    PDF,
+    TXT,
+    ResumeUploadHandler,
+    S3UploadedFile,
+    sniff_content_type,
+)
+
+PDF_BYTES = b'%PDF-1.7\n' + b'resume body ' * 1000
+
+
+class StubS3Client:
+    """Records the S3 calls an upload makes"""
+
+    def __init__(self):
+        self.objects = {}
+        self.calls = []
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.calls.append('put_object')
+        self.objects[Key] = (bytes(Body), kwargs.get('ContentType'))
+
+
+class SniffContentTypeTests(SimpleTestCase):
+    def test_detects_documents_by_magic_bytes(self):
+        self.assertEqual(sniff_content_type(b'%PDF-1.4 ...'), PDF)
+        self.assertEqual(sniff_content_type(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1rest'), DOC)
+        self.assertEqual(sniff_content_type(b'PK\x03\x04rest'), DOCX)
+
+    def test_detects_text(self):
+        self.assertEqual(sniff_content_type('Résumé'.encode()), TXT)
+        # A multi-byte character cut off at the end of the sniffed bytes
+        self.assertEqual(sniff_content_type('Résumé'.encode()[:2]), TXT)
+
+    def test_rejects_binary(self):
+        self.assertIsNone(sniff_content_type(b'MZ\x90\x00\x03'))
+        self.assertIsNone(sniff_content_type(b'\xff\xfe\xfd invalid utf-8 in the middle'))
+
+
+class ResumeUploadHandlerTests(SimpleTestCase):
+    def setUp(self):
+        self.s3 = StubS3Client()
+        patcher = mock.patch('profiles.utils.storage.resume_storage.get_s3_client', return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _parse(self, path, content, authenticated=True, name='resume.pdf'):
+        request = RequestFactory().post(path, {'file': SimpleUploadedFile(name, content)})
+        request.auth = object() if authenticated else None
+        request.upload_handlers = [ResumeUploadHandler(request)]
+        return request.FILES['file']
+
+    def test_buffers_hashes_and_sniffs_without_calling_s3(self):
+        file = self._parse('/v1/profiles/7/resumes', PDF_BYTES)
+
+        self.assertIsInstance(file, S3UploadedFile)
+        self.assertEqual(file.content, PDF_BYTES)
+        self.assertEqual(file.size, len(PDF_BYTES))
+        self.assertEqual(file.sniffed_content_type, PDF)
+        self.assertEqual(file.sha256, hashlib.sha256(PDF_BYTES).hexdigest())
+        self.assertTrue(file.s3_key.startswith('user_7/'))
+        self.assertFalse(file.stored)
+        self.assertEqual(self.s3.calls, [])
+
+    def test_drops_content_of_oversized_uploads(self):
+        file = self._parse('/v1/profiles/7/resumes', b'%PDF-' + b'x' * MAX_FILE_SIZE)
+
+        self.assertIsNone(file.content)
+        self.assertIsNone(file.s3_key)
+        self.assertGreater(file.size, MAX_FILE_SIZE)
+        self.assertEqual(self.s3.calls, [])
+
+    def test_passes_through_other_requests(self):
+        for path, authenticated in (('/v1/profiles/7/resumes', False), ('/v1/profiles/7/avatar', True)):
+            request = RequestFactory().post(path, {'file': SimpleUploadedFile('resume.pdf', PDF_BYTES)})
+            request.auth = object() if authenticated else None
+            request.upload_handlers = [ResumeUploadHandler(request), MemoryFileUploadHandler(request)]
+            self.assertNotIsInstance(request.FILES['file'], S3UploadedFile)
+
+
+class StoreUploadTests(SimpleTestCase):
+    def setUp(self):
+        self.s3 = StubS3Client()
+        self.storage = SimpleNamespace(client=self.s3, bucket_name='resumes')
+
+    def _file(self, content=PDF_BYTES):
+        return S3UploadedFile(self.storage, 'user_7/resume_1234abcd.pdf', 'resume.pdf', 'application/pdf',
+                              len(content), sniffed_content_type=PDF, content=content)
+
+    def test_store_puts_held_content_once(self):
+        file = self._file()
+        async_to_sync(store_upload)(file, file.s3_key, file.content)
+        async_to_sync(store_upload)(file, file.s3_key, file.content)
+
+        self.assertEqual(self.s3.calls, ['put_object'])
+        self.assertEqual(self.s3.objects[file.s3_key], (PDF_BYTES, PDF))
+        self.assertTrue(file.stored)
+
+    def test_presigned_uploads_are_not_put_again(self):
+        file = S3UploadedFile(self.storage, 'user_7/resume_1234abcd.pdf', 'resume.pdf', 'application/pdf',
+                              len(PDF_BYTES), sniffed_content_type=PDF)
+        file.store()
+        self.assertEqual(self.s3.calls, [])
+
+    def test_discard_queues_only_stored_objects(self):
+        with mock.patch('profiles.api.helpers.resume.enqueue_s3_deletions') as enqueue:
+            file = self._file()
+            async_to_sync(discard_rejected_upload)(file)
+            enqueue.assert_not_called()
+            self.assertIsNone(file.content)
+
+            file = self._file()
+            async_to_sync(store_upload)(file, file.s3_key, file.content)
+            async_to_sync(discard_rejected_upload)(file)
+            enqueue.assert_called_once_with(['user_7/resume_1234abcd.pdf'])
+            self.assertIsNone(file.s3_key)
+        self.assertEqual(self.s3.calls, ['put_object'])
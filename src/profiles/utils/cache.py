@@ -0,0 +1,11 @@
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+
+# Backends whose entries other app servers (or other worker processes) cannot see
+PROCESS_LOCAL_BACKENDS = (LocMemCache, FileBasedCache)
+
+
+def is_shared_cache(cache: BaseCache) -> bool:
+    """Whether a delete on this cache is seen by every worker, e.g. Redis or memcached"""
+    return not isinstance(cache, PROCESS_LOCAL_BACKENDS)
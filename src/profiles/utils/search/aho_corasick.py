@@ -0,0 +1,71 @@
+from collections import deque
+from typing import Any, Hashable, Iterator, List, Sequence, Tuple
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over sequences of hashable symbols (characters,
+    tokens, ...). Finds every occurrence of every added pattern in a single
+    left-to-right pass, however many patterns there are.
+    """
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._patterns = 0
+        self._compiled = False
+
+    def __len__(self):
+        return self._patterns
+
+    def add(self, symbols: Sequence[Hashable], value: Any) -> None:
+        """Add a pattern, reported with value whenever it occurs"""
+        if not symbols:
+            return
+        state = 0
+        for symbol in symbols:
+            next_state = self._goto[state].get(symbol)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][symbol] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((len(symbols), value))
+        self._patterns += 1
+        self._compiled = False
+
+    def compile(self) -> None:
+        """Compute failure links; must be called after the last add()"""
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for symbol, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and symbol not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(symbol, 0)
+                # A state also reports the patterns ending at its longest proper suffix
+                self._out[next_state].extend(self._out[self._fail[next_state]])
+        self._compiled = True
+
+    def iter_matches(self, symbols: Sequence[Hashable]) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (start, end, value) for every pattern occurrence, in order of end position"""
+        if not self._compiled:
+            raise RuntimeError("AhoCorasick.compile() must be called before matching")
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for end, symbol in enumerate(symbols, 1):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for length, value in out[state]:
+                yield end - length, end, value
+
+    def find_all(self, symbols: Sequence[Hashable]) -> List[Tuple[int, int, Any]]:
+        return list(self.iter_matches(symbols))
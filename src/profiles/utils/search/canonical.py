@@ -0,0 +1,14 @@
+import unicodedata
+
+# Symbols that distinguish skills ("C", "C++", "C#") and survive normalization
+_KEPT_SYMBOLS = '+#'
+
+
+def canonical_skill_key(name: str) -> str:
+    """
+    Key under which spelling variants of a skill collide: Unicode-normalized,
+    case-folded, with punctuation and whitespace removed.
+    "NodeJS", "node.js" and "Node JS" all become "nodejs".
+    """
+    folded = unicodedata.normalize('NFKC', name).casefold()
+    return ''.join(ch for ch in folded if ch.isalnum() or ch in _KEPT_SYMBOLS)
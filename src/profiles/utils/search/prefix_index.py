@@ -0,0 +1,159 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Iterable, List, Optional, Tuple
+
+# Sorts after every character, so [prefix, prefix + _MAX_CHAR) spans all keys starting with prefix
+_MAX_CHAR = '\U0010ffff'
+
+
+def normalize_key(value: str) -> str:
+    """Case- and whitespace-insensitive form of a value used for prefix matching"""
+    return ' '.join(value.casefold().split())
+
+
+class PrefixIndex:
+    """
+    In-memory typeahead index: a sorted array of normalized keys searched with
+    bisect, each carrying a display value, a weight and an optional payload.
+    Lookups return the heaviest matches. Top-k lists for short prefixes, whose
+    ranges are too large to scan per keystroke, are precomputed and kept up to
+    date on writes.
+    """
+
+    def __init__(self, top_k: int = 10, precomputed_length: int = 2):
+        self.top_k = top_k
+        self.precomputed_length = precomputed_length
+        self._lock = threading.Lock()
+        self._keys = []
+        self._entries = {}
+        self._payload_keys = {}
+        self._top = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _rank(self, key: str):
+        return -self._entries[key][1], key
+
+    def _short_prefixes(self, key: str):
+        return [key[:length] for length in range(1, min(len(key), self.precomputed_length) + 1)]
+
+    def _scan(self, prefix: str, limit: int) -> List[str]:
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + _MAX_CHAR, lo)
+        return heapq.nsmallest(limit, self._keys[lo:hi], key=self._rank)
+
+    def build(self, items: Iterable[Tuple[str, int, Any]]) -> None:
+        """Replace the index contents with (display value, weight, payload) items"""
+        entries = {}
+        payload_keys = {}
+        for display, weight, payload in items:
+            key = normalize_key(display)
+            if not key:
+                continue
+            if key in entries:
+                # Values differing only in case/spacing share one entry
+                entries[key][1] += weight
+            else:
+                entries[key] = [display, weight, payload]
+                if payload is not None:
+                    payload_keys[payload] = key
+
+        grouped = {}
+        for key in entries:
+            for prefix in self._short_prefixes(key):
+                grouped.setdefault(prefix, []).append(key)
+        rank = lambda key: (-entries[key][1], key)
+        top = {prefix: heapq.nsmallest(self.top_k, keys, key=rank) for prefix, keys in grouped.items()}
+
+        keys = sorted(entries)
+        with self._lock:
+            self._keys, self._entries, self._payload_keys, self._top = keys, entries, payload_keys, top
+
+    def lookup(self, prefix: str, limit: Optional[int] = None) -> List[Tuple[str, int, Any]]:
+        """Heaviest (display value, weight, payload) entries whose key starts with the prefix"""
+        prefix = normalize_key(prefix)
+        limit = min(limit or self.top_k, self.top_k)
+        if not prefix:
+            return []
+        with self._lock:
+            if len(prefix) <= self.precomputed_length:
+                keys = self._top.get(prefix, [])[:limit]
+            else:
+                keys = self._scan(prefix, limit)
+            return [tuple(self._entries[key]) for key in keys]
+
+    def _refresh_top(self, key: str, grew: bool = False) -> None:
+        """Bring the precomputed top-k lists for a changed key up to date"""
+        entry = self._entries.get(key)
+        for prefix in self._short_prefixes(key):
+            top = self._top.get(prefix, [])
+            if key in top and entry is not None and grew:
+                top.sort(key=self._rank)
+            elif key in top:
+                # The key may have dropped below entries outside the list
+                self._top[prefix] = self._scan(prefix, self.top_k)
+            elif entry is not None and (len(top) < self.top_k or self._rank(key) < self._rank(top[-1])):
+                top.append(key)
+                top.sort(key=self._rank)
+                self._top[prefix] = top[:self.top_k]
+
+    def adjust(self, display: str, delta: int, payload: Any = None, keep_empty: bool = False) -> None:
+        """
+        Add delta to a value's weight, inserting it if missing. Values whose weight
+        drops to zero are removed unless keep_empty is set.
+        """
+        key = normalize_key(display)
+        if not key:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if delta <= 0 and not keep_empty:
+                    return
+                self._entries[key] = [display, max(delta, 0), payload]
+                insort(self._keys, key)
+                if payload is not None:
+                    self._payload_keys[payload] = key
+            else:
+                entry[1] = max(entry[1] + delta, 0)
+                if entry[1] == 0 and not keep_empty:
+                    self._remove(key)
+            self._refresh_top(key, grew=delta > 0)
+
+    def adjust_payload(self, payload: Any, delta: int) -> None:
+        """Add delta to the weight of the entry carrying a payload, keeping it even at zero"""
+        with self._lock:
+            key = self._payload_keys.get(payload)
+            if key is None:
+                return
+            self._entries[key][1] = max(self._entries[key][1] + delta, 0)
+            self._refresh_top(key, grew=delta > 0)
+
+    def discard_payload(self, payload: Any) -> None:
+        """Remove the entry carrying a payload"""
+        with self._lock:
+            key = self._payload_keys.get(payload)
+            if key is not None:
+                self._remove(key)
+                self._refresh_top(key)
+
+    def rename_payload(self, payload: Any, display: str) -> None:
+        """Move the entry carrying a payload to a new display value, keeping its weight"""
+        with self._lock:
+            old_key = self._payload_keys.get(payload)
+            if old_key is None:
+                return
+            weight = self._entries[old_key][1]
+            self._remove(old_key)
+            self._refresh_top(old_key)
+        self.adjust(display, weight, payload=payload, keep_empty=True)
+
+    def _remove(self, key: str) -> None:
+        display, weight, payload = self._entries.pop(key)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+        if payload is not None and self._payload_keys.get(payload) == key:
+            del self._payload_keys[payload]
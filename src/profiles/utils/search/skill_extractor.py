@@ -0,0 +1,73 @@
+import re
+import unicodedata
+from typing import Iterable, List, Set, Tuple
+from profiles.utils.search.aho_corasick import AhoCorasick
+
+# Words, keeping the symbols that tell skills apart ("c++", "c#")
+_WORD = re.compile(r"[^\W_]+[+#]*")
+
+# Names this short ("Go", "R") only match text written as the name or in capitals
+_SHORT_NAME_LENGTH = 2
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(unicodedata.normalize('NFKC', text))
+
+
+class SkillExtractor:
+    """
+    Finds skill names and aliases in free text with one Aho-Corasick automaton
+    over case-folded words, so a text is scanned once however many skills
+    exist. Multi-word names also match written as one word ("Node.js",
+    "Node JS" and "NodeJS"). Overlapping matches resolve to the longest.
+    """
+
+    def __init__(self, names: Iterable[Tuple[str, int]]):
+        """names: (skill name or alias, skill id) pairs"""
+        self._automaton = AhoCorasick()
+        self._exact_case = {}
+        for name, skill_id in names:
+            tokens = tokenize(name)
+            if not tokens:
+                continue
+            folded = [token.casefold() for token in tokens]
+            if len(tokens) == 1 and len(tokens[0]) <= _SHORT_NAME_LENGTH:
+                self._exact_case.setdefault((folded[0], skill_id), set()).update((tokens[0], tokens[0].upper()))
+            self._automaton.add(folded, skill_id)
+            if len(tokens) > 1:
+                self._automaton.add([''.join(folded)], skill_id)
+        self._automaton.compile()
+
+    def __len__(self):
+        return len(self._automaton)
+
+    def extract(self, text: str) -> List[int]:
+        """Ids of the skills mentioned in the text, in order of first mention"""
+        tokens = tokenize(text)
+        folded = [token.casefold() for token in tokens]
+
+        matches = []
+        for start, end, skill_id in self._automaton.iter_matches(folded):
+            spellings = self._exact_case.get((folded[start], skill_id)) if end - start == 1 else None
+            if spellings is not None and tokens[start] not in spellings:
+                continue
+            matches.append((start, end, skill_id))
+
+        # Leftmost-longest: "Machine Learning" wins over "Learning" inside it
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        found, seen, covered_until = [], set(), 0
+        for start, end, skill_id in matches:
+            if start < covered_until:
+                continue
+            covered_until = end
+            if skill_id not in seen:
+                seen.add(skill_id)
+                found.append(skill_id)
+        return found
+
+    def extract_many(self, texts: Iterable[str]) -> List[List[int]]:
+        return [self.extract(text) for text in texts]
+
+    def extract_set(self, texts: Iterable[str]) -> Set[int]:
+        """Ids of the skills mentioned anywhere in the texts"""
+        return {skill_id for text in texts for skill_id in self.extract(text)}
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Callable, Optional
+import boto3
+from botocore.config import Config
+from django.conf import settings
+from profiles.utils.logger.logging_config import logger
+
+# Chunk size when streaming a file body to the client
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_client = None
+_executor = None
+_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    Process-wide S3 client. boto3 clients are thread-safe, so every storage
+    call in the process shares its pool of AWS_S3_MAX_POOL_CONNECTIONS
+    connections instead of each thread opening its own.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                session = boto3.session.Session(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                )
+                _client = session.client(
+                    's3',
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+                    verify=settings.AWS_S3_VERIFY,
+                    config=Config(
+                        signature_version=settings.AWS_S3_SIGNATURE_VERSION,
+                        max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+                        retries={'mode': 'standard'},
+                    ),
+                )
+                logger.info(f"Created shared S3 client with {settings.AWS_S3_MAX_POOL_CONNECTIONS} pooled connections")
+    return _client
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    """
+    Threads blocking storage calls run on, one per pooled connection. Keeps
+    file I/O off the thread async views run sync code on, and bounds how many
+    calls wait on S3 at once.
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+                    thread_name_prefix='storage-io'
+                )
+    return _executor
+
+
+async def run_storage_io(func: Callable, *args, **kwargs):
+    """Await a blocking storage call on the storage executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_storage_executor(), partial(func, *args, **kwargs))
+
+
+async def aiter_reads(read: Callable[[int], bytes], length: Optional[int] = None,
+                      close: Optional[Callable[[], None]] = None,
+                      chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Stream a blocking reader (an S3 body, an open file) as an async iterator,
+    each read running on the storage executor. Stops after length bytes if given.
+    """
+    try:
+        while length is None or length > 0:
+            size = chunk_size if length is None else min(chunk_size, length)
+            chunk = await run_storage_io(read, size)
+            if not chunk:
+                break
+            if length is not None:
+                length -= len(chunk)
+            yield chunk
+    finally:
+        if close is not None:
+            await run_storage_io(close)
@@ -0,0 +1,61 @@
+import hashlib
+from typing import Iterator, List, Tuple
+
+# Chunk sizes for resumes: a typical 100-500 KB file splits into a handful of chunks
+MIN_CHUNK_SIZE = 16 * 1024
+AVG_CHUNK_SIZE = 32 * 1024
+MAX_CHUNK_SIZE = 128 * 1024
+
+_MASK_64 = (1 << 64) - 1
+
+# Gear table derived from a fixed seed; boundaries must not change between processes or releases
+GEAR = [int.from_bytes(hashlib.sha256(b'resume-cdc-%d' % i).digest()[:8], 'big') for i in range(256)]
+
+
+def _top_bits_mask(bits: int) -> int:
+    # The gear hash shifts left, so its top bits depend on the most recent bytes
+    return ((1 << bits) - 1) << (64 - bits)
+
+
+def _cut_point(data: bytes, start: int, end: int, min_size: int, avg_size: int, max_size: int,
+               mask_small: int, mask_large: int) -> int:
+    remaining = end - start
+    if remaining <= min_size:
+        return end
+    stop = start + min(max_size, remaining)
+    normal = start + min(avg_size, remaining)
+    gear, h, i = GEAR, 0, start + min_size
+
+    # A harder condition before the average size and an easier one after keeps sizes close to it
+    while i < normal:
+        h = ((h << 1) + gear[data[i]]) & _MASK_64
+        if not h & mask_small:
+            return i + 1
+        i += 1
+    while i < stop:
+        h = ((h << 1) + gear[data[i]]) & _MASK_64
+        if not h & mask_large:
+            return i + 1
+        i += 1
+    return stop
+
+
+def iter_chunks(data: bytes, min_size: int = MIN_CHUNK_SIZE, avg_size: int = AVG_CHUNK_SIZE,
+                max_size: int = MAX_CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Split content into content-defined chunks with FastCDC's gear hash.
+    Boundaries depend on the bytes around them rather than on offsets, so an
+    edit only changes the chunks it touches and the rest deduplicate.
+    """
+    bits = avg_size.bit_length() - 1
+    mask_small, mask_large = _top_bits_mask(bits + 2), _top_bits_mask(bits - 2)
+    view, start, end = memoryview(data), 0, len(data)
+    while start < end:
+        cut = _cut_point(data, start, end, min_size, avg_size, max_size, mask_small, mask_large)
+        yield view[start:cut]
+        start = cut
+
+
+def chunk_digests(data: bytes) -> List[Tuple[str, memoryview]]:
+    """(SHA-256 hex digest, bytes) of each chunk, in order"""
+    return [(hashlib.sha256(chunk).hexdigest(), chunk) for chunk in iter_chunks(data)]
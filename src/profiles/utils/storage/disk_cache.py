@@ -0,0 +1,123 @@
+import fcntl
+import hashlib
+import os
+import tempfile
+import time
+from typing import Callable, Iterable, Optional
+from profiles.utils.logger.logging_config import logger
+
+# Evict down to this fraction of the cap, so eviction does not run on every fill
+EVICTION_TARGET = 0.9
+# Temporary files left behind by a crashed fill are removed after this many seconds
+STALE_TEMP_SECONDS = 60 * 60
+
+
+class DiskCache:
+    """
+    Read-through LRU cache of immutable objects on local disk, shared by every
+    worker process on the box. Entries are written to a temporary file and
+    renamed into place, so readers only ever see complete files, and a file
+    evicted while open stays readable until closed. A file's atime records its
+    last use for LRU and its mtime the object's Last-Modified.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = str(directory)
+        self.max_bytes = max_bytes
+        self._lock_path = os.path.join(self.directory, '.evict.lock')
+
+    def path_for(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of a cached object, marking it used, or None on a miss"""
+        path = self.path_for(key)
+        try:
+            stat = os.stat(path)
+            os.utime(path, (time.time(), stat.st_mtime))
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, chunks: Iterable[bytes], last_modified: Optional[float] = None) -> str:
+        """Store an object from its chunks and return its path"""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as temp:
+                for chunk in chunks:
+                    temp.write(chunk)
+            os.utime(temp_path, (time.time(), last_modified or time.time()))
+            # Another process filling the same key writes identical bytes; either rename wins
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self.evict()
+        return path
+
+    def fetch(self, key: str, load: Callable[[], tuple]) -> str:
+        """
+        Path of a cached object, filling it on a miss from load(), which
+        returns (chunks, last modified timestamp)
+        """
+        path = self.get(key)
+        if path is None:
+            chunks, last_modified = load()
+            path = self.put(key, chunks, last_modified)
+        return path
+
+    def discard(self, key: str) -> None:
+        try:
+            os.unlink(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> int:
+        """Remove least recently used entries once the cache exceeds its cap; returns bytes freed"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._lock_path, 'a') as lock:
+            try:
+                # One process evicts at a time; the others skip rather than wait
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0
+            try:
+                return self._evict()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _evict(self) -> int:
+        entries, total, now = [], 0, time.time()
+        for root, _, files in os.walk(self.directory):
+            for file_name in files:
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                    if file_name.startswith('.tmp-') and now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        os.unlink(path)
+                except FileNotFoundError:
+                    continue
+                if file_name.startswith('.'):
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return 0
+
+        freed, target = 0, total - int(self.max_bytes * EVICTION_TARGET)
+        for _, size, path in sorted(entries):
+            if freed >= target:
+                break
+            try:
+                os.unlink(path)
+                freed += size
+            except FileNotFoundError:
+                pass
+        logger.info(f"Evicted {freed} bytes from disk cache {self.directory}")
+        return freed
@@ -1,9 +1,42 @@
+import mimetypes
+import threading
+from typing import AsyncIterator, Optional
+from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
 from storages.backends.s3boto3 import S3Boto3Storage
+from profiles.utils.storage.async_storage import aiter_reads, get_s3_client, run_storage_io
+from profiles.utils.storage.disk_cache import DiskCache
 from profiles.utils.logger.logging_config import logger
 
+_resume_cache = None
+_resume_cache_lock = threading.Lock()
+
+
+def get_resume_cache() -> Optional[DiskCache]:
+    """The on-disk cache in front of ResumeStorage, or None if RESUME_CACHE_DIR is unset"""
+    global _resume_cache
+    if not settings.RESUME_CACHE_DIR:
+        return None
+    if _resume_cache is None:
+        with _resume_cache_lock:
+            if _resume_cache is None:
+                _resume_cache = DiskCache(settings.RESUME_CACHE_DIR, settings.RESUME_CACHE_MAX_BYTES)
+    return _resume_cache
+
+
 class ResumeStorage(S3Boto3Storage):
+    """
+    Resume files in S3, read through the local disk cache. Every call goes
+    through the process-wide pooled client; the a-prefixed methods run them
+    on the bounded storage executor for async views.
+    """
     bucket_name = settings.AWS_STORAGE_BUCKET_NAME
+
+    @property
+    def client(self):
+        return get_s3_client()
     
     def _save(self, name, content):
         """Called when resume.file = file is executed"""
@@ -18,16 +51,18 @@ class ResumeStorage(S3Boto3Storage):
                 s3_key = instance.s3_key
                 logger.info(f"Using pre-generated S3 key: {s3_key}")
                 
-                # Delete old file if updating
-                if instance.pk and instance.s3_key:
-                    logger.info(f"Deleting old file: {instance.s3_key}")
-                    self.delete(instance.s3_key)
-                
-                # Upload to S3 using parent class
+                # Upload to S3 over the shared client
                 logger.debug(f"Uploading file to S3, size: {content.size} bytes")
-                uploaded_s3_key = super()._save(s3_key, content)
-                logger.info(f"File uploaded successfully to: {uploaded_s3_key}")
-                return uploaded_s3_key
+                content_type, _ = mimetypes.guess_type(s3_key)
+                content.seek(0)
+                self.client.upload_fileobj(
+                    content,
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs={'ContentType': content_type or 'application/octet-stream'}
+                )
+                logger.info(f"File uploaded successfully to: {s3_key}")
+                return s3_key
                 
             except Exception as e:
                 logger.error(f"S3 Upload Error: {str(e)}")
@@ -35,12 +70,90 @@ class ResumeStorage(S3Boto3Storage):
     
         return name
             
+    def cached_path(self, name) -> Optional[str]:
+        """
+        Local path of a file through the disk cache, downloading it whole on a
+        miss. Keys are never overwritten (AWS_S3_FILE_OVERWRITE is off), so
+        cached copies never go stale.
+        """
+        cache = get_resume_cache()
+        if cache is None:
+            return None
+
+        def load():
+            obj = self.get_object(name)
+            logger.info(f"Caching file from S3 on local disk: {name}")
+            return obj['Body'].iter_chunks(), obj['LastModified'].timestamp()
+
+        return cache.fetch(name, load)
+
+    def _open(self, name, mode='rb'):
+        """Read files through the disk cache when it is enabled"""
+        if mode not in ('r', 'rb'):
+            return super()._open(name, mode)
+        path = self.cached_path(name)
+        if path is None:
+            return ContentFile(self.get_object(name)['Body'].read(), name)
+        return File(open(path, mode), name)
+
+    def exists(self, name):
+        try:
+            self.head(name)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def get_object(self, name, byte_range=None, if_unmodified_since=None):
+        """
+        GET a file straight from S3, streaming its body. byte_range is a single
+        "bytes=first-last" range, resolved by S3 into a partial response.
+        """
+        params = {'Bucket': self.bucket_name, 'Key': name}
+        if byte_range:
+            params['Range'] = byte_range
+        if if_unmodified_since:
+            params['IfUnmodifiedSince'] = if_unmodified_since
+        logger.debug(f"Fetching file from S3: {name} {byte_range or ''}")
+        return self.client.get_object(**params)
+
+    def head(self, name):
+        """Metadata of a stored file, e.g. its ContentLength"""
+        return self.client.head_object(Bucket=self.bucket_name, Key=name)
+
     def delete(self, name):
         """Delete the specified file from storage."""
         logger.info(f"Deleting file from S3: {name}")
+        cache = get_resume_cache()
+        if cache is not None:
+            cache.discard(name)
         try:
-            self.bucket.Object(name).delete()
+            self.client.delete_object(Bucket=self.bucket_name, Key=name)
             logger.info(f"Successfully deleted file: {name}")
         except Exception as e:
             logger.error(f"Error deleting file {name}: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def aopen(self, name, mode='rb'):
+        return await run_storage_io(self.open, name, mode)
+
+    async def asave(self, name, content):
+        return await run_storage_io(self.save, name, content)
+
+    async def adelete(self, name):
+        return await run_storage_io(self.delete, name)
+
+    async def ahead(self, name):
+        return await run_storage_io(self.head, name)
+
+    async def aget_object(self, name, byte_range=None, if_unmodified_since=None):
+        return await run_storage_io(self.get_object, name, byte_range, if_unmodified_since)
+
+    async def acached_path(self, name) -> Optional[str]:
+        return await run_storage_io(self.cached_path, name)
+
+    def astream(self, obj, length: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream the body of an aget_object response without holding a thread between chunks"""
+        body = obj['Body']
+        return aiter_reads(body.read, length, close=body.close)
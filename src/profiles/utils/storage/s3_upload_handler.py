@@ -0,0 +1,206 @@
+import hashlib
+import os
+import re
+from typing import Optional
+from uuid import uuid4
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from profiles.utils.validators.text import sanitize_text
+from profiles.utils.logger.logging_config import logger
+
+# Requests whose "file" field is buffered for S3
+RESUME_UPLOAD_PATH = re.compile(r"/v1/profiles/(?P<profile_id>\d+)/resumes/?$")
+RESUME_UPLOAD_FIELD = 'file'
+
+PDF = 'application/pdf'
+DOC = 'application/msword'
+DOCX = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+TXT = 'text/plain'
+
+# Content type each allowed resume extension must sniff as
+EXTENSION_CONTENT_TYPES = {'.pdf': PDF, '.doc': DOC, '.docx': DOCX, '.txt': TXT}
+
+MAGIC_BYTES = [
+    (b'%PDF-', PDF),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', DOC),  # OLE2 compound document
+    (b'PK\x03\x04', DOCX),  # Office Open XML is a zip archive
+]
+
+
+def sniff_content_type(head: bytes) -> Optional[str]:
+    """Detect a resume's content type from its first bytes, regardless of its name"""
+    for magic, content_type in MAGIC_BYTES:
+        if head.startswith(magic):
+            return content_type
+    if b'\x00' in head:
+        return None
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A multi-byte character may be cut at the end of the sniffed bytes
+        if e.start < len(head) - 3:
+            return None
+    return TXT
+
+
+def generate_upload_s3_key(profile_id: int, file_name: str) -> str:
+    """S3 key for an uploaded resume file; the title is not known yet when the file starts arriving"""
+    stem, ext = os.path.splitext(file_name.lower())
+    return f"user_{profile_id}/{sanitize_text(stem)}_{str(uuid4())[:8]}{ext}"
+
+
+class BufferedUpload:
+    """
+    Holds an upload in memory while it is parsed, hashing it and keeping its
+    first bytes for sniffing. Stops holding bytes past max_size but keeps
+    counting, so the size can be reported.
+    """
+
+    def __init__(self, key: str, max_size: int):
+        self.key = key
+        self.max_size = max_size
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+        self.head = b''
+        self.too_large = False
+        self._chunks = []
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return sniff_content_type(self.head)
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.too_large:
+            return
+        if self.size > self.max_size:
+            self.too_large = True
+            self._chunks = []
+            return
+
+        if len(self.head) < 2048:
+            self.head += chunk[:2048 - len(self.head)]
+        self.sha256.update(chunk)
+        self._chunks.append(chunk)
+
+    @property
+    def content(self) -> Optional[bytes]:
+        return None if self.too_large else b''.join(self._chunks)
+
+    def clear(self) -> None:
+        self._chunks = []
+
+
+class S3UploadedFile(UploadedFile):
+    """
+    A resume bound for S3 under s3_key, parsed by ResumeUploadHandler or put
+    by the client through a presigned URL. Carries its size, SHA-256 (if
+    known) and sniffed content type. Parsed uploads keep their content until
+    store() puts it, which views run off the event loop; presigned ones are
+    already stored.
+    """
+
+    def __init__(self, storage, s3_key: Optional[str], name, content_type, size: int,
+                 sha256: str = '', sniffed_content_type: Optional[str] = None, charset=None,
+                 content_type_extra=None, content: Optional[bytes] = None):
+        super().__init__(None, name, content_type, size, charset, content_type_extra)
+        self.s3_key = s3_key
+        self.sha256 = sha256
+        self.sniffed_content_type = sniffed_content_type
+        self.content = content
+        self.stored = content is None
+        self._storage = storage
+
+    def store(self) -> None:
+        """Put held content in S3 under s3_key; blocking, so not for the event loop"""
+        if self.stored or not self.s3_key:
+            return
+        self._storage.client.put_object(
+            Bucket=self._storage.bucket_name,
+            Key=self.s3_key,
+            Body=self.content,
+            ContentType=self.sniffed_content_type or 'application/octet-stream'
+        )
+        self.stored = True
+        logger.info(f"Stored {self.size} bytes in S3: {self.s3_key}")
+
+    @classmethod
+    def from_upload(cls, storage, upload: BufferedUpload, name, content_type, charset=None, content_type_extra=None):
+        return cls(
+            storage,
+            None if upload.too_large else upload.key,
+            name,
+            content_type,
+            upload.size,
+            sha256=upload.sha256.hexdigest(),
+            sniffed_content_type=upload.content_type,
+            charset=charset,
+            content_type_extra=content_type_extra,
+            content=upload.content
+        )
+
+    def open(self, mode=None):
+        raise ValueError("Resume uploads are bound for S3 and cannot be reopened")
+
+    def close(self):
+        pass
+
+
+class ResumeUploadHandler(FileUploadHandler):
+    """
+    Buffers resume uploads of authenticated requests in memory as they are
+    parsed, hashing and sniffing them on the way. ninja parses the body
+    synchronously on the event loop, so the handler never talks to S3; the
+    view stores the file from its sync helper, and skips unchanged
+    re-uploads entirely. Memory per request is bounded by MAX_FILE_SIZE and
+    nothing is spooled to disk. Other uploads pass through to the next handlers.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.profile_id = None
+        self.upload = None
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        match = RESUME_UPLOAD_PATH.search(self.request.path) if self.request is not None else None
+        # Authentication runs before the body is parsed; anonymous uploads are not buffered
+        if match and self.request.method == 'POST' and getattr(self.request, 'auth', None) is not None:
+            self.profile_id = int(match['profile_id'])
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        if self.profile_id is None or field_name != RESUME_UPLOAD_FIELD or self.upload is not None:
+            return
+
+        from profiles.api.schemas.resume import MAX_FILE_SIZE
+
+        self.upload = BufferedUpload(
+            key=generate_upload_s3_key(self.profile_id, file_name),
+            max_size=MAX_FILE_SIZE
+        )
+        logger.info(f"Buffering resume upload bound for S3: {self.upload.key}")
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.upload is None:
+            return raw_data
+        self.upload.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        if self.upload is None:
+            return None
+        if self.upload.too_large:
+            logger.warning(f"Resume upload exceeded {self.upload.max_size} bytes and was not kept: {self.upload.key}")
+
+        from profiles.models import Resume
+
+        storage = Resume._meta.get_field('file').storage
+        return S3UploadedFile.from_upload(
+            storage, self.upload, self.file_name, self.content_type, self.charset, self.content_type_extra
+        )
+
+    def upload_interrupted(self):
+        if self.upload is not None:
+            logger.warning(f"Resume upload interrupted: {self.upload.key}")
+            self.upload.clear()
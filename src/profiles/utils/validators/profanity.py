@@ -0,0 +1,116 @@
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+from better_profanity.utils import get_complete_path_of_file, read_wordlist
+from profiles.utils.search.aho_corasick import AhoCorasick
+
+# Characters that may stand in for a letter, as accepted by better_profanity
+LEET_CHAR_MAP = {
+    "a": ("a", "@", "*", "4"),
+    "i": ("i", "*", "l", "1"),
+    "o": ("o", "*", "0", "@"),
+    "u": ("u", "*", "v"),
+    "v": ("v", "*", "u"),
+    "l": ("l", "1"),
+    "e": ("e", "*", "3"),
+    "s": ("s", "$", "5"),
+    "t": ("t", "7"),
+}
+
+# Words are runs of letters, digits and the symbols used as letter substitutes
+_WORD = re.compile(r"(?:[^\W_]|[@$*'])+")
+# Separators a blocked phrase may be written with ("blow job", "f-u-c-k")
+_PHRASE_SEPARATORS = re.compile(r"[\s\-_.]+")
+
+
+def _fold_table(char_map: Dict[str, Tuple[str, ...]]) -> dict:
+    """
+    Translation table sending every character to one representative of the
+    characters that can substitute for each other, so all spellings of a
+    word fold to the same key
+    """
+    parent = {}
+
+    def find(char):
+        while parent.get(char, char) != char:
+            char = parent[char]
+        return char
+
+    for char, substitutes in char_map.items():
+        for substitute in substitutes:
+            root, other = find(char), find(substitute)
+            if root != other:
+                parent[max(root, other)] = min(root, other)
+    return str.maketrans({char: find(char) for char in parent})
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(unicodedata.normalize('NFKC', text).casefold())
+
+
+class ProfanityMatcher:
+    """
+    Word and phrase blocklist compiled into an Aho-Corasick automaton over
+    folded words. Matches whole words, their leetspeak spellings and phrases
+    whose words are joined or separated by spaces or punctuation, like
+    better_profanity, in one pass over the text regardless of list size.
+    """
+
+    def __init__(self, words: Iterable[str], char_map: Dict[str, Tuple[str, ...]] = LEET_CHAR_MAP):
+        self.char_map = char_map
+        self._fold = _fold_table(char_map)
+        self._automaton = AhoCorasick()
+        for word in set(words):
+            tokens = tokenize(word)
+            if not tokens or ''.join(tokens) != _PHRASE_SEPARATORS.sub('', word.casefold()):
+                # Spellings using other punctuation ("sh!t") would otherwise shrink to a fragment ("sh")
+                continue
+            self._add(tuple(tokens))
+            if len(tokens) > 1:
+                # "hand job" also matches "handjob"
+                self._add((''.join(tokens),))
+        self._automaton.compile()
+
+    def __len__(self):
+        return len(self._automaton)
+
+    def _add(self, tokens: Tuple[str, ...]) -> None:
+        self._automaton.add([token.translate(self._fold) for token in tokens], tokens)
+
+    def _spells(self, token: str, word: str) -> bool:
+        """Whether a text token is a spelling of a pattern word, substitutes included"""
+        return len(token) == len(word) and all(
+            char == expected or char in self.char_map.get(expected, ())
+            for char, expected in zip(token, word)
+        )
+
+    def find(self, text: str) -> Optional[str]:
+        """The first blocked word or phrase in the text, if any"""
+        tokens = tokenize(text)
+        # Folding merges substitutable characters, so confirm candidates exactly
+        for start, end, pattern in self._automaton.iter_matches([token.translate(self._fold) for token in tokens]):
+            if all(self._spells(token, word) for token, word in zip(tokens[start:end], pattern)):
+                return ' '.join(pattern)
+        return None
+
+    def contains_profanity(self, text: str) -> bool:
+        return self.find(text) is not None
+
+    def screen(self, texts: Iterable[str]) -> List[bool]:
+        """Check many texts against the compiled list, e.g. every name of a bulk import"""
+        return [self.find(text) is not None for text in texts]
+
+
+_matcher = None
+_matcher_lock = threading.Lock()
+
+
+def get_profanity_matcher() -> ProfanityMatcher:
+    """The process-wide matcher over better_profanity's word list, compiled on first use"""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                _matcher = ProfanityMatcher(read_wordlist(get_complete_path_of_file("profanity_wordlist.txt")))
+    return _matcher